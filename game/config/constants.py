@@ -1,4 +1,4 @@
-from game.utils.resources import asset_glob, asset_path
+from game.utils.resources import asset_glob, asset_path, user_cache_path
 
 
 SCREEN_WIDTH = 1280
@@ -11,6 +11,13 @@ MENU_BACKGROUND_OPACITY = 255
 LOADING_IMAGE_PATH = asset_path("images", "loading.png")
 LOADING_IMAGE_OPACITY = 255
 LOADING_MIN_DURATION_SECONDS = 2.5
+LOADING_BAR_WIDTH_RATIO = 0.4
+LOADING_BAR_HEIGHT_PX = 8
+LOADING_BAR_BOTTOM_MARGIN_PX = 48
+# Asset decoding and scaling threads behind the loading screen; the main
+# thread spends at most this long per loading frame converting results.
+ASSET_LOADER_WORKERS = 4
+ASSET_LOADER_PUMP_BUDGET_MS = 8
 GAME_OVER_BACKGROUND_IMAGE_PATH = asset_path("images", "game-over.png")
 GAME_OVER_BACKGROUND_OPACITY = 255
 GAME_BORDER_IMAGE_PATH = asset_path("images", "game-border.png")
@@ -19,6 +26,32 @@ GAME_VIEW_PADDING_X = 56
 GAME_VIEW_PADDING_Y = 36
 WINDOW_ICON_PATH = asset_path("sprites", "ship.png")
 
+SIMULATION_TICK_RATE = 60
+# Frame pacing for the interactive loop: "sleep", "precise", "vsync" or "uncapped".
+# "precise" spins for the last FRAME_PACING_SPIN_MS of every frame, so it is opt-in.
+FRAME_PACING_MODE = "sleep"
+FRAME_PACING_TARGET_FPS = 60
+# The precise limiter sleeps until this close to the deadline, then spins.
+FRAME_PACING_SPIN_MS = 2.0
+# In vsync mode, a safety cap this far above the refresh rate in case vsync is ignored.
+FRAME_PACING_VSYNC_CAP_RATIO = 1.1
+FRAME_PACING_STATS_WINDOW = 600
+SIMULATION_MAX_STEPS_PER_FRAME = 5
+REPLAY_KEYFRAME_INTERVAL_TICKS = 300
+
+# Dirty-rect rendering: redraw and push only the regions sprites touched,
+# falling back to a full flip once they cover this fraction of the game view.
+RENDER_DIRTY_RECTS_ENABLED = False
+RENDER_DIRTY_RECTS_MAX_AREA_RATIO = 0.35
+TEXT_CACHE_CAPACITY = 128
+# "software" (display surface blits) or the experimental "texture-present",
+# which only presents the software-drawn frame through a pygame._sdl2
+# renderer and is slower; its SDL render driver is SDL's pick when None.
+RENDER_BACKEND = "software"
+RENDER_TEXTURE_DRIVER = None
+# Draw and present on a render thread while the main thread simulates the next frame.
+RENDER_THREAD_ENABLED = False
+
 LINE_WIDTH = 2
 SHOT_RADIUS = 5
 SHOT_LIFETIME_SECONDS = 1.5
@@ -35,6 +68,8 @@ PLAYER_SPRITE_PATH = asset_path("sprites", "ship.png")
 PLAYER_SPRITE_SIZE_MULTIPLIER = 3.4
 PLAYER_INVULNERABLE_SPRITE_PATH = None
 PLAYER_INVULNERABLE_DURATION_SECONDS = 3
+# Angular resolution of the shared ship and missile rotation atlases.
+ROTATION_ATLAS_STEP_DEGREES = 1
 PLAYER_MAX_HEALTH = 3
 PLAYER_BUZZ_AMPLITUDE_PX = 1.4
 PLAYER_BUZZ_FREQUENCY_HZ = 9.0
@@ -46,6 +81,23 @@ ASTEROID_KINDS = 3
 ASTEROID_SPAWN_RATE_SECONDS = 0.8
 ASTEROID_MAX_RADIUS = ASTEROID_MIN_RADIUS * ASTEROID_KINDS
 
+# Spawn governor: throttle, then pause, asteroid spawning as measured
+# update+render time nears the budget or live entities near the ceiling.
+ASTEROID_GOVERNOR_FRAME_BUDGET_MS = 12.0
+ASTEROID_GOVERNOR_MAX_ENTITIES = 150
+ASTEROID_GOVERNOR_THROTTLE_RATIO = 0.8
+ASTEROID_GOVERNOR_THROTTLED_INTERVAL_SCALE = 2.0
+ASTEROID_GOVERNOR_SMOOTHING = 0.1
+
+COLLISION_GRID_CELL_SIZE = ASTEROID_MAX_RADIUS * 2
+
+ENTITY_STORE_ENABLED = False
+ENTITY_STORE_INITIAL_CAPACITY = 256
+
+SHOT_POOL_CAPACITY = 64
+ASTEROID_POOL_CAPACITY = 256
+EXPLOSION_POOL_CAPACITY = 64
+
 ASTEROID_SPRITE_GLOB = asset_glob("sprites/asteroid-*.png")
 ASTEROID_SPRITE_SCALE_TO_RADIUS = 2.1
 
@@ -53,3 +105,14 @@ EXPLOSION_GIF_PATH = asset_path("images", "explosion.gif")
 EXPLOSION_FPS = 28
 EXPLOSION_SCALE_TO_RADIUS = 2.8
 EXPLOSION_FALLBACK_DURATION_SECONDS = 0.42
+# The fallback burst is pre-rendered per radius bucket and spark pattern.
+EXPLOSION_FALLBACK_RADIUS_STEP = 5
+EXPLOSION_SPARK_PATTERNS = 4
+EXPLOSION_SPARK_COUNT = 16
+
+# Pre-scaled asteroid variants and explosion frames (see `scripts/bake_assets.py`).
+ASSET_CACHE_ENABLED = True
+# Baked at build time and bundled with the game; only ever read at runtime.
+ASSET_CACHE_PATH = asset_path(".cache", "baked-assets.bin")
+# Where the game writes a cache it rebuilt because the bundled one was missing or stale.
+ASSET_CACHE_USER_PATH = user_cache_path("baked-assets.bin")
@@ -1,5 +1,6 @@
 import pygame
 from game.config.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from game.core.timestep import lerp_wrapped
 
 
 class CircleShape(pygame.sprite.Sprite):
@@ -12,6 +13,8 @@ class CircleShape(pygame.sprite.Sprite):
         self.position = pygame.Vector2(x, y)
         self.velocity = pygame.Vector2(0, 0)
         self.radius = radius
+        self.previous_position = pygame.Vector2(x, y)
+        self._simulated_position = None
 
     def draw(self, screen):
         # must override
@@ -21,6 +24,20 @@ class CircleShape(pygame.sprite.Sprite):
         # must override
         pass
 
+    def store_previous_state(self):
+        """Remember the state at the start of a simulation tick for interpolation."""
+        self.previous_position.update(self.position)
+
+    def begin_interpolation(self, alpha):
+        self._simulated_position = self.position
+        self.position = pygame.Vector2(
+            lerp_wrapped(self.previous_position, self.position, alpha)
+        )
+
+    def end_interpolation(self):
+        self.position = self._simulated_position
+        self._simulated_position = None
+
     def collides_with(self, other):
         distance = self.position.distance_to(other.position)
         return (self.radius + other.radius) >= distance
@@ -0,0 +1,112 @@
+import numpy as np
+from game.config.constants import ENTITY_STORE_INITIAL_CAPACITY, SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+class EntityStore:
+    """Struct-of-arrays storage for one kind of circular entity.
+
+    Every component lives in its own typed column indexed by slot, so systems
+    can update all live entities with a handful of NumPy operations instead of
+    one Python method call per sprite. Spawning pops a free slot and killing
+    pushes it back, both O(1); the columns only grow (doubling) when every
+    slot is in use.
+
+    `payload` is an object column for per-entity data that does not vectorise,
+    such as an asteroid's texture or an explosion's frames.
+    """
+
+    COLUMNS = ("position", "previous_position", "velocity", "radius", "age", "lifetime", "alive")
+    _half_extent = np.array([SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2])
+
+    def __init__(self, capacity=ENTITY_STORE_INITIAL_CAPACITY):
+        capacity = max(1, int(capacity))
+        self.capacity = capacity
+        self.position = np.zeros((capacity, 2), dtype=np.float64)
+        self.previous_position = np.zeros((capacity, 2), dtype=np.float64)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float64)
+        self.radius = np.zeros(capacity, dtype=np.float64)
+        self.age = np.zeros(capacity, dtype=np.float64)
+        self.lifetime = np.full(capacity, np.inf, dtype=np.float64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.payload = [None] * capacity
+        self._free = list(range(capacity - 1, -1, -1))
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, x, y, radius, velocity=(0.0, 0.0), lifetime=np.inf, payload=None):
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        self.position[slot] = (x, y)
+        self.previous_position[slot] = (x, y)
+        self.velocity[slot] = velocity
+        self.radius[slot] = radius
+        self.age[slot] = 0.0
+        self.lifetime[slot] = lifetime
+        self.alive[slot] = True
+        self.payload[slot] = payload
+        self.count += 1
+        return slot
+
+    def kill(self, slot):
+        if not self.alive[slot]:
+            return
+        self.alive[slot] = False
+        self.velocity[slot] = (0.0, 0.0)
+        self.payload[slot] = None
+        self._free.append(slot)
+        self.count -= 1
+
+    def kill_many(self, slots):
+        for slot in slots.tolist():
+            self.kill(slot)
+
+    def store_previous_state(self):
+        np.copyto(self.previous_position, self.position)
+
+    def interpolated_positions(self, alpha):
+        """Blend previous and current positions, snapping entities that wrapped."""
+        delta = self.position - self.previous_position
+        wrapped = np.abs(delta) > self._half_extent
+        blended = self.previous_position + delta * alpha
+        blended[wrapped] = self.position[wrapped]
+        return blended
+
+    def snapshot(self):
+        """Copy every column plus the free list; payloads are left to the owner."""
+        return {
+            "columns": {name: getattr(self, name).copy() for name in self.COLUMNS},
+            "free": list(self._free),
+            "count": self.count,
+        }
+
+    def restore(self, state):
+        for name in self.COLUMNS:
+            setattr(self, name, state["columns"][name].copy())
+        self.capacity = len(self.alive)
+        self.payload = [None] * self.capacity
+        self._free = list(state["free"])
+        self.count = state["count"]
+
+    def live_slots(self):
+        return np.flatnonzero(self.alive)
+
+    def clear(self):
+        for slot in self.live_slots().tolist():
+            self.kill(slot)
+
+    def _grow(self):
+        old = self.capacity
+        new = old * 2
+        self.position = np.concatenate((self.position, np.zeros((old, 2))))
+        self.previous_position = np.concatenate((self.previous_position, np.zeros((old, 2))))
+        self.velocity = np.concatenate((self.velocity, np.zeros((old, 2))))
+        self.radius = np.concatenate((self.radius, np.zeros(old)))
+        self.age = np.concatenate((self.age, np.zeros(old)))
+        self.lifetime = np.concatenate((self.lifetime, np.full(old, np.inf)))
+        self.alive = np.concatenate((self.alive, np.zeros(old, dtype=bool)))
+        self.payload.extend([None] * old)
+        self._free.extend(range(new - 1, old - 1, -1))
+        self.capacity = new
@@ -0,0 +1,57 @@
+import pygame
+
+# Keys the simulation reads; each maps to one bit of an input mask.
+PLAYER_KEYS = (pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d, pygame.K_SPACE)
+_KEY_BITS = {key: 1 << index for index, key in enumerate(PLAYER_KEYS)}
+
+
+class InputFrame:
+    """Player controls for one tick, indexable like `pygame.key.get_pressed()`."""
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask=0):
+        self.mask = mask
+
+    @classmethod
+    def from_pressed(cls, pressed):
+        mask = 0
+        for key, bit in _KEY_BITS.items():
+            if pressed[key]:
+                mask |= bit
+        return cls(mask)
+
+    def __getitem__(self, key):
+        bit = _KEY_BITS.get(key)
+        return bit is not None and bool(self.mask & bit)
+
+
+class LiveInput:
+    def read(self):
+        return InputFrame.from_pressed(pygame.key.get_pressed())
+
+
+class InputRecorder:
+    """Passes reads through from `source` and keeps one mask byte per tick."""
+
+    def __init__(self, source=None):
+        self.source = source if source is not None else LiveInput()
+        self.masks = bytearray()
+
+    def read(self):
+        frame = self.source.read()
+        self.masks.append(frame.mask)
+        return frame
+
+
+class ScriptedInput:
+    """Replays recorded masks; reads past the end return no keys pressed."""
+
+    def __init__(self, masks, position=0):
+        self.masks = bytes(masks)
+        self.position = position
+
+    def read(self):
+        mask = self.masks[self.position] if self.position < len(self.masks) else 0
+        self.position += 1
+        return InputFrame(mask)
@@ -0,0 +1,110 @@
+"""Frame pacing: how the interactive loop waits between frames.
+
+`FramePacer.tick()` is a drop-in for `pygame.time.Clock.tick()`: it waits
+according to the pacing mode and returns the milliseconds since the previous
+tick. Every interval is recorded so modes can be compared by their p50, p95
+and p99 frame times.
+
+- `sleep`: `Clock.tick`'s coarse sleep, the default.
+- `precise`: sleep until shortly before the deadline, then spin. Deadlines
+  advance by whole periods, so one slow frame does not shift the schedule.
+  The spin keeps a core busy, so this is opt-in.
+- `vsync`: presentation blocks on the display; the precise limiter stays
+  on slightly above the refresh rate in case vsync is not honoured.
+- `uncapped`: no waiting at all, to measure the loop's throughput ceiling.
+"""
+
+import time
+from collections import deque
+
+import numpy as np
+import pygame
+from game.config.constants import (
+    FRAME_PACING_MODE,
+    FRAME_PACING_SPIN_MS,
+    FRAME_PACING_STATS_WINDOW,
+    FRAME_PACING_TARGET_FPS,
+    FRAME_PACING_VSYNC_CAP_RATIO,
+)
+
+SLEEP = "sleep"
+PRECISE = "precise"
+VSYNC = "vsync"
+UNCAPPED = "uncapped"
+PACING_MODES = (SLEEP, PRECISE, VSYNC, UNCAPPED)
+
+
+class FramePacer:
+    def __init__(
+        self,
+        mode=FRAME_PACING_MODE,
+        target_fps=FRAME_PACING_TARGET_FPS,
+        spin_ms=FRAME_PACING_SPIN_MS,
+        window=FRAME_PACING_STATS_WINDOW,
+        clock=time.perf_counter,
+        sleep=time.sleep,
+    ):
+        if mode not in PACING_MODES:
+            raise ValueError(f"unknown frame pacing mode '{mode}'")
+        self.mode = mode
+        self.target_fps = max(1, target_fps)
+        self.spin_seconds = max(0.0, spin_ms / 1000.0)
+        self.intervals = deque(maxlen=max(1, int(window)))
+        self._clock = clock
+        self._sleep = sleep
+        self._pygame_clock = pygame.time.Clock() if mode == SLEEP else None
+        self._last = None
+        self._deadline = None
+
+    def tick(self, framerate=None):
+        """Wait for the next frame and return milliseconds since the previous tick.
+
+        `framerate` overrides the target for this frame, like `Clock.tick`.
+        """
+        target = framerate or self.target_fps
+        if self.mode == SLEEP:
+            self._pygame_clock.tick(target)
+        elif self.mode == PRECISE:
+            self._wait(1.0 / target)
+        elif self.mode == VSYNC:
+            self._wait(1.0 / (target * FRAME_PACING_VSYNC_CAP_RATIO))
+
+        now = self._clock()
+        elapsed = 0.0 if self._last is None else now - self._last
+        self._last = now
+        if elapsed > 0.0:
+            self.intervals.append(elapsed)
+        return elapsed * 1000.0
+
+    def _wait(self, period):
+        now = self._clock()
+        if self._deadline is None or now - self._deadline > period:
+            # First frame, or too far behind to catch up: restart the schedule.
+            self._deadline = now + period
+        else:
+            self._deadline += period
+        remaining = self._deadline - now
+        if remaining > self.spin_seconds:
+            self._sleep(remaining - self.spin_seconds)
+        while self._clock() < self._deadline:
+            pass
+
+    def reset_stats(self):
+        self.intervals.clear()
+
+    def stats(self):
+        """Return frame-interval percentiles (ms) over the recent window."""
+        stats = {"mode": self.mode, "target_fps": self.target_fps, "frames": len(self.intervals)}
+        if not self.intervals:
+            return stats
+        intervals_ms = np.fromiter(self.intervals, dtype=np.float64) * 1000.0
+        p50, p95, p99 = np.percentile(intervals_ms, (50, 95, 99))
+        stats.update(
+            mean_ms=float(intervals_ms.mean()),
+            p50_ms=float(p50),
+            p95_ms=float(p95),
+            p99_ms=float(p99),
+            max_ms=float(intervals_ms.max()),
+            fps=float(1000.0 / intervals_ms.mean()),
+        )
+        return stats
@@ -0,0 +1,83 @@
+_POOLS = {}
+
+
+class ObjectPool:
+    """Free list of reusable entities with hit/miss and high-water statistics.
+
+    `acquire(*args)` hands back a released object after calling its
+    `reset(*args)`, or builds a new one with `factory(*args)` when the free
+    list is empty. Objects built directly with their constructor are never
+    taken into the pool. At most `capacity` released objects are kept; the rest are
+    left to the garbage collector. Pools are module-level and outlive game
+    sessions, so a new session starts with a warm free list.
+    """
+
+    def __init__(self, name, factory, capacity):
+        self.name = name
+        self.factory = factory
+        self.capacity = max(0, int(capacity))
+        self._free = []
+        self.hits = 0
+        self.misses = 0
+        self.discarded = 0
+        self.live = 0
+        self.high_water = 0
+        _POOLS[name] = self
+
+    def acquire(self, *args):
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args)
+            self.hits += 1
+        else:
+            obj = self.factory(*args)
+            self.misses += 1
+        obj._pooled = False
+        self.live += 1
+        self.high_water = max(self.high_water, self.live)
+        return obj
+
+    def release(self, obj):
+        # Only objects handed out by `acquire` come back; repeat kills are no-ops.
+        if getattr(obj, "_pooled", True):
+            return
+        obj._pooled = True
+        self.live = max(0, self.live - 1)
+        if len(self._free) < self.capacity:
+            self._free.append(obj)
+        else:
+            self.discarded += 1
+
+    def stats(self):
+        requests = self.hits + self.misses
+        return {
+            "capacity": self.capacity,
+            "free": len(self._free),
+            "live": self.live,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+            "high_water": self.high_water,
+            "discarded": self.discarded,
+        }
+
+
+def pool_stats():
+    return {name: pool.stats() for name, pool in _POOLS.items()}
+
+
+class Poolable:
+    """Sprite mixin: `spawn()` draws from the class `pool`, `kill()` returns to it."""
+
+    pool = None
+
+    @classmethod
+    def spawn(cls, *args):
+        if cls.pool is None:
+            return cls(*args)
+        return cls.pool.acquire(*args)
+
+    def kill(self):
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
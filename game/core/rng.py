@@ -0,0 +1,63 @@
+"""Named random streams, one per gameplay subsystem.
+
+Each subsystem draws from its own `random.Random`, derived from a single root
+seed and the stream name. Extra draws in one subsystem (say, a new explosion
+effect) therefore never shift the sequence another subsystem sees, and a
+whole session can be reproduced from its seed. With no seed every stream is
+seeded from OS entropy, like the global `random` module; a session that is
+recorded without a seed draws one with `draw_seed()` so its replay has one.
+"""
+
+import hashlib
+import random
+
+ASTEROID_FIELD = "asteroid_field"
+ASTEROID_SPLIT = "asteroid_split"
+ASTEROID_TEXTURE = "asteroid_texture"
+EXPLOSION = "explosion"
+PLAYER = "player"
+
+_root_seed = None
+_streams = {}
+
+
+def seed_streams(seed):
+    """Reset every stream; `None` means non-deterministic."""
+    global _root_seed
+    _root_seed = seed
+    _streams.clear()
+
+
+def draw_seed():
+    """Return a fresh random root seed from OS entropy."""
+    return random.SystemRandom().getrandbits(63)
+
+
+def root_seed():
+    return _root_seed
+
+
+def stream(name):
+    rng = _streams.get(name)
+    if rng is None:
+        rng = random.Random(_derive_seed(name)) if _root_seed is not None else random.Random()
+        _streams[name] = rng
+    return rng
+
+
+def get_state():
+    return {
+        "seed": _root_seed,
+        "streams": {name: rng.getstate() for name, rng in _streams.items()},
+    }
+
+
+def set_state(state):
+    seed_streams(state["seed"])
+    for name, rng_state in state["streams"].items():
+        stream(name).setstate(rng_state)
+
+
+def _derive_seed(name):
+    digest = hashlib.sha256(f"{_root_seed}:{name}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
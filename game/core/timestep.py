@@ -0,0 +1,74 @@
+from contextlib import contextmanager
+from game.config.constants import (
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    SIMULATION_MAX_STEPS_PER_FRAME,
+    SIMULATION_TICK_RATE,
+)
+
+
+class FixedTimestep:
+    """Accumulator that turns variable frame times into fixed simulation ticks.
+
+    `advance(frame_dt)` returns how many ticks of `step_dt` to simulate this
+    frame. At most `max_steps` run per frame; any backlog beyond that (a long
+    loading hitch, a window drag) is dropped instead of being replayed, which
+    avoids the "spiral of death" where catching up costs more than a frame.
+    After stepping, `alpha` is how far the render time sits between the last
+    two simulation states.
+    """
+
+    def __init__(self, tick_rate=SIMULATION_TICK_RATE, max_steps=SIMULATION_MAX_STEPS_PER_FRAME):
+        self.tick_rate = max(1, tick_rate)
+        self.step_dt = 1.0 / self.tick_rate
+        self.max_steps = max(1, int(max_steps))
+        self.accumulator = 0.0
+        self.dropped_seconds = 0.0
+
+    def reset(self):
+        self.accumulator = 0.0
+
+    def advance(self, frame_dt):
+        self.accumulator += max(0.0, frame_dt)
+        steps = int(self.accumulator / self.step_dt)
+        if steps > self.max_steps:
+            self.dropped_seconds += (steps - self.max_steps) * self.step_dt
+            steps = self.max_steps
+            self.accumulator = self.accumulator % self.step_dt
+        else:
+            self.accumulator -= steps * self.step_dt
+        return steps
+
+    @property
+    def alpha(self):
+        return min(1.0, self.accumulator / self.step_dt)
+
+
+def lerp_wrapped(previous, current, alpha):
+    """Blend two coordinates, snapping to `current` across a screen wrap."""
+    x = _lerp_axis(previous[0], current[0], alpha, SCREEN_WIDTH)
+    y = _lerp_axis(previous[1], current[1], alpha, SCREEN_HEIGHT)
+    return x, y
+
+
+def _lerp_axis(previous, current, alpha, extent):
+    if abs(current - previous) > extent / 2:
+        return current
+    return previous + (current - previous) * alpha
+
+
+@contextmanager
+def interpolated(drawables, alpha):
+    """Temporarily move every drawable to its interpolated render state.
+
+    Items opt in by providing `begin_interpolation(alpha)` and
+    `end_interpolation()`; anything else is drawn at its current state.
+    """
+    active = [item for item in drawables if hasattr(item, "begin_interpolation")]
+    for item in active:
+        item.begin_interpolation(alpha)
+    try:
+        yield
+    finally:
+        for item in active:
+            item.end_interpolation()
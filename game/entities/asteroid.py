@@ -1,28 +1,61 @@
-import pygame
-import random
+from game.core import rng
 from game.core.circleshape import CircleShape
-from game.render.asteroid_texture import build_asteroid_texture
+from game.core.pool import ObjectPool, Poolable
+from game.render.queue import LAYER_ASTEROIDS
+from game.render.asteroid_texture import (
+    asteroid_texture,
+    asteroid_texture_handles,
+    asteroid_texture_variant,
+    pick_asteroid_texture,
+)
 from game.config.constants import (
     ASTEROID_MIN_RADIUS,
+    ASTEROID_POOL_CAPACITY,
 )
 from game.utils.logger import log_event
 
 
-class Asteroid(CircleShape):
+class Asteroid(Poolable, CircleShape):
     def __init__(self, x, y, radius):
         super().__init__(x, y, radius)
-        self.__texture = None
-        self.__texture_offset = pygame.Vector2(0, 0)
+        self.texture_handle = pick_asteroid_texture(radius, rng.stream(rng.ASTEROID_TEXTURE))
 
-        self.__texture, self.__texture_offset = build_asteroid_texture(
-            self.radius,
-            seed=random.randint(0, 1_000_000_000),
-        )
+    def reset(self, x, y, radius):
+        """Reinitialise a pooled asteroid as if freshly constructed."""
+        if hasattr(self, "containers"):
+            self.add(self.containers)
+        self.position.update(x, y)
+        self.previous_position.update(x, y)
+        self.velocity.update(0, 0)
+        self.radius = radius
+        self.texture_handle = pick_asteroid_texture(radius, rng.stream(rng.ASTEROID_TEXTURE))
+
+    def snapshot(self):
+        return {
+            "position": tuple(self.position),
+            "velocity": tuple(self.velocity),
+            "radius": self.radius,
+            "texture_variant": asteroid_texture_variant(self.radius, self.texture_handle),
+        }
+
+    def restore(self, state):
+        self.position.update(state["position"])
+        self.previous_position.update(state["position"])
+        self.velocity.update(state["velocity"])
+        self.radius = state["radius"]
+        self.texture_handle = asteroid_texture_handles(self.radius)[state["texture_variant"]]
 
     def draw(self, screen):
-        if self.__texture:
-            texture_pos = self.position + self.__texture_offset
-            screen.blit(self.__texture, (int(texture_pos.x), int(texture_pos.y)))
+        texture, offset = asteroid_texture(self.texture_handle)
+        screen.blit(texture, (int(self.position.x + offset.x), int(self.position.y + offset.y)))
+
+    def enqueue(self, queue):
+        texture, offset = asteroid_texture(self.texture_handle)
+        queue.submit(
+            LAYER_ASTEROIDS,
+            texture,
+            (int(self.position.x + offset.x), int(self.position.y + offset.y)),
+        )
 
     def update(self, dt):
         self.position += self.velocity * dt
@@ -33,11 +66,16 @@ class Asteroid(CircleShape):
         if self.radius <= ASTEROID_MIN_RADIUS:
             return
         log_event("asteroid_split")
-        angle = random.uniform(20, 50)
+        angle = rng.stream(rng.ASTEROID_SPLIT).uniform(20, 50)
         velocity1 = self.velocity.rotate(angle)
         velocity2 = self.velocity.rotate(angle * -1)
         radius = self.radius - ASTEROID_MIN_RADIUS
-        asteroid1 = Asteroid(self.position[0], self.position[1], radius)
-        asteroid2 = Asteroid(self.position[0], self.position[1], radius)
+        # kill() returned this asteroid to the pool, so a child may reuse it; read first.
+        x, y = self.position
+        asteroid1 = Asteroid.spawn(x, y, radius)
+        asteroid2 = Asteroid.spawn(x, y, radius)
         asteroid1.velocity = velocity1 * 1.2
         asteroid2.velocity = velocity2 * 1.2
+
+
+Asteroid.pool = ObjectPool("asteroids", Asteroid, ASTEROID_POOL_CAPACITY)
@@ -1,19 +1,31 @@
 import math
 import os
 import random
+from functools import partial
+
 import pygame
+from game.core import rng
+from game.core.pool import ObjectPool, Poolable
+from game.render.asset_cache import baked_frames
+from game.render.queue import LAYER_EXPLOSIONS
 from game.config.constants import (
     EXPLOSION_GIF_PATH,
     EXPLOSION_FPS,
     EXPLOSION_SCALE_TO_RADIUS,
     EXPLOSION_FALLBACK_DURATION_SECONDS,
+    EXPLOSION_FALLBACK_RADIUS_STEP,
+    EXPLOSION_POOL_CAPACITY,
+    EXPLOSION_SPARK_COUNT,
+    EXPLOSION_SPARK_PATTERNS,
 )
 
 
-class Explosion(pygame.sprite.Sprite):
+class Explosion(Poolable, pygame.sprite.Sprite):
     _base_gif_frames = None
     _gif_load_attempted = False
     _scaled_frame_cache = {}
+    _fallback_frame_cache = {}
+    _spark_patterns = None
 
     def __init__(self, x, y, radius):
         if hasattr(self, "containers"):
@@ -24,25 +36,39 @@ class Explosion(pygame.sprite.Sprite):
         self.position = pygame.Vector2(x, y)
         self.radius = radius
         self.elapsed = 0.0
-        self._spark_data = self._build_sparks()
+        self.spark_pattern = self.pick_spark_pattern()
+        self.frames, self.duration = self.frames_for_radius(radius, self.spark_pattern)
+
+    def reset(self, x, y, radius):
+        """Reinitialise a pooled explosion as if freshly constructed."""
+        if hasattr(self, "containers"):
+            self.add(self.containers)
+        self.position.update(x, y)
+        self.radius = radius
+        self.elapsed = 0.0
+        self.spark_pattern = self.pick_spark_pattern()
+        self.frames, self.duration = self.frames_for_radius(radius, self.spark_pattern)
 
-        frames = self._get_scaled_gif_frames(radius)
+    @classmethod
+    def frames_for_radius(cls, radius, spark_pattern=0):
+        """Return `(frames, duration)`, using the pre-rendered fallback burst without the GIF."""
+        frames = cls._get_scaled_gif_frames(radius)
         if frames:
-            self.frames = frames
-            self.duration = len(frames) / max(1, EXPLOSION_FPS)
-        else:
-            self.frames = None
-            self.duration = EXPLOSION_FALLBACK_DURATION_SECONDS
+            return frames, len(frames) / max(1, EXPLOSION_FPS)
+        return cls._get_fallback_frames(radius, spark_pattern), EXPLOSION_FALLBACK_DURATION_SECONDS
 
     @classmethod
     def _load_gif_frames(cls):
-        if cls._gif_load_attempted:
-            return cls._base_gif_frames
+        if not cls._gif_load_attempted:
+            cls._install_gif_frames(cls._decode_gif_frames())
+        return cls._base_gif_frames
 
-        cls._gif_load_attempted = True
-        cls._base_gif_frames = []
+    @staticmethod
+    def _decode_gif_frames():
+        """Decode the GIF into unconverted RGBA surfaces; empty without the GIF or Pillow."""
+        frames = []
         if not os.path.exists(EXPLOSION_GIF_PATH):
-            return cls._base_gif_frames
+            return frames
         try:
             from PIL import Image, ImageSequence
 
@@ -51,16 +77,19 @@ class Explosion(pygame.sprite.Sprite):
                 rgba = frame.convert("RGBA")
                 width, height = rgba.size
                 data = rgba.tobytes()
-                surface = pygame.image.fromstring(data, (width, height), "RGBA").convert_alpha()
-                cls._base_gif_frames.append(surface)
+                frames.append(pygame.image.fromstring(data, (width, height), "RGBA"))
         except Exception as err:
             print(
                 f"Warning: explosion GIF not available at '{EXPLOSION_GIF_PATH}' "
                 f"(or Pillow missing): {err}"
             )
-            cls._base_gif_frames = []
+            return []
+        return frames
 
-        return cls._base_gif_frames
+    @classmethod
+    def _install_gif_frames(cls, frames):
+        cls._gif_load_attempted = True
+        cls._base_gif_frames = [frame.convert_alpha() for frame in frames]
 
     @classmethod
     def prewarm(cls, radii=None):
@@ -68,21 +97,114 @@ class Explosion(pygame.sprite.Sprite):
         if radii is None:
             radii = []
 
-        cls._load_gif_frames()
-        if cls._base_gif_frames:
+        for radius in radii:
+            if cls._get_scaled_gif_frames(radius) is None:
+                for spark_pattern in range(EXPLOSION_SPARK_PATTERNS):
+                    cls._get_fallback_frames(radius, spark_pattern)
+
+    @classmethod
+    def submit_prewarm(cls, loader, radii):
+        """Like `prewarm`, but decoding, scaling and drawing run on `loader`'s workers."""
+        baked_gif = all(
+            baked_frames(f"explosion@{cls._target_longest(radius)}") is not None
+            for radius in radii
+        )
+        if cls._gif_load_attempted or baked_gif:
+            cls.prewarm(radii)
+            return
+        if os.path.exists(EXPLOSION_GIF_PATH):
+            loader.submit(
+                "explosion gif",
+                partial(cls._decode_scaled_gif_frames, radii),
+                partial(cls._install_scaled_gif_frames, radii),
+            )
+            return
+
+        cls._get_spark_patterns()
+        buckets = sorted({cls._fallback_bucket(radius) for radius in radii})
+        for bucket in buckets:
+            for spark_pattern in range(EXPLOSION_SPARK_PATTERNS):
+                if (bucket, spark_pattern) in cls._fallback_frame_cache:
+                    continue
+                if baked_frames(f"explosion-fallback@{bucket}/{spark_pattern}") is not None:
+                    cls._get_fallback_frames(bucket, spark_pattern)
+                    continue
+                loader.submit(
+                    f"explosion burst {bucket}/{spark_pattern}",
+                    partial(cls._draw_fallback_frames, bucket, spark_pattern),
+                    partial(cls._install_fallback_frames, bucket, spark_pattern),
+                )
+
+    @classmethod
+    def _decode_scaled_gif_frames(cls, radii):
+        base_frames = cls._decode_gif_frames()
+        scaled = {}
+        if base_frames:
             for radius in radii:
-                cls._get_scaled_gif_frames(radius)
+                target_longest = cls._target_longest(radius)
+                scaled[target_longest] = cls._scale_gif_frames(base_frames, target_longest)
+        return base_frames, scaled
+
+    @classmethod
+    def _install_scaled_gif_frames(cls, radii, result):
+        base_frames, scaled = result
+        cls._install_gif_frames(base_frames)
+        for target_longest, frames in scaled.items():
+            cls._scaled_frame_cache.setdefault(
+                target_longest, [frame.convert_alpha() for frame in frames]
+            )
+        # Without usable GIF frames, this draws the fallback bursts here instead.
+        cls.prewarm(radii)
+
+    @classmethod
+    def _install_fallback_frames(cls, bucket, spark_pattern, frames):
+        cls._fallback_frame_cache.setdefault(
+            (bucket, spark_pattern), cls._display_format(frames)
+        )
+
+    @classmethod
+    def warm_frame_groups(cls):
+        """Return the frames built so far as asset cache groups.
+
+        Scaled GIF frames go under `explosion@<target>`, fallback bursts under
+        `explosion-fallback@<bucket>/<pattern>`.
+        """
+        groups = {
+            f"explosion@{target_longest}": [(frame, None) for frame in frames]
+            for target_longest, frames in cls._scaled_frame_cache.items()
+        }
+        for (bucket, spark_pattern), frames in cls._fallback_frame_cache.items():
+            groups[f"explosion-fallback@{bucket}/{spark_pattern}"] = [
+                (frame, None) for frame in frames
+            ]
+        return groups
+
+    @staticmethod
+    def _target_longest(radius):
+        return max(2, int(round(radius * EXPLOSION_SCALE_TO_RADIUS)))
 
     @classmethod
     def _get_scaled_gif_frames(cls, radius):
+        target_longest = cls._target_longest(radius)
+        if target_longest in cls._scaled_frame_cache:
+            return cls._scaled_frame_cache[target_longest]
+
+        baked = baked_frames(f"explosion@{target_longest}")
+        if baked is not None:
+            frames = [frame for frame, _ in baked]
+            cls._scaled_frame_cache[target_longest] = frames
+            return frames
+
         base_frames = cls._load_gif_frames()
         if not base_frames:
             return None
 
-        target_longest = max(2, int(round(radius * EXPLOSION_SCALE_TO_RADIUS)))
-        if target_longest in cls._scaled_frame_cache:
-            return cls._scaled_frame_cache[target_longest]
+        scaled_frames = cls._scale_gif_frames(base_frames, target_longest)
+        cls._scaled_frame_cache[target_longest] = scaled_frames
+        return scaled_frames
 
+    @staticmethod
+    def _scale_gif_frames(base_frames, target_longest):
         scaled_frames = []
         base_longest = max(base_frames[0].get_width(), base_frames[0].get_height())
         scale = target_longest / max(1, base_longest)
@@ -92,66 +214,139 @@ class Explosion(pygame.sprite.Sprite):
                 max(1, int(round(frame.get_height() * scale))),
             )
             scaled_frames.append(pygame.transform.smoothscale(frame, scaled_size))
-
-        cls._scaled_frame_cache[target_longest] = scaled_frames
         return scaled_frames
 
-    def _build_sparks(self):
-        sparks = []
-        count = 16
-        for _ in range(count):
-            angle = random.uniform(0.0, math.pi * 2.0)
-            speed = random.uniform(0.55, 1.15)
-            seed = random.uniform(0.0, math.pi * 2.0)
-            sparks.append((pygame.Vector2(math.cos(angle), math.sin(angle)), speed, seed))
-        return sparks
+    @staticmethod
+    def _fallback_bucket(radius):
+        step = EXPLOSION_FALLBACK_RADIUS_STEP
+        return max(step, int(round(radius / step)) * step)
 
-    def draw(self, screen):
-        if self.frames:
-            frame_index = min(len(self.frames) - 1, int(self.elapsed * EXPLOSION_FPS))
-            frame = self.frames[frame_index]
-            rect = frame.get_rect(center=(self.position.x, self.position.y))
-            screen.blit(frame, rect.topleft)
-            return
+    @classmethod
+    def _get_fallback_frames(cls, radius, spark_pattern):
+        """Return the fallback burst for `radius` as frames, quantised to a radius bucket."""
+        bucket = cls._fallback_bucket(radius)
+        cache_key = (bucket, spark_pattern)
+        frames = cls._fallback_frame_cache.get(cache_key)
+        if frames is None:
+            baked = baked_frames(f"explosion-fallback@{bucket}/{spark_pattern}")
+            if baked is not None:
+                frames = [frame for frame, _ in baked]
+                cls._fallback_frame_cache[cache_key] = frames
+                return frames
+            frames = cls._display_format(cls._draw_fallback_frames(bucket, spark_pattern))
+            cls._fallback_frame_cache[cache_key] = frames
+        return frames
+
+    @classmethod
+    def _draw_fallback_frames(cls, bucket, spark_pattern):
+        sparks = cls._get_spark_patterns()[spark_pattern]
+        frame_count = max(1, int(round(EXPLOSION_FALLBACK_DURATION_SECONDS * EXPLOSION_FPS)))
+        return [
+            cls._render_fallback_frame(bucket, index / frame_count, sparks)
+            for index in range(frame_count)
+        ]
+
+    @staticmethod
+    def _display_format(frames):
+        if pygame.display.get_surface() is None:
+            return frames
+        return [frame.convert_alpha() for frame in frames]
 
-        # Fallback: layered radial burst + sparks.
-        t = min(1.0, self.elapsed / max(1e-6, self.duration))
-        center = (int(self.position.x), int(self.position.y))
-        outer_radius = int(self.radius * (0.6 + 1.9 * t))
-        inner_radius = int(self.radius * max(0.0, 0.55 - 0.45 * t))
+    @classmethod
+    def _get_spark_patterns(cls):
+        """Build the fixed set of spark layouts explosions choose from.
+
+        The layouts come from a constant seed rather than the session's
+        streams, so every run shares the same pre-rendered frames.
+        """
+        if cls._spark_patterns is None:
+            pattern_rng = random.Random("explosion-sparks")
+            cls._spark_patterns = []
+            for _ in range(EXPLOSION_SPARK_PATTERNS):
+                sparks = []
+                for _ in range(EXPLOSION_SPARK_COUNT):
+                    angle = pattern_rng.uniform(0.0, math.pi * 2.0)
+                    speed = pattern_rng.uniform(0.55, 1.15)
+                    seed = pattern_rng.uniform(0.0, math.pi * 2.0)
+                    sparks.append((pygame.Vector2(math.cos(angle), math.sin(angle)), speed, seed))
+                cls._spark_patterns.append(sparks)
+        return cls._spark_patterns
+
+    @staticmethod
+    def _render_fallback_frame(radius, t, sparks):
+        """Draw one frame of the layered radial burst + sparks at progress `t`."""
+        outer_radius = int(radius * (0.6 + 1.9 * t))
+        inner_radius = int(radius * max(0.0, 0.55 - 0.45 * t))
         ring_width = max(1, int(5 * (1.0 - t)))
 
         glow = pygame.Surface((outer_radius * 2 + 8, outer_radius * 2 + 8), pygame.SRCALPHA)
-        glow_center = (glow.get_width() // 2, glow.get_height() // 2)
+        glow_center = pygame.Vector2(glow.get_width() // 2, glow.get_height() // 2)
         ring_color = (255, int(210 - 110 * t), int(80 - 60 * t), int(210 * (1.0 - t)))
         core_color = (255, int(180 - 140 * t), int(70 - 65 * t), int(150 * (1.0 - t)))
         pygame.draw.circle(glow, ring_color, glow_center, outer_radius, ring_width)
         if inner_radius > 0:
             pygame.draw.circle(glow, core_color, glow_center, inner_radius)
 
-        for direction, speed, seed in self._spark_data:
+        spark_color = (255, int(200 - 120 * t), int(90 - 70 * t))
+        for direction, speed, seed in sparks:
             jitter = math.sin((t * 18.0) + seed) * 0.15
-            travel = self.radius * (0.35 + (1.5 * t * speed))
-            start = self.position + direction * (self.radius * (0.18 + t * 0.4))
+            travel = radius * (0.35 + (1.5 * t * speed))
+            start = glow_center + direction * (radius * (0.18 + t * 0.4))
             end = start + direction.rotate(jitter * 35.0) * travel * 0.24
-            spark_color = (255, int(200 - 120 * t), int(90 - 70 * t))
             pygame.draw.line(
                 glow,
                 spark_color,
-                (
-                    int(start.x - self.position.x + glow_center[0]),
-                    int(start.y - self.position.y + glow_center[1]),
-                ),
-                (
-                    int(end.x - self.position.x + glow_center[0]),
-                    int(end.y - self.position.y + glow_center[1]),
-                ),
+                (int(start.x), int(start.y)),
+                (int(end.x), int(end.y)),
                 2,
             )
 
-        screen.blit(glow, (center[0] - glow_center[0], center[1] - glow_center[1]))
+        return glow
+
+    @staticmethod
+    def pick_spark_pattern():
+        return int(rng.stream(rng.EXPLOSION).random() * EXPLOSION_SPARK_PATTERNS)
+
+    def snapshot(self):
+        return {
+            "position": tuple(self.position),
+            "radius": self.radius,
+            "elapsed": self.elapsed,
+            "spark_pattern": self.spark_pattern,
+        }
+
+    def restore(self, state):
+        self.position.update(state["position"])
+        self.radius = state["radius"]
+        self.elapsed = state["elapsed"]
+        self.spark_pattern = state["spark_pattern"]
+        self.frames, self.duration = self.frames_for_radius(self.radius, self.spark_pattern)
+
+    def draw(self, screen):
+        self.draw_state(screen, self.position, self.elapsed, self.frames)
+
+    def enqueue(self, queue):
+        queue.submit(
+            LAYER_EXPLOSIONS, *self.render_command(self.position, self.elapsed, self.frames)
+        )
+
+    @staticmethod
+    def render_command(position, elapsed, frames):
+        """Return the `(surface, dest)` blit for one explosion, shared by sprites and the entity store."""
+        frame_index = min(len(frames) - 1, int(elapsed * EXPLOSION_FPS))
+        frame = frames[frame_index]
+        rect = frame.get_rect(center=(position.x, position.y))
+        return frame, rect.topleft
+
+    @classmethod
+    def draw_state(cls, screen, position, elapsed, frames):
+        """Draw one explosion from plain state."""
+        screen.blit(*cls.render_command(position, elapsed, frames))
 
     def update(self, dt):
         self.elapsed += dt
         if self.elapsed >= self.duration:
             self.kill()
+
+
+Explosion.pool = ObjectPool("explosions", Explosion, EXPLOSION_POOL_CAPACITY)
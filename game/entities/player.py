@@ -1,8 +1,12 @@
 import math
-import random
+from functools import partial
+
 import pygame
+from game.core import rng
 from game.core.circleshape import CircleShape
 from game.entities.shot import Shot
+from game.render.queue import LAYER_SHIP, RenderQueue
+from game.render.rotation_atlas import SHIP, SHIP_INVULNERABLE, rotation_atlas
 from game.config.constants import (
     PLAYER_RADIUS,
     LINE_WIDTH,
@@ -11,9 +15,6 @@ from game.config.constants import (
     PLAYER_TURN_SPEED,
     PLAYER_SHOT_SPEED,
     PLAYER_SHOOT_COOLDOWN_SECONDS,
-    PLAYER_SPRITE_PATH,
-    PLAYER_INVULNERABLE_SPRITE_PATH,
-    PLAYER_SPRITE_SIZE_MULTIPLIER,
     PLAYER_BUZZ_AMPLITUDE_PX,
     PLAYER_BUZZ_FREQUENCY_HZ,
     PLAYER_BUZZ_RAMP_UP,
@@ -21,57 +22,90 @@ from game.config.constants import (
 )
 
 
+def _blit_faded(sprite, dest, alpha, screen):
+    # Modulate the cached sprite in place rather than blitting a faded copy.
+    sprite.set_alpha(alpha)
+    screen.blit(sprite, dest)
+    sprite.set_alpha(255)
+
+
+def _draw_outline(color, points, screen):
+    pygame.draw.polygon(screen, color, points, LINE_WIDTH)
+
+
 class Player(CircleShape):
-    def __init__(self, x, y):
+    # When set, shots are spawned into this `EntityWorld` instead of sprite Groups.
+    world = None
+
+    def __init__(self, x, y, input_source=None):
         super().__init__(x, y, PLAYER_RADIUS)
+        # Anything with `read()` returning a key-indexable frame; live keyboard when None.
+        self.input_source = input_source
         self.rotation = 0
+        self.previous_rotation = 0
+        self._simulated_rotation = 0
         self.cd = 0
-        self.__sprite = self.__load_sprite(PLAYER_SPRITE_PATH)
-        self.__invulnerable_sprite = self.__load_sprite(PLAYER_INVULNERABLE_SPRITE_PATH)
-        self.__sprite_cache = {}
         self.__is_moving = False
         self.__buzz_intensity = 0.0
         self.__buzz_time = 0.0
         self.__invulnerable = False
         self.__invulnerable_visual_time = 0.0
-        self.__buzz_phase = random.uniform(0.0, math.pi * 2)
-        self.__buzz_phase_2 = random.uniform(0.0, math.pi * 2)
+        player_rng = rng.stream(rng.PLAYER)
+        self.__buzz_phase = player_rng.uniform(0.0, math.pi * 2)
+        self.__buzz_phase_2 = player_rng.uniform(0.0, math.pi * 2)
+
+    def snapshot(self):
+        return {
+            "position": tuple(self.position),
+            "velocity": tuple(self.velocity),
+            "rotation": self.rotation,
+            "cd": self.cd,
+            "is_moving": self.__is_moving,
+            "buzz_intensity": self.__buzz_intensity,
+            "buzz_time": self.__buzz_time,
+            "buzz_phase": self.__buzz_phase,
+            "buzz_phase_2": self.__buzz_phase_2,
+            "invulnerable": self.__invulnerable,
+            "invulnerable_visual_time": self.__invulnerable_visual_time,
+        }
+
+    def restore(self, state):
+        self.position.update(state["position"])
+        self.previous_position.update(state["position"])
+        self.velocity.update(state["velocity"])
+        self.rotation = self.previous_rotation = state["rotation"]
+        self.cd = state["cd"]
+        self.__is_moving = state["is_moving"]
+        self.__buzz_intensity = state["buzz_intensity"]
+        self.__buzz_time = state["buzz_time"]
+        self.__buzz_phase = state["buzz_phase"]
+        self.__buzz_phase_2 = state["buzz_phase_2"]
+        self.__invulnerable = state["invulnerable"]
+        self.__invulnerable_visual_time = state["invulnerable_visual_time"]
 
-    def __load_sprite(self, sprite_path):
-        if not sprite_path:
-            return None
-        target_size = max(1, int(self.radius * PLAYER_SPRITE_SIZE_MULTIPLIER))
-        try:
-            sprite = pygame.image.load(sprite_path).convert_alpha()
-        except Exception as err:
-            print(f"Warning: failed to load player sprite '{sprite_path}': {err}")
+    def __get_rotated_sprite(self):
+        atlas = None
+        if self.__invulnerable:
+            atlas = rotation_atlas(SHIP_INVULNERABLE)
+        if atlas is None:
+            atlas = rotation_atlas(SHIP)
+        if atlas is None:
             return None
+        # ship.png points north; player rotation=0 points south in current movement model.
+        return atlas.sprite_for(180 - self.rotation)
 
-        src_width, src_height = sprite.get_size()
-        scale = min(target_size / src_width, target_size / src_height)
-        scaled_size = (
-            max(1, int(src_width * scale)),
-            max(1, int(src_height * scale)),
-        )
-        return pygame.transform.smoothscale(sprite, scaled_size)
+    def store_previous_state(self):
+        super().store_previous_state()
+        self.previous_rotation = self.rotation
 
-    def __get_rotated_sprite(self):
-        use_alt_sprite = self.__invulnerable and self.__invulnerable_sprite is not None
-        base_sprite = self.__invulnerable_sprite if use_alt_sprite else self.__sprite
-        if base_sprite is None:
-            return None
+    def begin_interpolation(self, alpha):
+        super().begin_interpolation(alpha)
+        self._simulated_rotation = self.rotation
+        self.rotation = self.previous_rotation + (self.rotation - self.previous_rotation) * alpha
 
-        # ship.png points north; player rotation=0 points south in current movement model.
-        angle = int(round(180 - self.rotation)) % 360
-        mode = "invuln" if use_alt_sprite else "normal"
-        cache_key = (mode, angle)
-        if cache_key not in self.__sprite_cache:
-            self.__sprite_cache[cache_key] = pygame.transform.rotozoom(
-                base_sprite,
-                angle,
-                1.0,
-            )
-        return self.__sprite_cache[cache_key]
+    def end_interpolation(self):
+        super().end_interpolation()
+        self.rotation = self._simulated_rotation
 
     def set_invulnerable(self, active):
         self.__invulnerable = active
@@ -88,23 +122,29 @@ class Player(CircleShape):
         return [a, b, c]
 
     def draw(self, screen):
+        queue = RenderQueue()
+        self.enqueue(queue)
+        queue.flush(screen)
+
+    def enqueue(self, queue):
+        # Callbacks get their inputs bound now, so queued frames stay valid
+        # while the player keeps moving.
         draw_center = self.position + self.__get_buzz_offset()
         sprite = self.__get_rotated_sprite()
         if sprite:
-            rect = sprite.get_rect(center=(draw_center.x, draw_center.y))
-            if self.__invulnerable and self.__invulnerable_sprite is None:
+            dest = sprite.get_rect(center=(draw_center.x, draw_center.y)).topleft
+            if self.__invulnerable and rotation_atlas(SHIP_INVULNERABLE) is None:
                 pulse = (math.sin(self.__invulnerable_visual_time * 16.0) + 1.0) * 0.5
-                alpha = int(155 + pulse * 100)
-                temp = sprite.copy()
-                temp.set_alpha(alpha)
-                screen.blit(temp, rect.topleft)
+                queue.submit_callback(
+                    LAYER_SHIP, partial(_blit_faded, sprite, dest, int(155 + pulse * 100))
+                )
             else:
-                screen.blit(sprite, rect.topleft)
+                queue.submit(LAYER_SHIP, sprite, dest)
             return
         buzz_offset = draw_center - self.position
         points = [point + buzz_offset for point in self.triangle()]
         color = (130, 220, 255) if self.__invulnerable else "white"
-        pygame.draw.polygon(screen, color, points, LINE_WIDTH)
+        queue.submit_callback(LAYER_SHIP, partial(_draw_outline, color, points))
 
     def __get_buzz_offset(self):
         if self.__buzz_intensity <= 1e-3:
@@ -141,7 +181,10 @@ class Player(CircleShape):
 
     def update(self, dt):
         self.cd -= dt
-        keys = pygame.key.get_pressed()
+        if self.input_source is not None:
+            keys = self.input_source.read()
+        else:
+            keys = pygame.key.get_pressed()
         self.__is_moving = keys[pygame.K_w] or keys[pygame.K_s]
         self.__buzz_time += dt
         if self.__invulnerable:
@@ -170,6 +213,9 @@ class Player(CircleShape):
         if self.cd > 0:
             return
         self.cd = PLAYER_SHOOT_COOLDOWN_SECONDS
-        shot = Shot(self.position[0], self.position[1])
-        shot.velocity = pygame.Vector2(0, 1).rotate(
-            self.rotation) * PLAYER_SHOT_SPEED
+        velocity = pygame.Vector2(0, 1).rotate(self.rotation) * PLAYER_SHOT_SPEED
+        if self.world is not None:
+            self.world.spawn_shot(self.position[0], self.position[1], velocity)
+            return
+        shot = Shot.spawn(self.position[0], self.position[1])
+        shot.velocity = velocity
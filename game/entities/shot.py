@@ -1,69 +1,79 @@
 import pygame
 from game.core.circleshape import CircleShape
+from game.core.pool import ObjectPool, Poolable
+from game.render.queue import LAYER_SHOTS
+from game.render.rotation_atlas import MISSILE, rotation_atlas
 from game.config.constants import (
+    SHOT_POOL_CAPACITY,
     SHOT_RADIUS,
     SHOT_LIFETIME_SECONDS,
-    SHOT_SPRITE_PATH,
-    SHOT_SPRITE_SIZE_MULTIPLIER,
 )
 
 
-class Shot(CircleShape):
-    _base_sprite = None
-    _load_failed = False
-    _rotation_cache = {}
+class Shot(Poolable, CircleShape):
+    _fallback_dot = None
 
     def __init__(self, x, y):
         super().__init__(x, y, SHOT_RADIUS)
         self.life_remaining = SHOT_LIFETIME_SECONDS
-        self.__ensure_sprite_loaded()
 
-    @classmethod
-    def __ensure_sprite_loaded(cls):
-        if cls._base_sprite is not None or cls._load_failed:
-            return
+    def reset(self, x, y):
+        """Reinitialise a pooled shot as if freshly constructed."""
+        if hasattr(self, "containers"):
+            self.add(self.containers)
+        self.position.update(x, y)
+        self.previous_position.update(x, y)
+        self.velocity.update(0, 0)
+        self.life_remaining = SHOT_LIFETIME_SECONDS
 
-        target_size = max(1, int(SHOT_RADIUS * SHOT_SPRITE_SIZE_MULTIPLIER))
-        try:
-            sprite = pygame.image.load(SHOT_SPRITE_PATH).convert_alpha()
-        except Exception as err:
-            print(f"Warning: failed to load shot sprite '{SHOT_SPRITE_PATH}': {err}")
-            cls._load_failed = True
-            return
+    def snapshot(self):
+        return {
+            "position": tuple(self.position),
+            "velocity": tuple(self.velocity),
+            "life_remaining": self.life_remaining,
+        }
 
-        src_width, src_height = sprite.get_size()
-        scale = min(target_size / src_width, target_size / src_height)
-        scaled_size = (
-            max(1, int(src_width * scale)),
-            max(1, int(src_height * scale)),
-        )
-        cls._base_sprite = pygame.transform.smoothscale(sprite, scaled_size)
-        cls._rotation_cache = {}
+    def restore(self, state):
+        self.position.update(state["position"])
+        self.previous_position.update(state["position"])
+        self.velocity.update(state["velocity"])
+        self.life_remaining = state["life_remaining"]
 
-    def __get_rotated_sprite(self):
-        if self._base_sprite is None:
+    @staticmethod
+    def sprite_for_velocity(velocity):
+        """Return the missile sprite rotated to face `velocity` from the shared atlas."""
+        atlas = rotation_atlas(MISSILE)
+        if atlas is None:
             return None
-        if self.velocity.length_squared() <= 1e-8:
-            return self._base_sprite
+        if velocity.length_squared() <= 1e-8:
+            return atlas.base
 
-        move_angle = pygame.Vector2(0, 1).angle_to(self.velocity)
+        move_angle = pygame.Vector2(0, 1).angle_to(velocity)
         # missile.png points north; velocity baseline in game is south.
-        angle = int(round(180 - move_angle)) % 360
-        if angle not in self._rotation_cache:
-            self._rotation_cache[angle] = pygame.transform.rotozoom(
-                self._base_sprite,
-                angle,
-                1.0,
-            )
-        return self._rotation_cache[angle]
+        return atlas.sprite_for(180 - move_angle)
 
-    def draw(self, screen):
-        sprite = self.__get_rotated_sprite()
+    @classmethod
+    def render_command(cls, position, velocity):
+        """Return the `(surface, dest)` blit that draws a shot at `position`."""
+        sprite = cls.sprite_for_velocity(velocity)
         if sprite:
-            rect = sprite.get_rect(center=(self.position.x, self.position.y))
-            screen.blit(sprite, rect.topleft)
-            return
-        pygame.draw.circle(screen, "white", self.position, SHOT_RADIUS)
+            rect = sprite.get_rect(center=(position.x, position.y))
+            return sprite, rect.topleft
+        # Blitted rather than drawn so dirty-rect rendering sees the area it covers.
+        if cls._fallback_dot is None:
+            cls._fallback_dot = pygame.Surface((SHOT_RADIUS * 2, SHOT_RADIUS * 2), pygame.SRCALPHA)
+            pygame.draw.circle(cls._fallback_dot, "white", (SHOT_RADIUS, SHOT_RADIUS), SHOT_RADIUS)
+        return cls._fallback_dot, (position.x - SHOT_RADIUS, position.y - SHOT_RADIUS)
+
+    @classmethod
+    def draw_at(cls, screen, position, velocity):
+        screen.blit(*cls.render_command(position, velocity))
+
+    def draw(self, screen):
+        self.draw_at(screen, self.position, self.velocity)
+
+    def enqueue(self, queue):
+        queue.submit(LAYER_SHOTS, *self.render_command(self.position, self.velocity))
 
     def update(self, dt):
         self.life_remaining -= dt
@@ -72,3 +82,6 @@ class Shot(CircleShape):
             return
         self.position += self.velocity * dt
         self.wrap_around_screen()
+
+
+Shot.pool = ObjectPool("shots", Shot, SHOT_POOL_CAPACITY)
@@ -1,5 +1,32 @@
-from game.render.renderer import GameRenderer
-from game.render.asteroid_texture import prewarm_asteroid_textures
-from game.render.startup import StartupScreen
+"""Rendering package.
 
-__all__ = ["GameRenderer", "StartupScreen", "prewarm_asteroid_textures"]
+The names below are imported on first use, so modules that only need a
+leaf module (the entities import `game.render.queue`) do not pull in the
+renderer and startup screen as a side effect.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "GameRenderer": "game.render.renderer",
+    "StartupScreen": "game.render.startup",
+    "prewarm_asteroid_textures": "game.render.asteroid_texture",
+    "prewarm_rotation_atlases": "game.render.rotation_atlas",
+    "rotation_atlas_stats": "game.render.rotation_atlas",
+    "submit_rotation_atlases": "game.render.rotation_atlas",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
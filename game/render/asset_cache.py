@@ -0,0 +1,339 @@
+"""Baked asset cache: pre-scaled asteroid variants and explosion frames in one file.
+
+The file is `MAGIC`, a little-endian u32 header length, a JSON header and
+then raw BGRA pixel blobs, the layout `convert_alpha()` produces on 32-bit
+displays. The header records every source file (size, mtime, SHA-256) and
+the settings the fallback explosion is drawn with, and indexes groups of
+frames by key, e.g. `asteroid@42` or `explosion@56` (the target size in
+pixels). At startup the file is memory-mapped and each blob wrapped with
+`pygame.image.frombuffer`, so nothing is decoded, scaled or drawn. Any
+changed, added or removed source or setting makes the whole file stale.
+
+`scripts/bake_assets.py` bakes it ahead of time into `ASSET_CACHE_PATH`,
+which ships with the game and is never written at runtime. Otherwise the
+first launch loads assets the slow way and `save_asset_cache` writes what it
+warmed to the per-user `ASSET_CACHE_USER_PATH`, which later launches fall
+back to.
+"""
+
+import glob
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+import pygame
+from game.config.constants import (
+    ASSET_CACHE_PATH,
+    ASSET_CACHE_USER_PATH,
+    ASTEROID_KINDS,
+    ASTEROID_MIN_RADIUS,
+    ASTEROID_SPRITE_GLOB,
+    EXPLOSION_FALLBACK_DURATION_SECONDS,
+    EXPLOSION_FPS,
+    EXPLOSION_GIF_PATH,
+    EXPLOSION_SPARK_COUNT,
+    EXPLOSION_SPARK_PATTERNS,
+)
+from game.utils.resources import runtime_base_path
+
+MAGIC = b"ASTBAKE\x01"
+ASSET_CACHE_VERSION = 1
+_HEADER_LENGTH = struct.Struct("<I")
+_PIXEL_FORMAT = "BGRA"
+
+_loaded = None
+_status = "unused"
+
+
+class BakedAssets:
+    """A memory-mapped cache file; frames are views into the mapping, never copies."""
+
+    def __init__(self, path, mapping, header, data_start):
+        self.path = path
+        self.size_bytes = len(mapping)
+        self._mapping = mapping
+        self._view = memoryview(mapping)
+        self._groups = header["groups"]
+        self._data_start = data_start
+        self._frames = {}
+
+    def keys(self):
+        return self._groups.keys()
+
+    def frames(self, key):
+        """Return the `(surface, offset)` list baked under `key`, or None.
+
+        `offset` is the `pygame.Vector2` stored with the frame, or None.
+        The surfaces share the read-only mapping: blit them, never draw on them.
+        """
+        frames = self._frames.get(key)
+        if frames is None:
+            entries = self._groups.get(key)
+            if entries is None:
+                return None
+            frames = []
+            for entry in entries:
+                width, height = entry["size"]
+                start = self._data_start + entry["offset"]
+                pixels = self._view[start:start + width * height * 4]
+                surface = pygame.image.frombuffer(pixels, (width, height), _PIXEL_FORMAT)
+                offset = entry.get("anchor")
+                frames.append((surface, pygame.Vector2(offset) if offset else None))
+            self._frames[key] = frames
+        return frames
+
+
+def cache_sources():
+    """Return the source files the baked assets are derived from."""
+    paths = sorted(glob.glob(ASTEROID_SPRITE_GLOB))
+    if os.path.exists(EXPLOSION_GIF_PATH):
+        paths.append(EXPLOSION_GIF_PATH)
+    return paths
+
+
+def _bake_params():
+    """Settings the fallback explosion bursts are drawn from; sprite scales are in the keys."""
+    return {
+        "explosion_fps": EXPLOSION_FPS,
+        "explosion_fallback_duration": EXPLOSION_FALLBACK_DURATION_SECONDS,
+        "explosion_spark_count": EXPLOSION_SPARK_COUNT,
+        "explosion_spark_patterns": EXPLOSION_SPARK_PATTERNS,
+    }
+
+
+def _source_key(path):
+    try:
+        return os.path.relpath(path, runtime_base_path()).replace(os.sep, "/")
+    except ValueError:
+        return path
+
+
+def _fingerprint(path, recorded=None):
+    """Size, mtime and hash of `path`; the hash is reused while size and mtime match."""
+    stat = os.stat(path)
+    if (
+        recorded is not None
+        and recorded.get("size") == stat.st_size
+        and recorded.get("mtime_ns") == stat.st_mtime_ns
+    ):
+        return recorded
+    with open(path, "rb") as source:
+        digest = hashlib.sha256(source.read()).hexdigest()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+
+
+def _sources_match(recorded):
+    paths = cache_sources()
+    if sorted(_source_key(path) for path in paths) != sorted(recorded):
+        return False
+    for path in paths:
+        expected = recorded[_source_key(path)]
+        # A touched but unchanged file (fresh checkout, copy) still matches by hash.
+        if _fingerprint(path, expected)["sha256"] != expected["sha256"]:
+            return False
+    return True
+
+
+def _header_fits(header):
+    """True when `header` has the keys and types `_read` relies on; a foreign file fails."""
+    if not isinstance(header, dict):
+        return False
+    sources = header.get("sources")
+    return (
+        isinstance(sources, dict)
+        and all(isinstance(entry, dict) and "sha256" in entry for entry in sources.values())
+        and isinstance(header.get("groups"), dict)
+    )
+
+
+def _blobs_fit(groups, data_length):
+    """True when every frame's pixels lie inside the mapped data; a truncated file fails."""
+    try:
+        for entries in groups.values():
+            for entry in entries:
+                width, height = entry["size"]
+                offset = entry["offset"]
+                if width <= 0 or height <= 0 or offset < 0:
+                    return False
+                if offset + width * height * 4 > data_length:
+                    return False
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return False
+    return True
+
+
+def _read(path):
+    """Map `path` and return `(status, BakedAssets or None)`."""
+    try:
+        source = open(path, "rb")
+    except FileNotFoundError:
+        return "missing", None
+    with source:
+        try:
+            mapping = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return "corrupt", None
+    header_start = len(MAGIC) + _HEADER_LENGTH.size
+    if len(mapping) < header_start or mapping[: len(MAGIC)] != MAGIC:
+        mapping.close()
+        return "corrupt", None
+    (header_length,) = _HEADER_LENGTH.unpack_from(mapping, len(MAGIC))
+    try:
+        header = json.loads(bytes(mapping[header_start:header_start + header_length]))
+    except ValueError:
+        mapping.close()
+        return "corrupt", None
+    if not _header_fits(header):
+        mapping.close()
+        return "corrupt", None
+    if (
+        header.get("version") != ASSET_CACHE_VERSION
+        or header.get("params") != _bake_params()
+        or not _sources_match(header["sources"])
+    ):
+        mapping.close()
+        return "stale", None
+    data_start = header_start + header_length
+    if not _blobs_fit(header.get("groups"), len(mapping) - data_start):
+        mapping.close()
+        return "corrupt", None
+    return "hit", BakedAssets(path, mapping, header, data_start)
+
+
+def load_asset_cache(path=None):
+    """Map the baked cache for `baked_frames`; returns it, or None when missing or stale.
+
+    Without `path`, the bundled `ASSET_CACHE_PATH` is tried first, then the
+    per-user `ASSET_CACHE_USER_PATH`. The status is that of the first file
+    found when neither is usable.
+    """
+    global _loaded, _status
+    status = "missing"
+    for candidate in [path] if path else [ASSET_CACHE_PATH, ASSET_CACHE_USER_PATH]:
+        try:
+            found, loaded = _read(candidate)
+        except OSError as err:
+            print(f"Warning: failed to read asset cache '{candidate}': {err}")
+            found, loaded = "corrupt", None
+        if loaded is not None:
+            _status, _loaded = found, loaded
+            return loaded
+        if status == "missing":
+            status = found
+    _status, _loaded = status, None
+    return None
+
+
+def unload_asset_cache():
+    global _loaded, _status
+    _loaded = None
+    _status = "unused"
+
+
+def asset_cache_status():
+    """Return "hit", "missing", "stale", "corrupt", or "unused" when never loaded."""
+    return _status
+
+
+def baked_frames(key):
+    """Return the loaded cache's frames for `key`, or None to build them the slow way."""
+    if _loaded is None:
+        return None
+    return _loaded.frames(key)
+
+
+def write_asset_cache(groups, path=ASSET_CACHE_PATH):
+    """Write `groups` ({key: [(surface, offset)]}) and return the bytes written."""
+    index = {}
+    blobs = []
+    data_length = 0
+    for key, frames in sorted(groups.items()):
+        entries = []
+        for surface, offset in frames:
+            pixels = pygame.image.tobytes(surface, _PIXEL_FORMAT)
+            entry = {"offset": data_length, "size": list(surface.get_size())}
+            if offset is not None:
+                entry["anchor"] = [offset[0], offset[1]]
+            entries.append(entry)
+            blobs.append(pixels)
+            data_length += len(pixels)
+        index[key] = entries
+
+    header = json.dumps(
+        {
+            "version": ASSET_CACHE_VERSION,
+            "params": _bake_params(),
+            "sources": {_source_key(source): _fingerprint(source) for source in cache_sources()},
+            "groups": index,
+        },
+        sort_keys=True,
+    ).encode("utf-8")
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    partial = f"{path}.tmp"
+    with open(partial, "wb") as target:
+        target.write(MAGIC)
+        target.write(_HEADER_LENGTH.pack(len(header)))
+        target.write(header)
+        for pixels in blobs:
+            target.write(pixels)
+    os.replace(partial, path)
+    return len(MAGIC) + _HEADER_LENGTH.size + len(header) + data_length
+
+
+def _explosion_radii():
+    return [ASTEROID_MIN_RADIUS * kind for kind in range(1, ASTEROID_KINDS + 1)]
+
+
+def prewarm_cached_assets():
+    """Build every asset the cache holds: asteroid textures, and explosions per asteroid size."""
+    from game.entities.explosion import Explosion
+    from game.render.asteroid_texture import prewarm_asteroid_textures
+
+    prewarm_asteroid_textures()
+    Explosion.prewarm(_explosion_radii())
+
+
+def submit_cached_assets(loader):
+    """`prewarm_cached_assets` on an `AssetLoader`; baked assets are installed right away."""
+    from game.entities.explosion import Explosion
+    from game.render.asteroid_texture import submit_asteroid_textures
+
+    submit_asteroid_textures(loader)
+    Explosion.submit_prewarm(loader, _explosion_radii())
+
+
+def warm_asset_groups():
+    """Collect every asteroid variant and explosion frame set built so far."""
+    from game.entities.explosion import Explosion
+    from game.render.asteroid_texture import warm_texture_groups
+
+    groups = warm_texture_groups()
+    groups.update(Explosion.warm_frame_groups())
+    return groups
+
+
+def save_asset_cache(path=None):
+    """Write the warmed assets unless the loaded cache is current; False if that failed.
+
+    The cache goes to the per-user `ASSET_CACHE_USER_PATH` unless `path` is given.
+    """
+    if _status == "hit":
+        return True
+    path = path or ASSET_CACHE_USER_PATH
+    try:
+        write_asset_cache(warm_asset_groups(), path)
+    except OSError as err:
+        print(f"Warning: failed to write asset cache '{path}': {err}")
+        return False
+    return True
+
+
+def asset_cache_stats():
+    stats = {"status": _status}
+    if _loaded is not None:
+        stats.update(groups=len(_loaded.keys()), bytes=_loaded.size_bytes)
+    return stats
@@ -1,8 +1,11 @@
 import glob
 import os
-import random
 import re
+from functools import partial
+
 import pygame
+from game.render.asset_cache import baked_frames
+from game.render.loader import decode_image
 from game.config.constants import (
     ASTEROID_MIN_RADIUS,
     ASTEROID_KINDS,
@@ -15,6 +18,11 @@ _SPRITES_BY_SIZE = {"lg": [], "md": [], "sm": []}
 _SCALED_CACHE = {}
 _SPRITES_LOADED = False
 
+# Flyweight table: a texture handle is an index into `_DESCRIPTORS`, and each
+# target size maps to the handles of its variants in stable variant order.
+_DESCRIPTORS = []
+_HANDLES_BY_TARGET = {}
+
 
 def _size_key_for_radius(radius):
     if radius <= ASTEROID_MIN_RADIUS * 1.5:
@@ -24,12 +32,6 @@ def _size_key_for_radius(radius):
     return "lg"
 
 
-def _estimate_radius_from_offsets(shape_offsets):
-    if not shape_offsets:
-        return ASTEROID_MIN_RADIUS
-    return max(point.length() for point in shape_offsets)
-
-
 def _fallback_texture(radius):
     diameter = max(2, int(round(radius * 2)))
     surface = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
@@ -43,43 +45,53 @@ def _fallback_texture(radius):
     return surface, offset
 
 
+def _sprite_paths():
+    paths = []
+    for path in sorted(glob.glob(ASTEROID_SPRITE_GLOB)):
+        match = _VARIANT_PATTERN.match(os.path.basename(path))
+        if match:
+            paths.append((path, match.group(1).lower()))
+    return paths
+
+
+def _decode_variant(path):
+    """Load one sprite variant without converting it; None if missing or blank."""
+    name = os.path.basename(path)
+    try:
+        surface = decode_image(path)
+    except Exception as err:
+        print(f"Warning: failed to load asteroid sprite '{path}': {err}")
+        return None
+
+    visible_rect = surface.get_bounding_rect(min_alpha=1)
+    if visible_rect.width == 0 or visible_rect.height == 0:
+        return None
+    source_mask = pygame.mask.from_surface(surface)
+    source_centroid = source_mask.centroid() if source_mask.count() else None
+    if source_centroid is None:
+        source_center = (surface.get_width() / 2, surface.get_height() / 2)
+    else:
+        source_center = source_centroid
+
+    return {
+        "name": name,
+        "surface": surface,
+        "source_size": surface.get_size(),
+        "visible_longest": max(visible_rect.width, visible_rect.height),
+        "source_center": source_center,
+    }
+
+
 def _ensure_sprites_loaded():
     global _SPRITES_LOADED
     if _SPRITES_LOADED:
         return
 
-    for path in sorted(glob.glob(ASTEROID_SPRITE_GLOB)):
-        name = os.path.basename(path)
-        match = _VARIANT_PATTERN.match(name)
-        if not match:
-            continue
-
-        size_key = match.group(1).lower()
-        try:
-            surface = pygame.image.load(path).convert_alpha()
-        except Exception as err:
-            print(f"Warning: failed to load asteroid sprite '{path}': {err}")
-            continue
-
-        visible_rect = surface.get_bounding_rect(min_alpha=1)
-        if visible_rect.width == 0 or visible_rect.height == 0:
-            continue
-        source_mask = pygame.mask.from_surface(surface)
-        source_centroid = source_mask.centroid() if source_mask.count() else None
-        if source_centroid is None:
-            source_center = (surface.get_width() / 2, surface.get_height() / 2)
-        else:
-            source_center = source_centroid
-
-        _SPRITES_BY_SIZE[size_key].append(
-            {
-                "name": name,
-                "surface": surface,
-                "source_size": surface.get_size(),
-                "visible_longest": max(visible_rect.width, visible_rect.height),
-                "source_center": source_center,
-            }
-        )
+    for path, size_key in _sprite_paths():
+        variant = _decode_variant(path)
+        if variant is not None:
+            variant["surface"] = variant["surface"].convert_alpha()
+            _SPRITES_BY_SIZE[size_key].append(variant)
 
     _SPRITES_LOADED = True
 
@@ -96,9 +108,12 @@ def _get_variants_for_size(size_key):
 
 def _get_scaled_variant(variant, target_longest):
     cache_key = (variant["name"], target_longest)
-    if cache_key in _SCALED_CACHE:
-        return _SCALED_CACHE[cache_key]
+    if cache_key not in _SCALED_CACHE:
+        _SCALED_CACHE[cache_key] = _scale_variant(variant, target_longest)
+    return _SCALED_CACHE[cache_key]
+
 
+def _scale_variant(variant, target_longest):
     source = variant["surface"]
     scale = target_longest / max(1, variant["visible_longest"])
     scaled_size = (
@@ -113,42 +128,122 @@ def _get_scaled_variant(variant, target_longest):
     center_x = source_center_x * scale_x
     center_y = source_center_y * scale_y
 
-    offset = pygame.Vector2(-center_x, -center_y)
-    _SCALED_CACHE[cache_key] = (scaled, offset)
-    return _SCALED_CACHE[cache_key]
+    return scaled, pygame.Vector2(-center_x, -center_y)
 
 
-def prewarm_asteroid_textures():
-    """Warm common asteroid texture sizes to avoid first-hit stutter."""
-    _ensure_sprites_loaded()
-    size_to_radius = {
-        "sm": ASTEROID_MIN_RADIUS,
-        "md": ASTEROID_MIN_RADIUS * 2,
-        "lg": ASTEROID_MIN_RADIUS * max(3, ASTEROID_KINDS),
-    }
+def _target_longest_for_radius(radius):
+    return max(2, int(round(radius * ASTEROID_SPRITE_SCALE_TO_RADIUS)))
 
-    for size_key, variants in _SPRITES_BY_SIZE.items():
-        if not variants:
-            continue
-        radius = size_to_radius.get(size_key, ASTEROID_MIN_RADIUS)
-        target_longest = max(2, int(round(radius * ASTEROID_SPRITE_SCALE_TO_RADIUS)))
-        for variant in variants:
-            _get_scaled_variant(variant, target_longest)
 
+def asteroid_texture_handles(radius):
+    """Return the texture handles for `radius`, one per sprite variant.
 
-def build_asteroid_texture(shape_offsets_or_radius, seed=None):
-    _ensure_sprites_loaded()
+    The first call for a size class scales its variants into the shared
+    descriptor table; later calls are a single dictionary lookup.
+    """
+    target_longest = _target_longest_for_radius(radius)
+    handles = _HANDLES_BY_TARGET.get(target_longest)
+    if handles is not None:
+        return handles
+
+    descriptors = baked_frames(f"asteroid@{target_longest}")
+    if descriptors is None:
+        _ensure_sprites_loaded()
+        variants = _get_variants_for_size(_size_key_for_radius(radius))
+        if variants:
+            descriptors = [_get_scaled_variant(variant, target_longest) for variant in variants]
+        else:
+            descriptors = [_fallback_texture(radius)]
+    start = len(_DESCRIPTORS)
+    _DESCRIPTORS.extend(descriptors)
+    handles = tuple(range(start, len(_DESCRIPTORS)))
+    _HANDLES_BY_TARGET[target_longest] = handles
+    return handles
+
+
+def pick_asteroid_texture(radius, rng):
+    """Draw one texture handle for `radius` from the `random.Random` `rng`."""
+    handles = asteroid_texture_handles(radius)
+    return handles[int(rng.random() * len(handles))]
+
+
+def asteroid_texture(handle):
+    """Return the shared `(surface, offset)` descriptor for `handle`; never mutate it."""
+    return _DESCRIPTORS[handle]
+
+
+def asteroid_texture_variant(radius, handle):
+    """Position of `handle` among the variants for `radius`; stable across runs, unlike handles."""
+    return asteroid_texture_handles(radius).index(handle)
 
-    if isinstance(shape_offsets_or_radius, (int, float)):
-        radius = float(shape_offsets_or_radius)
-    else:
-        radius = _estimate_radius_from_offsets(shape_offsets_or_radius)
 
-    variants = _get_variants_for_size(_size_key_for_radius(radius))
-    if not variants:
-        return _fallback_texture(radius)
+def warm_texture_groups():
+    """Return the descriptors built so far as asset cache groups (`asteroid@<target>`)."""
+    return {
+        f"asteroid@{target_longest}": [_DESCRIPTORS[handle] for handle in handles]
+        for target_longest, handles in _HANDLES_BY_TARGET.items()
+    }
+
+
+def _prewarm_radii():
+    # Every radius the game spawns gets its descriptors and handles up front.
+    return [ASTEROID_MIN_RADIUS * kind for kind in range(1, max(3, ASTEROID_KINDS) + 1)]
 
-    rng = random.Random(seed)
-    variant = rng.choice(variants)
-    target_longest = max(2, int(round(radius * ASTEROID_SPRITE_SCALE_TO_RADIUS)))
-    return _get_scaled_variant(variant, target_longest)
+
+def prewarm_asteroid_textures():
+    """Warm common asteroid texture sizes to avoid first-hit stutter."""
+    for radius in _prewarm_radii():
+        asteroid_texture_handles(radius)
+
+
+def submit_asteroid_textures(loader):
+    """Decode and scale every variant on `loader`'s workers, then build the handles.
+
+    Sizes already baked into the asset cache are skipped. The handles are
+    built once every variant has landed, so variant order matches a
+    synchronous load.
+    """
+    targets = {}
+    for radius in _prewarm_radii():
+        target_longest = _target_longest_for_radius(radius)
+        if baked_frames(f"asteroid@{target_longest}") is None:
+            targets.setdefault(_size_key_for_radius(radius), set()).add(target_longest)
+    paths = _sprite_paths()
+    if _SPRITES_LOADED or not targets or not paths:
+        prewarm_asteroid_textures()
+        return
+
+    loaded = {}
+
+    def decode(path, size_key):
+        variant = _decode_variant(path)
+        if variant is None:
+            return None
+        scaled = {
+            target_longest: _scale_variant(variant, target_longest)
+            for target_longest in sorted(targets.get(size_key, ()))
+        }
+        return variant, scaled
+
+    def install(path, size_key, result):
+        loaded[path] = (size_key, result)
+        if len(loaded) < len(paths):
+            return
+        global _SPRITES_LOADED
+        for _, (variant_size, variant_result) in sorted(loaded.items()):
+            if variant_result is None:
+                continue
+            variant, scaled = variant_result
+            variant["surface"] = variant["surface"].convert_alpha()
+            _SPRITES_BY_SIZE[variant_size].append(variant)
+            for target_longest, (surface, offset) in scaled.items():
+                _SCALED_CACHE[(variant["name"], target_longest)] = (surface.convert_alpha(), offset)
+        _SPRITES_LOADED = True
+        prewarm_asteroid_textures()
+
+    for path, size_key in paths:
+        loader.submit(
+            f"asteroid {os.path.basename(path)}",
+            partial(decode, path, size_key),
+            partial(install, path, size_key),
+        )
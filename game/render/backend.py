@@ -0,0 +1,208 @@
+import pygame
+from game.config.constants import RENDER_BACKEND, RENDER_TEXTURE_DRIVER
+
+SOFTWARE = "software"
+TEXTURE_PRESENT = "texture-present"
+BACKENDS = (SOFTWARE, TEXTURE_PRESENT)
+
+
+class SoftwareBackend:
+    """Presents frames with software blits onto the display surface and `display.flip`."""
+
+    name = SOFTWARE
+
+    def __init__(self, vsync=False):
+        self.vsync = vsync
+        self.display_surface = None
+        self._mode = None
+
+    def open(self, size, fullscreen):
+        """Set the display mode; the current display is kept when it already has this mode."""
+        flags = pygame.FULLSCREEN if fullscreen else 0
+        size = (0, 0) if fullscreen else size
+        if self._mode == (size, flags) and pygame.display.get_surface() is self.display_surface:
+            return self.display_surface
+        self._mode = (size, flags)
+        if self.vsync:
+            try:
+                self.display_surface = pygame.display.set_mode(size, flags, vsync=1)
+                return self.display_surface
+            except pygame.error as err:
+                print(f"Warning: vsync not available, presenting without it: {err}")
+                self.vsync = False
+        self.display_surface = pygame.display.set_mode(size, flags)
+        return self.display_surface
+
+    def set_caption(self, title):
+        pygame.display.set_caption(title)
+
+    def set_icon(self, icon):
+        pygame.display.set_icon(icon)
+
+    def present(self, static_layer, view, origin, static_stale=True):
+        """Show `view` at `origin` over `static_layer`, which is only redrawn when stale."""
+        if static_stale:
+            self.display_surface.blit(static_layer, (0, 0))
+        if view is not None:
+            self.display_surface.blit(view, origin)
+        pygame.display.flip()
+
+    def present_rects(self, view, origin, rects):
+        """Push only `rects` (in view coordinates) of `view` to the screen."""
+        left, top = origin
+        display_rects = []
+        for rect in rects:
+            display_rect = rect.move(left, top)
+            self.display_surface.blit(view, display_rect, rect)
+            display_rects.append(display_rect)
+        pygame.display.update(display_rects)
+
+    def close(self):
+        self.display_surface = None
+        self._mode = None
+
+
+class TexturePresentBackend:
+    """Experimental: presents software-drawn frames through a `pygame._sdl2.video` renderer.
+
+    Presentation only, not a texture renderer: sprites are still blitted in
+    software, and only the final composition uses the GPU. The static frame
+    layer is uploaded once as a texture; the game view goes into a streaming
+    texture, updating only the dirty regions when given, and the renderer
+    composes both. Re-uploading the full view makes it several times slower
+    than the software path's flip in `benchmark.py present`. `display_surface` is an offscreen canvas of
+    the window's size so layout and the static layer work unchanged. A
+    hidden 1x1 display mode stays set for `convert()`'s pixel format.
+
+    `driver` names an SDL render driver ("software" works headless with the
+    dummy video driver); None lets SDL pick.
+    """
+
+    name = TEXTURE_PRESENT
+
+    def __init__(self, driver=RENDER_TEXTURE_DRIVER, vsync=False):
+        from pygame._sdl2 import video
+
+        self._video = video
+        self.driver = driver
+        self.vsync = vsync
+        self.window = None
+        self.renderer = None
+        self.display_surface = None
+        self._static_source = None
+        self._static_texture = None
+        self._view_texture = None
+        self._mode = None
+        self.uploads = 0
+
+    def open(self, size, fullscreen):
+        """Create or resize the window; an unchanged mode keeps the window and canvas."""
+        video = self._video
+        mode = (None if fullscreen else tuple(size), fullscreen)
+        if self.window is not None and self._mode == mode:
+            return self.display_surface
+        self._mode = mode
+        if self.window is None:
+            pygame.display.set_mode((1, 1), pygame.HIDDEN)
+            self.window = video.Window("Asteroids", size=size, fullscreen_desktop=fullscreen)
+            self.renderer = video.Renderer(
+                self.window, index=self._driver_index(), vsync=self.vsync
+            )
+        elif fullscreen:
+            self.window.set_fullscreen(desktop=True)
+        else:
+            self.window.set_windowed()
+            self.window.size = size
+        self.display_surface = pygame.Surface(self.window.size).convert()
+        self._static_source = None
+        self._view_texture = None
+        return self.display_surface
+
+    def _driver_index(self):
+        if self.driver is None:
+            return -1
+        for index, info in enumerate(self._video.get_drivers()):
+            if info.name == self.driver:
+                return index
+        raise pygame.error(f"SDL render driver '{self.driver}' is not available")
+
+    def set_caption(self, title):
+        self.window.title = title
+
+    def set_icon(self, icon):
+        self.window.set_icon(icon)
+
+    def present(self, static_layer, view, origin, static_stale=True):
+        if self._static_source is not static_layer:
+            self._static_texture = self._video.Texture.from_surface(self.renderer, static_layer)
+            self._static_source = static_layer
+            self.uploads += 1
+        if view is not None:
+            self._view_texture_for(view).update(view)
+            self.uploads += 1
+        self._compose(view, origin)
+
+    def present_rects(self, view, origin, rects):
+        texture = self._view_texture_for(view)
+        for rect in rects:
+            texture.update(view.subsurface(rect), area=rect)
+            self.uploads += 1
+        self._compose(view, origin)
+
+    def _view_texture_for(self, view):
+        texture = self._view_texture
+        if texture is None or (texture.width, texture.height) != view.get_size():
+            texture = self._video.Texture(self.renderer, view.get_size(), streaming=True)
+            self._view_texture = texture
+        return texture
+
+    def _compose(self, view, origin):
+        renderer = self.renderer
+        renderer.draw_color = (0, 0, 0, 255)
+        renderer.clear()
+        self._static_texture.draw()
+        if view is not None:
+            self._view_texture.draw(dstrect=pygame.Rect(origin, view.get_size()))
+        renderer.present()
+
+    def read_pixels(self):
+        """Return the composed frame as a surface (for tests and screenshots)."""
+        return self.renderer.to_surface()
+
+    def close(self):
+        if self.window is not None:
+            self.window.destroy()
+        self.window = None
+        self.renderer = None
+        self._mode = None
+        self._static_source = self._static_texture = self._view_texture = None
+
+
+def create_backend(name=RENDER_BACKEND, vsync=False):
+    """Return the named backend, falling back to software when it cannot be created.
+
+    An already constructed backend is returned as is.
+    """
+    if not isinstance(name, str):
+        return name
+    if name == TEXTURE_PRESENT:
+        try:
+            return TexturePresentBackend(vsync=vsync)
+        except Exception as err:
+            print(f"Warning: texture-present backend unavailable, using software: {err}")
+    return SoftwareBackend(vsync=vsync)
+
+
+def open_backend(backend, size, fullscreen):
+    """Open `backend` and return `(backend, display_surface)`.
+
+    A hardware backend that fails to open is replaced by a software one.
+    """
+    try:
+        return backend, backend.open(size, fullscreen)
+    except Exception as err:
+        if backend.name == SOFTWARE:
+            raise
+        print(f"Warning: {backend.name} render backend failed, using software: {err}")
+        backend = SoftwareBackend(backend.vsync)
+        return backend, backend.open(size, fullscreen)
@@ -0,0 +1,103 @@
+import pygame
+from game.config.constants import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    GAME_VIEW_PADDING_X,
+    GAME_VIEW_PADDING_Y,
+    GAME_BORDER_IMAGE_PATH,
+    GAME_BORDER_OVERFLOW_PX,
+)
+
+_BORDER_CACHE = {}
+_LAYER_CACHE = {}
+
+
+def frame_size():
+    return (
+        SCREEN_WIDTH + (GAME_VIEW_PADDING_X * 2),
+        SCREEN_HEIGHT + (GAME_VIEW_PADDING_Y * 2),
+    )
+
+
+def frame_layout(display_size):
+    """Return `(game_rect, frame_left, frame_top)` for the frame centred in `display_size`."""
+    display_width, display_height = display_size
+    frame_width, frame_height = frame_size()
+    frame_left = max(0, (display_width - frame_width) // 2)
+    frame_top = max(0, (display_height - frame_height) // 2)
+    game_rect = pygame.Rect(
+        frame_left + GAME_VIEW_PADDING_X,
+        frame_top + GAME_VIEW_PADDING_Y,
+        SCREEN_WIDTH,
+        SCREEN_HEIGHT,
+    )
+    return game_rect, frame_left, frame_top
+
+
+def bake_opacity(surface, opacity):
+    """Return `surface` drawn at `opacity` over black as an opaque display-format copy.
+
+    Everything the game draws a background onto starts out black, so the
+    blend is the same every frame; baking it once turns each per-frame alpha
+    blend into a plain copy blit.
+    """
+    baked = pygame.Surface(surface.get_size()).convert()
+    baked.fill("black")
+    if opacity >= 255:
+        baked.blit(surface, (0, 0))
+        return baked
+    blended = surface.copy()
+    blended.set_alpha(max(0, opacity))
+    baked.blit(blended, (0, 0))
+    return baked
+
+
+def load_frame_border(image_path=GAME_BORDER_IMAGE_PATH, overflow_px=GAME_BORDER_OVERFLOW_PX):
+    """Load and scale the border image once per path and overflow; None if it is missing."""
+    cache_key = (image_path, overflow_px)
+    if cache_key in _BORDER_CACHE:
+        return _BORDER_CACHE[cache_key]
+
+    try:
+        border = pygame.image.load(image_path).convert_alpha()
+    except Exception as err:
+        print(f"Warning: failed to load game border image '{image_path}': {err}")
+        border = None
+    else:
+        frame_width, frame_height = frame_size()
+        target_size = (
+            frame_width + (overflow_px * 2),
+            frame_height + (overflow_px * 2),
+        )
+        border = pygame.transform.smoothscale(border, target_size)
+    _BORDER_CACHE[cache_key] = border
+    return border
+
+
+def static_frame_layer(
+    display_surface,
+    border_path=GAME_BORDER_IMAGE_PATH,
+    overflow_px=GAME_BORDER_OVERFLOW_PX,
+    rebuild=False,
+):
+    """Return the letterbox and border for `display_surface` as one opaque surface.
+
+    Composed once per display size and fullscreen state and shared by the
+    startup screen and `GameRenderer`; `rebuild` recomposes it after a mode
+    change. The game view is drawn on top, so the layer only needs to reach
+    the display again when the window contents are lost.
+    """
+    fullscreen = bool(display_surface.get_flags() & pygame.FULLSCREEN)
+    cache_key = (display_surface.get_size(), fullscreen, border_path, overflow_px)
+    layer = _LAYER_CACHE.get(cache_key)
+    if layer is not None and not rebuild:
+        return layer
+
+    layer = pygame.Surface(display_surface.get_size()).convert(display_surface)
+    layer.fill("black")
+    border = load_frame_border(border_path, overflow_px)
+    if border is not None:
+        _, frame_left, frame_top = frame_layout(display_surface.get_size())
+        layer.blit(border, (frame_left - overflow_px, frame_top - overflow_px))
+    _LAYER_CACHE[cache_key] = layer
+    return layer
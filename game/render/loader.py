@@ -0,0 +1,163 @@
+"""Asset loading on a thread pool behind the startup screen.
+
+A task's `work` runs on a worker thread and does the slow part: reading
+files, decoding PNGs and GIF frames, scaling and drawing, all of which
+release the GIL. Its `finish` then runs on the main thread from `pump()`
+and should only convert the results to the display format (`convert()`
+needs the display) and store them.
+
+Tasks submitted under `deferred()` are not needed for the first menu frame.
+They are held back until `start_deferred()`, so they do not compete with
+the others for the CPU. The loading screen starts them early once the
+others are in (`ready`) if it has time to spare. Otherwise they start after
+the first menu frame and finish while the menu is up.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+
+import pygame
+from game.config.constants import ASSET_LOADER_WORKERS
+from game.utils.trace import record_phase
+
+
+def decode_image(image_path):
+    """Load `image_path` without converting it; paletted images are widened so they can be scaled."""
+    image = pygame.image.load(image_path)
+    if image.get_bitsize() < 24:
+        widened = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+        widened.blit(image, (0, 0))
+        image = widened
+    return image
+
+
+class AssetLoader:
+    def __init__(self, workers=ASSET_LOADER_WORKERS):
+        self._executor = ThreadPoolExecutor(max(1, workers), thread_name_prefix="assets")
+        self._pending = []
+        self._held = []
+        self._deferring = False
+        self._deferred_started = False
+        self.total = 0
+        self.completed = 0
+        self.upfront_total = 0
+        self.upfront_completed = 0
+        self.worker_seconds = {}
+
+    @contextmanager
+    def deferred(self, defer=True):
+        """Mark tasks submitted inside the block (and their follow-ups) as deferred."""
+        previous, self._deferring = self._deferring, defer
+        try:
+            yield self
+        finally:
+            self._deferring = previous
+
+    def submit(self, name, work, finish=None):
+        """Run `work()` on a worker, then `finish(result)` on the thread calling `pump`.
+
+        Deferred tasks do not start before `start_deferred()`.
+        """
+        self.total += 1
+        if not self._deferring:
+            self.upfront_total += 1
+        elif not self._deferred_started:
+            self._held.append((name, work, finish))
+            return
+        self._start(name, work, finish, self._deferring)
+
+    def _start(self, name, work, finish, deferred):
+        future = self._executor.submit(self._timed, name, work)
+        self._pending.append((name, future, finish, deferred))
+
+    def start_deferred(self):
+        """Start the held deferred tasks; later ones start as they are submitted."""
+        self._deferred_started = True
+        held, self._held = self._held, []
+        for name, work, finish in held:
+            self._start(name, work, finish, True)
+
+    def _timed(self, name, work):
+        started = time.perf_counter()
+        try:
+            return work()
+        finally:
+            finished = time.perf_counter()
+            self.worker_seconds[name] = finished - started
+            record_phase(f"load {name}", started, finished)
+
+    @property
+    def done(self):
+        return not self._pending and not self._held
+
+    @property
+    def ready(self):
+        """True once every task not submitted under `deferred()` has finished."""
+        return all(deferred for _, _, _, deferred in self._pending)
+
+    def progress(self):
+        """Fraction of the tasks that are not deferred that have finished, from 0.0 to 1.0."""
+        if not self.upfront_total:
+            return 1.0
+        return self.upfront_completed / self.upfront_total
+
+    def pump(self, budget_seconds=None):
+        """Finish completed tasks in submission order; stop early once `budget_seconds` is spent.
+
+        Returns `ready`: True when only deferred tasks, if any, are left.
+        """
+        started = time.perf_counter()
+        pending, self._pending = self._pending, []
+        waiting = []
+        for index, task in enumerate(pending):
+            if budget_seconds is not None and time.perf_counter() - started > budget_seconds:
+                waiting.extend(pending[index:])
+                break
+            name, future, finish, deferred = task
+            if not future.done():
+                waiting.append(task)
+                continue
+            self.completed += 1
+            if not deferred:
+                self.upfront_completed += 1
+            try:
+                result = future.result()
+                if finish is not None:
+                    with self.deferred(deferred):
+                        finish(result)
+            except Exception as err:
+                print(f"Warning: failed to load '{name}': {err}")
+        # `finish` may have queued follow-up tasks.
+        self._pending = waiting + self._pending
+        return self.ready
+
+    def wait(self):
+        """Block until every task, including deferred ones and follow-ups, has finished."""
+        self.start_deferred()
+        self.pump()
+        while not self.done:
+            wait([task[1] for task in self._pending], return_when=FIRST_COMPLETED)
+            self.pump()
+
+    def close(self):
+        self.wait()
+        self._executor.shutdown()
+
+    def cancel(self):
+        """Drop unfinished work when quitting; unlike `close` it does not wait for it.
+
+        Held tasks never start and queued ones are cancelled. Tasks already
+        running complete, but their `finish` never runs.
+        """
+        self._held = []
+        self._pending = []
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        return {
+            "tasks": self.total,
+            "worker_ms": {
+                name: seconds * 1000.0 for name, seconds in sorted(self.worker_seconds.items())
+            },
+        }
@@ -0,0 +1,112 @@
+import threading
+import time
+
+
+class RenderPipeline:
+    """Draws and presents frames on a render thread while the main thread simulates.
+
+    The main thread builds immutable `Frame`s (`GameRenderer.game_frame` and
+    friends) and hands them to `submit`; the render thread draws and presents
+    them in order. Two slots are in flight at most: the frame being drawn and
+    one waiting, so the simulation runs at most one frame ahead and `submit`
+    only blocks when the render thread falls behind.
+
+    Anything that changes the display (fullscreen toggles, `invalidate`) must
+    `drain()` first. The SDL display calls happen on the render thread, which
+    the software backend tolerates on Windows and Linux; renderer-based
+    backends expect to stay on the thread that created them, and macOS only
+    allows window updates from the main thread, so `main.py` renders inline
+    there.
+    """
+
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self.frames_presented = 0
+        self.wait_seconds = 0.0
+        # Draw+present time of the last frame presented, and the running total.
+        self.last_render_seconds = 0.0
+        self.render_seconds = 0.0
+        self._pending = None
+        self._busy = False
+        self._closed = False
+        self._error = None
+        self._error_reported = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="render", daemon=True)
+        self._thread.start()
+
+    def submit(self, frame):
+        """Queue `frame` for drawing, waiting while the back slot is still taken."""
+        with self._condition:
+            self._raise_error()
+            if self._pending is not None:
+                started = time.perf_counter()
+                while self._pending is not None and self._error is None:
+                    self._condition.wait()
+                self.wait_seconds += time.perf_counter() - started
+                self._raise_error()
+            self._pending = frame
+            self._condition.notify_all()
+
+    def drain(self):
+        """Wait until every submitted frame has been presented."""
+        with self._condition:
+            while (self._pending is not None or self._busy) and self._error is None:
+                self._condition.wait()
+            self._raise_error()
+
+    def close(self, raise_error=True):
+        """Present what is queued, then stop the render thread.
+
+        A render thread error nobody has seen yet is raised here, unless
+        `raise_error` is false (the caller is already unwinding another error).
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        if raise_error and not self._error_reported:
+            self._raise_error()
+
+    def stats(self):
+        return {
+            "frames_presented": self.frames_presented,
+            "submit_wait_ms": self.wait_seconds * 1000.0,
+            "render_ms_mean": self.render_seconds * 1000.0 / max(1, self.frames_presented),
+        }
+
+    def _raise_error(self):
+        # The render thread stops on error, so it keeps being raised rather than hanging.
+        if self._error is not None:
+            self._error_reported = True
+            raise self._error
+
+    def _run(self):
+        renderer = self.renderer
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                frame = self._pending
+                if frame is None:
+                    return
+                self._pending = None
+                self._busy = True
+                self._condition.notify_all()
+            started = time.perf_counter()
+            try:
+                renderer.draw_frame(frame)
+                renderer.present()
+            except Exception as err:
+                with self._condition:
+                    self._error = err
+                    self._busy = False
+                    self._condition.notify_all()
+                return
+            elapsed = time.perf_counter() - started
+            with self._condition:
+                self.frames_presented += 1
+                self.last_render_seconds = elapsed
+                self.render_seconds += elapsed
+                self._busy = False
+                self._condition.notify_all()
@@ -0,0 +1,99 @@
+import threading
+from collections import namedtuple
+
+LAYER_BACKGROUND = 0
+LAYER_ASTEROIDS = 1
+LAYER_SHOTS = 2
+LAYER_SHIP = 3
+LAYER_EXPLOSIONS = 4
+LAYER_HUD = 5
+LAYER_COUNT = 6
+
+# An immutable frame: per-layer `(surface, dest)` tuples and `(position, draw)` callbacks.
+FrameSnapshot = namedtuple("FrameSnapshot", ("layers", "callbacks"))
+
+
+class RenderQueue:
+    """Collects a frame's blits by layer and submits each layer as one batch.
+
+    Entities emit `(surface, dest)` commands through `enqueue(queue)` instead
+    of blitting themselves. Layers are drawn in ascending order and commands
+    within a layer in submission order, so the result only depends on the
+    order things were submitted. Anything that cannot be expressed as a blit
+    (outline fallbacks, fills) goes in as a callback and runs between
+    batches in the same order.
+
+    `take()` turns the queued frame into a `FrameSnapshot` that can be drawn
+    later, possibly on another thread. Callbacks then must not read live
+    entity state, so entities bind the values they need when enqueuing.
+    The `batches`/`commands` counters are the only state `draw` touches; they
+    are updated under a lock and read together with `counters()`.
+    """
+
+    def __init__(self):
+        self.layers = [[] for _ in range(LAYER_COUNT)]
+        self.callbacks = [[] for _ in range(LAYER_COUNT)]
+        self.batches = 0
+        self.commands = 0
+        self._counter_lock = threading.Lock()
+
+    def submit(self, layer, surface, dest):
+        self.layers[layer].append((surface, dest))
+
+    def submit_callback(self, layer, draw):
+        """Queue `draw(screen)` at the current position in `layer`."""
+        self.callbacks[layer].append((len(self.layers[layer]), draw))
+
+    def enqueue_all(self, drawable, default_layer=LAYER_SHIP):
+        """Enqueue every item; items without `enqueue` are drawn as callbacks."""
+        for item in drawable:
+            enqueue = getattr(item, "enqueue", None)
+            if enqueue is not None:
+                enqueue(self)
+            else:
+                self.submit_callback(default_layer, item.draw)
+
+    def take(self):
+        """Return the queued frame as a `FrameSnapshot` and start an empty one."""
+        snapshot = FrameSnapshot(
+            tuple(tuple(commands) for commands in self.layers),
+            tuple(tuple(callbacks) for callbacks in self.callbacks),
+        )
+        for commands, callbacks in zip(self.layers, self.callbacks):
+            commands.clear()
+            callbacks.clear()
+        return snapshot
+
+    def flush(self, screen):
+        """Draw and clear every queued layer onto `screen`."""
+        self.draw(screen, self.take())
+
+    def draw(self, screen, snapshot):
+        """Draw a `FrameSnapshot` onto `screen`."""
+        blit_batch = getattr(screen, "fblits", None)
+        if blit_batch is None:
+            def blit_batch(commands):
+                screen.blits(commands, doreturn=False)
+
+        batches = 0
+        drawn = 0
+        for commands, callbacks in zip(snapshot.layers, snapshot.callbacks):
+            start = 0
+            for position, draw in callbacks:
+                if position > start:
+                    blit_batch(commands[start:position])
+                    batches += 1
+                draw(screen)
+                start = position
+            if start < len(commands):
+                blit_batch(commands[start:] if start else commands)
+                batches += 1
+            drawn += len(commands)
+        with self._counter_lock:
+            self.batches += batches
+            self.commands += drawn
+
+    def counters(self):
+        """Return `(batches, commands)` drawn so far, consistent with each other."""
+        with self._counter_lock:
+            return self.batches, self.commands
@@ -1,3 +1,6 @@
+from collections import namedtuple
+from functools import partial
+
 import pygame
 from game.config.constants import (
     SCREEN_HEIGHT,
@@ -8,131 +11,336 @@ from game.config.constants import (
     MENU_BACKGROUND_OPACITY,
     GAME_OVER_BACKGROUND_IMAGE_PATH,
     GAME_OVER_BACKGROUND_OPACITY,
-    GAME_BORDER_IMAGE_PATH,
-    GAME_BORDER_OVERFLOW_PX,
-    GAME_VIEW_PADDING_X,
-    GAME_VIEW_PADDING_Y,
+    LINE_WIDTH,
+    RENDER_BACKEND,
+    RENDER_DIRTY_RECTS_ENABLED,
+    RENDER_DIRTY_RECTS_MAX_AREA_RATIO,
     WINDOW_ICON_PATH,
 )
+from game.render.backend import create_backend, open_backend
+from game.render.frame import bake_opacity, frame_layout, frame_size, static_frame_layer
+from game.render.loader import decode_image
+from game.render.queue import LAYER_BACKGROUND, LAYER_HUD, RenderQueue
+from game.render.textcache import TextCache
 from game.utils.resources import asset_path
+from game.utils.trace import trace_phase
 
 MENU_HOVER_SCALE = 1.06
 MENU_HINT_TEXT = "F11: Toggle Fullscreen"
+# Slack around a shape's collision circle for outlines and the ship's buzz.
+DIRTY_RECT_PADDING_PX = LINE_WIDTH + 4
+
+SCENE_MENU = "menu"
+SCENE_GAME = "game"
+SCENE_GAME_OVER = "game_over"
+
+# One composed frame: its scene, the queued draw commands (a `FrameSnapshot`)
+# and, for gameplay, the rects sprites cover (used by dirty-rect mode).
+Frame = namedtuple("Frame", ("scene", "commands", "covered"))
+
+
+class _DirtyTrackingSurface(pygame.Surface):
+    """Game surface that records the rect of every blit in `dirty`."""
+
+    def __init__(self, size, display_surface):
+        super().__init__(size, 0, display_surface)
+        self.dirty = []
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        rect = super().blit(source, dest, area, special_flags)
+        self.dirty.append(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=1):
+        rects = super().blits(blit_sequence, doreturn=1)
+        self.dirty.extend(rects)
+        return rects if doreturn else None
+
+    def fblits(self, blit_sequence, special_flags=0):
+        self.blits(
+            [(source, dest, None, special_flags) for source, dest in blit_sequence],
+            doreturn=0,
+        )
 
 
 class GameRenderer:
-    def __init__(self, menu_options):
+    """Draws each scene into a fixed-size game surface and presents it centred on the display.
+
+    With `dirty_rects`, gameplay frames only restore and push the regions
+    sprites covered this frame or the last one. Menu and game-over frames,
+    fullscreen toggles and busy frames (dirty area above
+    `RENDER_DIRTY_RECTS_MAX_AREA_RATIO` of the view) fall back to a full flip.
+
+    `backend` picks how frames reach the screen (see `game.render.backend`);
+    software blits are the default and the fallback. `vsync` asks the backend
+    to present in step with the display's refresh. With an `AssetLoader`,
+    backgrounds and menu images load on its workers instead of in here.
+    """
+
+    # Background attribute, image and opacity; each is baked opaque over black.
+    _BACKGROUNDS = (
+        # The menu's first: it is the only one needed for the first interactive frame.
+        ("menu_background", MENU_BACKGROUND_IMAGE_PATH, MENU_BACKGROUND_OPACITY),
+        ("background", BACKGROUND_IMAGE_PATH, BACKGROUND_OPACITY),
+        ("game_over_background", GAME_OVER_BACKGROUND_IMAGE_PATH, GAME_OVER_BACKGROUND_OPACITY),
+    )
+
+    def __init__(
+        self,
+        menu_options,
+        dirty_rects=RENDER_DIRTY_RECTS_ENABLED,
+        backend=RENDER_BACKEND,
+        vsync=False,
+        loader=None,
+    ):
         self.menu_options = tuple(menu_options)
         self.fullscreen = True
+        self.backend = create_backend(backend, vsync)
         self.display_surface = self._create_display(self.fullscreen)
         self._set_window_icon(WINDOW_ICON_PATH)
-        self.game_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
-        pygame.display.set_caption("Asteroids")
-
-        self.title_font = pygame.font.SysFont(None, 96)
-        self.option_font = pygame.font.SysFont(None, 50)
-        self.hud_font = pygame.font.SysFont(None, 34)
-        self.hint_font = pygame.font.SysFont(None, 28)
-
-        self.background = self._load_background(BACKGROUND_IMAGE_PATH, BACKGROUND_OPACITY)
-        self.menu_background = self._load_background(
-            MENU_BACKGROUND_IMAGE_PATH,
-            MENU_BACKGROUND_OPACITY,
-        )
-        self.game_over_background = self._load_background(
-            GAME_OVER_BACKGROUND_IMAGE_PATH,
-            GAME_OVER_BACKGROUND_OPACITY,
-        )
-        self.game_border, self.game_border_overflow = self._load_game_border(
-            GAME_BORDER_IMAGE_PATH,
-            GAME_BORDER_OVERFLOW_PX,
+        self.dirty_rects = dirty_rects
+        if dirty_rects:
+            self.game_surface = _DirtyTrackingSurface(
+                (SCREEN_WIDTH, SCREEN_HEIGHT), self.display_surface
+            )
+        else:
+            self.game_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.backend.set_caption("Asteroids")
+        self.full_presents = 0
+        self.partial_presents = 0
+        self.static_layer = static_frame_layer(self.display_surface)
+        self._static_stale = True
+        self._full_redraw = True
+        self._drawn_scene = None
+        self._drawn_rects = []
+        self._frame_dirty = None
+        self._game_backdrop = None
+        self.render_queue = RenderQueue()
+
+        self.text_cache = TextCache()
+        self._hud_layer = None
+        self.hud_rebuilds = 0
+        # pygame's bundled default font; `SysFont(None, ...)` resolves to the
+        # same file but scans the system fonts (`fc-list`) first.
+        with trace_phase("fonts"):
+            self.title_font = pygame.font.Font(None, 96)
+            self.option_font = pygame.font.Font(None, 50)
+            self.hud_font = pygame.font.Font(None, 34)
+            self.hint_font = pygame.font.Font(None, 28)
+
+        self._menu_frames = {}
+        self._menu_frames_options = self.menu_options
+        if loader is None:
+            for attribute, image_path, opacity in self._BACKGROUNDS:
+                setattr(self, attribute, self._load_background(image_path, opacity))
+            self.menu_option_images = self._load_menu_option_images()
+        else:
+            self._submit_images(loader)
+
+    def _submit_images(self, loader):
+        """Decode and scale backgrounds and menu images on `loader`; they appear as tasks finish.
+
+        The menu's images come first; the gameplay and game over backgrounds are deferred.
+        """
+        self.background = self.menu_background = self.game_over_background = None
+        self.menu_option_images = {}
+        loader.submit(
+            "menu options",
+            partial(self._decode_menu_option_images, self._menu_option_heights()),
+            self._install_menu_option_images,
         )
-        self.menu_option_images = self._load_menu_option_images()
+        for attribute, image_path, opacity in self._BACKGROUNDS:
+            with loader.deferred(attribute != "menu_background"):
+                loader.submit(
+                    attribute.replace("_", " "),
+                    partial(self._decode_background, image_path),
+                    partial(self._install_background, attribute, opacity),
+                )
+
+    def _install_background(self, attribute, opacity, background):
+        setattr(self, attribute, self._bake_background(background, opacity))
+        self._game_backdrop = None
+        self._menu_frames = {}
+
+    def _install_menu_option_images(self, decoded):
+        self.menu_option_images = self._convert_menu_option_images(decoded)
+        self._menu_frames = {}
 
     def toggle_fullscreen(self):
         self.fullscreen = not self.fullscreen
         self.display_surface = self._create_display(self.fullscreen)
+        self.static_layer = static_frame_layer(self.display_surface, rebuild=True)
+        self.invalidate()
+
+    def invalidate(self):
+        """Force the next frame to redraw and flip everything (window exposed, mode change)."""
+        self._static_stale = True
+        self._full_redraw = True
+
+    def set_menu_options(self, menu_options):
+        """Replace the menu options, dropping images and frames built for the old set."""
+        self.menu_options = tuple(menu_options)
+        self.menu_option_images = self._load_menu_option_images()
+        self._menu_frames = {}
+        self._menu_frames_options = self.menu_options
 
     def render_menu(self, selected_option):
-        screen = self.game_surface
-        screen.fill("black")
-        if self.menu_background:
-            screen.blit(self.menu_background, (0, 0))
+        self.draw_frame(self.menu_frame(selected_option))
+
+    def render_game(self, drawable, health, max_health):
+        self.draw_frame(self.game_frame(drawable, health, max_health))
+
+    def render_game_over(self, drawable):
+        self.draw_frame(self.game_over_frame(drawable))
+
+    def menu_frame(self, selected_option):
+        """Build the menu as a `Frame`; nothing on it animates, so each selection is composed once."""
+        if self._menu_frames_options != self.menu_options:
+            self.set_menu_options(self.menu_options)
+        frame = self._menu_frames.get(selected_option)
+        if frame is None:
+            frame = self._compose_menu_frame(selected_option)
+            self._menu_frames[selected_option] = frame
+        self.render_queue.submit(LAYER_BACKGROUND, frame, (0, 0))
+        return Frame(SCENE_MENU, self.render_queue.take(), ())
+
+    def _compose_menu_frame(self, selected_option):
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._blit_background(screen, self.menu_background)
 
         base_y = SCREEN_HEIGHT * 0.7
         spacing = 56
         for idx, option in enumerate(self.menu_options):
-            state = "hover" if idx == selected_option else "default"
+            state = "hover_scaled" if idx == selected_option else "default"
             image = self.menu_option_images.get(option, {}).get(state)
 
             if image:
-                if idx == selected_option:
-                    scaled_size = (
-                        max(1, int(round(image.get_width() * MENU_HOVER_SCALE))),
-                        max(1, int(round(image.get_height() * MENU_HOVER_SCALE))),
-                    )
-                    image = pygame.transform.smoothscale(image, scaled_size)
                 image_rect = image.get_rect(center=(SCREEN_WIDTH / 2, base_y + idx * spacing))
                 screen.blit(image, image_rect)
             else:
                 color = "white" if idx == selected_option else (170, 170, 170)
-                label = self.option_font.render(option, True, color)
+                label = self.text_cache.render(self.option_font, option, color)
                 label_rect = label.get_rect(center=(SCREEN_WIDTH / 2, base_y + idx * spacing))
                 screen.blit(label, label_rect)
 
-        hint = self.hint_font.render(MENU_HINT_TEXT, True, (140, 140, 140))
+        hint = self.text_cache.render(self.hint_font, MENU_HINT_TEXT, (140, 140, 140))
         hint_rect = hint.get_rect(midbottom=(SCREEN_WIDTH / 2, SCREEN_HEIGHT - 70))
         screen.blit(hint, hint_rect)
+        return screen
 
-    def render_game(self, drawable, health, max_health):
-        screen = self.game_surface
-        screen.fill("black")
-        if self.background:
-            screen.blit(self.background, (0, 0))
-        for item in drawable:
-            item.draw(screen)
-        self._draw_health_ui(health, max_health)
+    def game_frame(self, drawable, health, max_health):
+        """Build a gameplay `Frame` from the current (interpolated) entity state."""
+        queue = self.render_queue
+        covered = []
+        if self.dirty_rects:
+            # The backdrop is restored under last frame's rects instead of redrawn.
+            for item in drawable:
+                radius = getattr(item, "radius", None)
+                if radius is not None and hasattr(item, "position"):
+                    reach = int(radius) + DIRTY_RECT_PADDING_PX
+                    covered.append(
+                        pygame.Rect(
+                            int(item.position.x) - reach,
+                            int(item.position.y) - reach,
+                            reach * 2,
+                            reach * 2,
+                        )
+                    )
+        else:
+            queue.submit(LAYER_BACKGROUND, self._get_game_backdrop(), (0, 0))
+        queue.enqueue_all(drawable)
+        covered.append(self._queue_health_ui(health, max_health))
+        return Frame(SCENE_GAME, queue.take(), tuple(covered))
 
-    def render_game_over(self, drawable):
-        screen = self.game_surface
-        screen.fill("black")
+    def game_over_frame(self, drawable):
+        queue = self.render_queue
         if self.game_over_background:
-            screen.blit(self.game_over_background, (0, 0))
+            queue.submit(LAYER_BACKGROUND, self.game_over_background, (0, 0))
+        else:
+            # Fallback to the current game frame if game-over background is missing.
+            queue.submit(LAYER_BACKGROUND, self._get_game_backdrop(), (0, 0))
+            queue.enqueue_all(drawable)
+        return Frame(SCENE_GAME_OVER, queue.take(), ())
+
+    def draw_frame(self, frame):
+        """Draw a `Frame` into the game surface, ready for `present`."""
+        entering = frame.scene != self._drawn_scene
+        self._drawn_scene = frame.scene
+        if frame.scene == SCENE_GAME and self.dirty_rects:
+            if entering:
+                # The surface still shows the menu or game over screen, not the backdrop.
+                self._full_redraw = True
+            self._draw_game_frame_dirty(frame)
             return
+        self.render_queue.draw(self.game_surface, frame.commands)
+
+    def _draw_game_frame_dirty(self, frame):
+        screen = self.game_surface
+        backdrop = self._get_game_backdrop()
+        if self._full_redraw:
+            screen.blit(backdrop, (0, 0))
+        else:
+            for rect in self._drawn_rects:
+                screen.blit(backdrop, rect, rect)
 
-        # Fallback to the current game frame if game-over background is missing.
-        if self.background:
-            screen.blit(self.background, (0, 0))
-        for item in drawable:
-            item.draw(screen)
+        screen.dirty = []
+        self.render_queue.draw(screen, frame.commands)
+        screen.dirty.extend(frame.covered)
+
+        bounds = screen.get_rect()
+        drawn = [rect.clip(bounds) for rect in screen.dirty]
+        drawn = [rect for rect in drawn if rect.width and rect.height]
+        self._frame_dirty = self._drawn_rects + drawn
+        self._drawn_rects = drawn
+
+    def _get_game_backdrop(self):
+        if self._game_backdrop is None:
+            backdrop = self.background
+            if backdrop is None:
+                backdrop = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+                backdrop.fill("black")
+            self._game_backdrop = backdrop
+        return self._game_backdrop
+
+    @staticmethod
+    def _blit_background(screen, background):
+        # Backgrounds are opaque with their opacity baked in: one copy, no clear.
+        if background:
+            screen.blit(background, (0, 0))
+        else:
+            screen.fill("black")
 
     def present(self):
-        self.display_surface.fill("black")
-        display_width, display_height = self.display_surface.get_size()
-        frame_width, frame_height = self.get_frame_size()
-        frame_left = max(0, (display_width - frame_width) // 2)
-        frame_top = max(0, (display_height - frame_height) // 2)
-
-        if self.game_border is not None:
-            self.display_surface.blit(
-                self.game_border,
-                (
-                    frame_left - self.game_border_overflow,
-                    frame_top - self.game_border_overflow,
-                ),
-            )
+        dirty = self._frame_dirty
+        self._frame_dirty = None
+        if self.dirty_rects:
+            self.game_surface.dirty = []
+        if dirty is not None and not self._full_redraw:
+            max_area = SCREEN_WIDTH * SCREEN_HEIGHT * RENDER_DIRTY_RECTS_MAX_AREA_RATIO
+            if sum(rect.width * rect.height for rect in dirty) <= max_area:
+                self._present_dirty(dirty)
+                return
 
-        game_left = frame_left + GAME_VIEW_PADDING_X
-        game_top = frame_top + GAME_VIEW_PADDING_Y
-        self.display_surface.blit(self.game_surface, (game_left, game_top))
-        pygame.display.flip()
+        self._full_redraw = False
+        self.full_presents += 1
+        # The game view covers the middle of the static layer, so the layer
+        # only goes back on screen after a mode change or lost window contents.
+        self.backend.present(
+            self.static_layer, self.game_surface, self._game_origin(), self._static_stale
+        )
+        self._static_stale = False
+
+    def _present_dirty(self, dirty):
+        self.backend.present_rects(self.game_surface, self._game_origin(), dirty)
+        self.partial_presents += 1
+
+    def _game_origin(self):
+        game_rect, _, _ = frame_layout(self.display_surface.get_size())
+        return game_rect.topleft
 
     @staticmethod
     def get_frame_size():
-        return (
-            SCREEN_WIDTH + (GAME_VIEW_PADDING_X * 2),
-            SCREEN_HEIGHT + (GAME_VIEW_PADDING_Y * 2),
-        )
+        return frame_size()
 
     @staticmethod
     def _menu_option_key(option):
@@ -140,9 +348,13 @@ class GameRenderer:
 
     @staticmethod
     def _load_background(image_path, opacity):
-        opacity = max(0, min(255, opacity))
+        return GameRenderer._bake_background(GameRenderer._decode_background(image_path), opacity)
+
+    @staticmethod
+    def _decode_background(image_path):
+        """Load `image_path` cropped to cover the game view, unconverted; None if missing."""
         try:
-            image = pygame.image.load(image_path).convert()
+            image = decode_image(image_path)
         except Exception as err:
             print(f"Warning: failed to load background image '{image_path}': {err}")
             return None
@@ -159,23 +371,39 @@ class GameRenderer:
         offset_x = (scaled_size[0] - SCREEN_WIDTH) // 2
         offset_y = (scaled_size[1] - SCREEN_HEIGHT) // 2
         background.blit(scaled, (-offset_x, -offset_y))
-        background.set_alpha(opacity)
         return background
 
+    @staticmethod
+    def _bake_background(background, opacity):
+        if background is None:
+            return None
+        return bake_opacity(background, max(0, min(255, opacity)))
+
     def _load_menu_option_images(self):
-        images = {}
+        decoded = self._decode_menu_option_images(self._menu_option_heights())
+        return self._convert_menu_option_images(decoded)
+
+    def _menu_option_heights(self):
+        """Return each option's image height, matching its rendered label."""
+        heights = {}
         for option in self.menu_options:
-            _, text_height = self.option_font.render(option, True, "white").get_size()
-            target_height = max(1, text_height)
+            _, text_height = self.text_cache.render(self.option_font, option, "white").get_size()
+            heights[option] = max(1, text_height)
+        return heights
 
+    @classmethod
+    def _decode_menu_option_images(cls, heights):
+        """Load and scale the option images for `heights`, unconverted."""
+        images = {}
+        for option, target_height in heights.items():
             option_images = {}
             for state in ("default", "hover"):
                 image_path = asset_path(
                     "images",
-                    f"{self._menu_option_key(option)}-{state}.png",
+                    f"{cls._menu_option_key(option)}-{state}.png",
                 )
                 try:
-                    image = pygame.image.load(image_path).convert_alpha()
+                    image = decode_image(image_path)
                 except Exception as err:
                     print(f"Warning: failed to load menu option image '{image_path}': {err}")
                     option_images[state] = None
@@ -188,52 +416,81 @@ class GameRenderer:
                 )
                 option_images[state] = pygame.transform.smoothscale(image, scaled_size)
 
+            hover = option_images.get("hover")
+            if hover is not None:
+                option_images["hover_scaled"] = pygame.transform.smoothscale(
+                    hover,
+                    (
+                        max(1, int(round(hover.get_width() * MENU_HOVER_SCALE))),
+                        max(1, int(round(hover.get_height() * MENU_HOVER_SCALE))),
+                    ),
+                )
+
             images[option] = option_images
         return images
 
-    def _load_game_border(self, image_path, overflow_px):
-        try:
-            border = pygame.image.load(image_path).convert_alpha()
-        except Exception as err:
-            print(f"Warning: failed to load game border image '{image_path}': {err}")
-            return None, 0
+    @staticmethod
+    def _convert_menu_option_images(decoded):
+        return {
+            option: {
+                state: None if image is None else image.convert_alpha()
+                for state, image in option_images.items()
+            }
+            for option, option_images in decoded.items()
+        }
 
-        frame_width, frame_height = self.get_frame_size()
-        target_size = (
-            frame_width + (overflow_px * 2),
-            frame_height + (overflow_px * 2),
+    def _create_display(self, fullscreen):
+        self.backend, display_surface = open_backend(
+            self.backend, self.get_frame_size(), fullscreen
         )
-        border = pygame.transform.scale(border, target_size)
-        return border, overflow_px
+        return display_surface
 
-    @classmethod
-    def _create_display(cls, fullscreen):
-        frame_width, frame_height = cls.get_frame_size()
-        if fullscreen:
-            return pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        return pygame.display.set_mode((frame_width, frame_height))
+    def _queue_health_ui(self, health, max_health):
+        """Queue the hull label and pips on the HUD layer; return the rect they cover."""
+        key = (health, max_health)
+        if self._hud_layer is None or self._hud_layer[0] != key:
+            self._hud_layer = (key, *self._build_health_ui(health, max_health))
+            self.hud_rebuilds += 1
+        _, parts, rect = self._hud_layer
+        for surface, position in parts:
+            self.render_queue.submit(LAYER_HUD, surface, position)
+        return rect
 
-    def _draw_health_ui(self, health, max_health):
+    def _build_health_ui(self, health, max_health):
+        """Render the HUD for these inputs into `(parts, rect)`; parts are `(surface, position)`."""
         margin = 20
-        label = self.hud_font.render(f"Hull {health}/{max_health}", True, (235, 235, 235))
+        label = self.text_cache.render(self.hud_font, f"Hull {health}/{max_health}", (235, 235, 235))
         label_rect = label.get_rect(topright=(SCREEN_WIDTH - margin, margin))
-        self.game_surface.blit(label, label_rect)
 
         pip_radius = 7
         pip_spacing = 9
         total_width = (pip_radius * 2 * max_health) + (pip_spacing * max(0, max_health - 1))
         start_x = SCREEN_WIDTH - margin - total_width
         y = label_rect.bottom + 8
+        pips = pygame.Surface((max(1, total_width), pip_radius * 2), pygame.SRCALPHA)
         for idx in range(max_health):
-            x = start_x + pip_radius + idx * ((pip_radius * 2) + pip_spacing)
+            x = pip_radius + idx * ((pip_radius * 2) + pip_spacing)
             color = (95, 220, 140) if idx < health else (70, 70, 70)
-            pygame.draw.circle(self.game_surface, color, (x, y + pip_radius), pip_radius)
-            pygame.draw.circle(self.game_surface, (225, 225, 225), (x, y + pip_radius), pip_radius, 1)
+            pygame.draw.circle(pips, color, (x, pip_radius), pip_radius)
+            pygame.draw.circle(pips, (225, 225, 225), (x, pip_radius), pip_radius, 1)
+        pips_rect = pygame.Rect(start_x, y, total_width, pip_radius * 2)
+        parts = ((label, label_rect.topleft), (pips, pips_rect.topleft))
+        return parts, label_rect.union(pips_rect)
 
-    @staticmethod
-    def _set_window_icon(image_path):
+    def render_stats(self):
+        queue_batches, queue_commands = self.render_queue.counters()
+        return {
+            "text_cache": self.text_cache.stats(),
+            "hud_rebuilds": self.hud_rebuilds,
+            "queue_batches": queue_batches,
+            "queue_commands": queue_commands,
+            "full_presents": self.full_presents,
+            "partial_presents": self.partial_presents,
+        }
+
+    def _set_window_icon(self, image_path):
         try:
             icon = pygame.image.load(image_path)
-            pygame.display.set_icon(icon)
+            self.backend.set_icon(icon)
         except Exception as err:
             print(f"Warning: failed to load window icon '{image_path}': {err}")
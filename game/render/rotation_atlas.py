@@ -0,0 +1,156 @@
+import threading
+from functools import partial
+
+import pygame
+from game.config.constants import (
+    PLAYER_INVULNERABLE_SPRITE_PATH,
+    PLAYER_RADIUS,
+    PLAYER_SPRITE_PATH,
+    PLAYER_SPRITE_SIZE_MULTIPLIER,
+    ROTATION_ATLAS_STEP_DEGREES,
+    SHOT_RADIUS,
+    SHOT_SPRITE_PATH,
+    SHOT_SPRITE_SIZE_MULTIPLIER,
+)
+from game.render.loader import decode_image
+
+SHIP = "ship"
+SHIP_INVULNERABLE = "ship_invulnerable"
+MISSILE = "missile"
+
+# Atlas name -> (sprite path, longest side after scaling).
+_SOURCES = {
+    SHIP: (PLAYER_SPRITE_PATH, PLAYER_RADIUS * PLAYER_SPRITE_SIZE_MULTIPLIER),
+    SHIP_INVULNERABLE: (
+        PLAYER_INVULNERABLE_SPRITE_PATH,
+        PLAYER_RADIUS * PLAYER_SPRITE_SIZE_MULTIPLIER,
+    ),
+    MISSILE: (SHOT_SPRITE_PATH, SHOT_RADIUS * SHOT_SPRITE_SIZE_MULTIPLIER),
+}
+
+_BASE_SPRITES = {}
+_ATLASES = {}
+_BUILD_LOCK = threading.Lock()
+
+
+class RotationAtlas:
+    """Every rotation of one sprite at a fixed angular step, built up front."""
+
+    def __init__(self, base, step_degrees=ROTATION_ATLAS_STEP_DEGREES):
+        self.base = base
+        self.step_degrees = max(1, int(step_degrees))
+        self.frames = [
+            pygame.transform.rotozoom(base, angle, 1.0)
+            for angle in range(0, 360, self.step_degrees)
+        ]
+
+    def sprite_for(self, angle):
+        """Return the frame nearest `angle` (degrees, counter-clockwise like rotozoom)."""
+        return self.frames[int(round(angle / self.step_degrees)) % len(self.frames)]
+
+    def memory_bytes(self):
+        return sum(
+            frame.get_bytesize() * frame.get_width() * frame.get_height()
+            for frame in self.frames
+        )
+
+
+def load_scaled_sprite(sprite_path, target_size):
+    """Load `sprite_path` scaled so its longest side is `target_size`; None if missing."""
+    sprite = decode_scaled_sprite(sprite_path, target_size)
+    return None if sprite is None else sprite.convert_alpha()
+
+
+def decode_scaled_sprite(sprite_path, target_size):
+    """`load_scaled_sprite` without the display conversion, safe on a worker thread."""
+    if not sprite_path:
+        return None
+    target_size = max(1, int(target_size))
+    try:
+        sprite = decode_image(sprite_path)
+    except Exception as err:
+        print(f"Warning: failed to load sprite '{sprite_path}': {err}")
+        return None
+
+    src_width, src_height = sprite.get_size()
+    scale = min(target_size / src_width, target_size / src_height)
+    scaled_size = (
+        max(1, int(src_width * scale)),
+        max(1, int(src_height * scale)),
+    )
+    return pygame.transform.smoothscale(sprite, scaled_size)
+
+
+def _base_sprite(name):
+    if name not in _BASE_SPRITES:
+        _BASE_SPRITES[name] = load_scaled_sprite(*_SOURCES[name])
+    return _BASE_SPRITES[name]
+
+
+def rotation_atlas(name, step_degrees=ROTATION_ATLAS_STEP_DEGREES):
+    """Return the shared atlas for `name`, building it on first use; None without a sprite.
+
+    Atlases live for the whole process, so every session after the first
+    (and every ship and missile within one) starts with all rotations ready.
+    """
+    key = (name, max(1, int(step_degrees)))
+    if key in _ATLASES:
+        return _ATLASES[key]
+    with _BUILD_LOCK:
+        if key not in _ATLASES:
+            base = _base_sprite(name)
+            _ATLASES[key] = None if base is None else RotationAtlas(base, key[1])
+    return _ATLASES[key]
+
+
+def prewarm_rotation_atlases(step_degrees=ROTATION_ATLAS_STEP_DEGREES):
+    """Build the ship, invulnerable ship and missile atlases on the calling thread.
+
+    Startup builds them on an `AssetLoader` instead (`submit_rotation_atlases`).
+    """
+    for name in _SOURCES:
+        rotation_atlas(name, step_degrees)
+
+
+def submit_rotation_atlases(loader, step_degrees=ROTATION_ATLAS_STEP_DEGREES):
+    """Build the atlases on `loader`'s workers; only converting the frames is left to `pump`."""
+    step_degrees = max(1, int(step_degrees))
+    for name, (sprite_path, target_size) in _SOURCES.items():
+        if (name, step_degrees) in _ATLASES:
+            continue
+        loader.submit(
+            f"{name} atlas",
+            partial(_decode_atlas, sprite_path, target_size, step_degrees),
+            partial(_install_atlas, name, step_degrees),
+        )
+
+
+def _decode_atlas(sprite_path, target_size, step_degrees):
+    base = decode_scaled_sprite(sprite_path, target_size)
+    return None if base is None else RotationAtlas(base, step_degrees)
+
+
+def _install_atlas(name, step_degrees, atlas):
+    if atlas is not None:
+        atlas.base = atlas.base.convert_alpha()
+        atlas.frames = [frame.convert_alpha() for frame in atlas.frames]
+    with _BUILD_LOCK:
+        _BASE_SPRITES.setdefault(name, None if atlas is None else atlas.base)
+        _ATLASES.setdefault((name, step_degrees), atlas)
+
+
+def rotation_atlas_stats():
+    """Return frame counts and pixel memory for every atlas built so far."""
+    atlases = {}
+    for (name, step_degrees), atlas in sorted(_ATLASES.items()):
+        if atlas is None:
+            continue
+        atlases[f"{name}@{step_degrees}"] = {
+            "step_degrees": step_degrees,
+            "frames": len(atlas.frames),
+            "bytes": atlas.memory_bytes(),
+        }
+    return {
+        "atlases": atlases,
+        "total_bytes": sum(entry["bytes"] for entry in atlases.values()),
+    }
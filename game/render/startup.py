@@ -1,15 +1,16 @@
 import pygame
 from game.config.constants import (
-    SCREEN_WIDTH,
-    SCREEN_HEIGHT,
-    GAME_VIEW_PADDING_X,
-    GAME_VIEW_PADDING_Y,
     GAME_BORDER_IMAGE_PATH,
     GAME_BORDER_OVERFLOW_PX,
+    ASSET_LOADER_PUMP_BUDGET_MS,
+    LOADING_BAR_BOTTOM_MARGIN_PX,
+    LOADING_BAR_HEIGHT_PX,
+    LOADING_BAR_WIDTH_RATIO,
     LOADING_IMAGE_PATH,
     LOADING_IMAGE_OPACITY,
     LOADING_MIN_DURATION_SECONDS,
 )
+from game.render.frame import bake_opacity, frame_layout, static_frame_layer
 
 
 class StartupScreen:
@@ -27,46 +28,67 @@ class StartupScreen:
         self.border_path = border_path
         self.border_overflow_px = max(0, int(border_overflow_px))
 
+        # When set (a `game.render.backend` backend), frames are presented through it.
+        self.backend = None
         self._start_ms = None
         self._source = None
         self._load_attempted = False
         self._scaled_cache = {}
-        self._border = None
-        self._border_load_attempted = False
+        self._progress_view = None
 
     def start(self):
         self._start_ms = pygame.time.get_ticks()
 
-    def render_step(self, display_surface):
+    def render_step(self, display_surface, progress=None):
+        """Paint one loading frame; `progress` (0.0-1.0) adds a progress bar."""
         if not self._consume_events():
             return False
 
-        display_surface.fill((0, 0, 0))
-        game_rect, frame_left, frame_top = self._layout(display_surface.get_size())
-
+        game_rect, _, _ = self._layout(display_surface.get_size())
         background = self._scaled_background((game_rect.width, game_rect.height))
+        if progress is not None:
+            background = self._with_progress_bar(background, game_rect.size, progress)
+        if self.backend is not None:
+            layer = static_frame_layer(display_surface, self.border_path, self.border_overflow_px)
+            self.backend.present(layer, background, game_rect.topleft)
+            return True
+
+        self._draw_border(display_surface)
         if background is not None:
             display_surface.blit(background, game_rect.topleft)
-
-        self._draw_border(display_surface, frame_left, frame_top)
         pygame.display.flip()
         return True
 
-    def hold_until_min_duration(self, display_surface, clock):
+    def hold_until_min_duration(self, display_surface, clock, loader=None):
+        """Keep repainting until the minimum duration has passed, paced by `clock`.
+
+        With an `AssetLoader`, each frame also finishes completed tasks and
+        shows their progress, and the screen stays up until the loader is
+        `ready`. Time left over after that starts its deferred tasks.
+        """
         if self._start_ms is None:
             self.start()
         elapsed_seconds = (pygame.time.get_ticks() - self._start_ms) / 1000.0
         remaining = max(0.0, self.min_duration_seconds - elapsed_seconds)
-        while remaining > 0.0:
-            if not self.render_step(display_surface):
+        budget_seconds = ASSET_LOADER_PUMP_BUDGET_MS / 1000.0
+        while True:
+            loaded = loader is None or loader.pump(budget_seconds)
+            if remaining <= 0.0 and loaded:
+                return True
+            if loaded and loader is not None:
+                # Time to spare: let the deferred tasks use it.
+                loader.start_deferred()
+            progress = None if loader is None else loader.progress()
+            if not self.render_step(display_surface, progress):
                 return False
-            remaining -= clock.tick(60) / 1000.0
-        return True
+            remaining -= clock.tick() / 1000.0
 
     @staticmethod
     def _consume_events():
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            # With the texture-present backend a hidden display window stays open, so
+            # closing the visible one sends WINDOWCLOSE but no QUIT.
+            if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                 return False
         return True
 
@@ -100,54 +122,39 @@ class StartupScreen:
         offset_x = (scaled_size[0] - target_width) // 2
         offset_y = (scaled_size[1] - target_height) // 2
         background.blit(scaled, (-offset_x, -offset_y))
-        background.set_alpha(self.image_opacity)
+        background = bake_opacity(background, self.image_opacity)
         self._scaled_cache[target_size] = background
         return background
 
+    def _with_progress_bar(self, background, size, progress):
+        """Return the loading view with the bar drawn over it, in a reused surface."""
+        view = self._progress_view
+        if view is None or view.get_size() != size:
+            view = pygame.Surface(size).convert()
+            self._progress_view = view
+        if background is None:
+            view.fill("black")
+        else:
+            view.blit(background, (0, 0))
+
+        width, height = size
+        bar_width = int(width * LOADING_BAR_WIDTH_RATIO)
+        outline = pygame.Rect(0, 0, bar_width, LOADING_BAR_HEIGHT_PX)
+        outline.midbottom = (width // 2, height - LOADING_BAR_BOTTOM_MARGIN_PX)
+        filled = outline.inflate(-4, -4)
+        filled.width = int(filled.width * max(0.0, min(1.0, progress)))
+        pygame.draw.rect(view, (235, 235, 235), outline, 1)
+        if filled.width > 0:
+            pygame.draw.rect(view, (95, 220, 140), filled)
+        return view
+
     @staticmethod
     def _layout(display_size):
-        display_width, display_height = display_size
-        frame_width = SCREEN_WIDTH + (GAME_VIEW_PADDING_X * 2)
-        frame_height = SCREEN_HEIGHT + (GAME_VIEW_PADDING_Y * 2)
-        frame_left = max(0, (display_width - frame_width) // 2)
-        frame_top = max(0, (display_height - frame_height) // 2)
-        game_rect = pygame.Rect(
-            frame_left + GAME_VIEW_PADDING_X,
-            frame_top + GAME_VIEW_PADDING_Y,
-            SCREEN_WIDTH,
-            SCREEN_HEIGHT,
-        )
-        return game_rect, frame_left, frame_top
+        return frame_layout(display_size)
 
-    def _draw_border(self, display_surface, frame_left, frame_top):
-        border = self._load_border()
-        if border is None:
-            return
+    def _draw_border(self, display_surface):
+        """Blit the letterbox and border layer shared with `GameRenderer`."""
         display_surface.blit(
-            border,
-            (
-                frame_left - self.border_overflow_px,
-                frame_top - self.border_overflow_px,
-            ),
-        )
-
-    def _load_border(self):
-        if self._border_load_attempted:
-            return self._border
-
-        self._border_load_attempted = True
-        try:
-            border = pygame.image.load(self.border_path).convert_alpha()
-        except Exception as err:
-            print(f"Warning: failed to load startup border '{self.border_path}': {err}")
-            self._border = None
-            return self._border
-
-        frame_width = SCREEN_WIDTH + (GAME_VIEW_PADDING_X * 2)
-        frame_height = SCREEN_HEIGHT + (GAME_VIEW_PADDING_Y * 2)
-        target_size = (
-            frame_width + (self.border_overflow_px * 2),
-            frame_height + (self.border_overflow_px * 2),
+            static_frame_layer(display_surface, self.border_path, self.border_overflow_px),
+            (0, 0),
         )
-        self._border = pygame.transform.smoothscale(border, target_size)
-        return self._border
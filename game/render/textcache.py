@@ -0,0 +1,52 @@
+from collections import OrderedDict
+import pygame
+from game.config.constants import TEXT_CACHE_CAPACITY
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by font, string and colour.
+
+    HUD and menu text changes far less often than it is drawn, so each
+    distinct label is rendered once and reused until it falls out of the
+    cache. Returned surfaces are shared; do not draw onto them.
+    """
+
+    def __init__(self, capacity=TEXT_CACHE_CAPACITY):
+        self.capacity = max(1, int(capacity))
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(pygame.Color(color)), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._surfaces),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -1,5 +1,5 @@
 import pygame
-import random
+from game.core import rng
 from game.entities.asteroid import Asteroid
 from game.config.constants import (
     ASTEROID_MAX_RADIUS,
@@ -12,6 +12,11 @@ from game.config.constants import (
 
 
 class AsteroidField(pygame.sprite.Sprite):
+    # When set, asteroids are spawned into this `EntityWorld` instead of sprite Groups.
+    world = None
+    # When set, a `SpawnGovernor` that may delay or hold back due spawns.
+    governor = None
+
     edges = [
         [
             pygame.Vector2(1, 0),
@@ -39,20 +44,34 @@ class AsteroidField(pygame.sprite.Sprite):
         pygame.sprite.Sprite.__init__(self, self.containers)
         self.spawn_timer = 0.0
 
+    def snapshot(self):
+        return {"spawn_timer": self.spawn_timer}
+
+    def restore(self, state):
+        self.spawn_timer = state["spawn_timer"]
+
     def spawn(self, radius, position, velocity):
-        asteroid = Asteroid(position.x, position.y, radius)
+        if self.world is not None:
+            self.world.spawn_asteroid(position.x, position.y, radius, velocity)
+            return
+        asteroid = Asteroid.spawn(position.x, position.y, radius)
         asteroid.velocity = velocity
 
     def update(self, dt):
         self.spawn_timer += dt
         if self.spawn_timer > ASTEROID_SPAWN_RATE_SECONDS:
+            if self.governor is not None and not self.governor.spawn_due(
+                self.spawn_timer, ASTEROID_SPAWN_RATE_SECONDS
+            ):
+                return
             self.spawn_timer = 0
 
             # spawn a new asteroid at a random edge
-            edge = random.choice(self.edges)
-            speed = random.randint(40, 100)
+            field_rng = rng.stream(rng.ASTEROID_FIELD)
+            edge = field_rng.choice(self.edges)
+            speed = field_rng.randint(40, 100)
             velocity = edge[0] * speed
-            velocity = velocity.rotate(random.randint(-30, 30))
-            position = edge[1](random.uniform(0, 1))
-            kind = random.randint(1, ASTEROID_KINDS)
+            velocity = velocity.rotate(field_rng.randint(-30, 30))
+            position = edge[1](field_rng.uniform(0, 1))
+            kind = field_rng.randint(1, ASTEROID_KINDS)
             self.spawn(ASTEROID_MIN_RADIUS * kind, position, velocity)
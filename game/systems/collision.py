@@ -0,0 +1,186 @@
+import numpy as np
+from game.config.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+_EMPTY_INDEX = np.empty(0, dtype=np.intp)
+_NEIGHBOUR_COLS = np.array([-1, 0, 1, -1, 0, 1, -1, 0, 1], dtype=np.int64)
+_NEIGHBOUR_ROWS = np.array([-1, -1, -1, 0, 0, 0, 1, 1, 1], dtype=np.int64)
+
+
+def pack_circles(shapes):
+    """Pack `shapes` into contiguous `(positions[n, 2], radii[n])` float64 arrays.
+
+    Row `i` belongs to the `i`-th shape in iteration order, so hit indices map
+    straight back onto the list the caller packed.
+    """
+    count = len(shapes)
+    packed = np.fromiter(
+        (
+            value
+            for shape in shapes
+            for value in (shape.position.x, shape.position.y, shape.radius)
+        ),
+        dtype=np.float64,
+        count=count * 3,
+    ).reshape(count, 3)
+    return packed[:, :2], packed[:, 2]
+
+
+def pack_swept_circles(shapes):
+    """Like `pack_circles`, plus each shape's `previous_position` at the start of the tick.
+
+    Returns `(start_positions[n, 2], positions[n, 2], radii[n])`; see
+    `sweep_starts` for how screen wraps are handled.
+    """
+    count = len(shapes)
+    previous = np.fromiter(
+        (value for shape in shapes for value in shape.previous_position),
+        dtype=np.float64,
+        count=count * 2,
+    ).reshape(count, 2)
+    positions, radii = pack_circles(shapes)
+    return sweep_starts(previous, positions), positions, radii
+
+
+def sweep_starts(previous_positions, positions, width=SCREEN_WIDTH, height=SCREEN_HEIGHT):
+    """Return sweep start points, collapsing any shape that wrapped onto its end position.
+
+    A wrap teleports a shape across the screen, which is not motion to sweep;
+    like interpolation, such shapes are tested at their end position only.
+    """
+    delta = np.abs(positions - previous_positions)
+    wrapped = (delta[:, 0] > width / 2) | (delta[:, 1] > height / 2)
+    if not wrapped.any():
+        return previous_positions
+    starts = previous_positions.copy()
+    starts[wrapped] = positions[wrapped]
+    return starts
+
+
+def _cell_keys(positions, grid):
+    cells = np.floor_divide(positions + grid.margin, grid.cell_size).astype(np.int64)
+    return cells[:, 0] % grid.cols, cells[:, 1] % grid.rows
+
+
+def candidate_pairs(query_positions, target_positions, grid=None):
+    """Return `(query_idx, target_idx)` for every pair worth an exact test.
+
+    With a `SpatialHash` the candidates are limited to targets in the 3x3
+    cells around each query, computed with the grid's wrapped cell mapping but
+    without touching its Python buckets. Without one, every pair is returned.
+    The grid only limits pairs to neighbours: on a fixed-size screen the
+    neighbours per cell grow with entity count, so the candidates still grow
+    roughly quadratically once cells fill up.
+    """
+    query_count = len(query_positions)
+    target_count = len(target_positions)
+    if query_count == 0 or target_count == 0:
+        return _EMPTY_INDEX, _EMPTY_INDEX
+
+    if grid is None or grid.cols < 3 or grid.rows < 3:
+        query_idx, target_idx = np.divmod(np.arange(query_count * target_count), target_count)
+        return query_idx, target_idx
+
+    target_col, target_row = _cell_keys(target_positions, grid)
+    target_keys = target_row * grid.cols + target_col
+    order = np.argsort(target_keys, kind="stable")
+    sorted_keys = target_keys[order]
+
+    query_col, query_row = _cell_keys(query_positions, grid)
+    neighbour_col = (query_col[:, None] + _NEIGHBOUR_COLS[None, :]) % grid.cols
+    neighbour_row = (query_row[:, None] + _NEIGHBOUR_ROWS[None, :]) % grid.rows
+    neighbour_keys = (neighbour_row * grid.cols + neighbour_col).ravel()
+
+    starts = np.searchsorted(sorted_keys, neighbour_keys, side="left")
+    counts = np.searchsorted(sorted_keys, neighbour_keys, side="right") - starts
+    total = int(counts.sum())
+    if total == 0:
+        return _EMPTY_INDEX, _EMPTY_INDEX
+
+    # Expand each (start, count) run into consecutive slots of `order`.
+    run_offsets = np.cumsum(counts) - counts
+    slots = np.repeat(starts - run_offsets, counts) + np.arange(total)
+    query_idx = np.repeat(np.arange(query_count).repeat(9), counts)
+    return query_idx, order[slots]
+
+
+def find_hits(query_positions, query_radii, target_positions, target_radii, grid=None):
+    """Return overlapping `(query_idx, target_idx)` pairs sorted by query, then target.
+
+    Uses squared distances, so no square roots are taken. Touching circles
+    count as a hit, matching `CircleShape.collides_with`.
+    """
+    query_idx, target_idx = candidate_pairs(query_positions, target_positions, grid)
+    if len(query_idx) == 0:
+        return query_idx, target_idx
+
+    delta = query_positions[query_idx] - target_positions[target_idx]
+    distance_sq = np.einsum("ij,ij->i", delta, delta)
+    reach = query_radii[query_idx] + target_radii[target_idx]
+    hit = distance_sq <= reach * reach
+
+    query_idx = query_idx[hit]
+    target_idx = target_idx[hit]
+    order = np.lexsort((target_idx, query_idx))
+    return query_idx[order], target_idx[order]
+
+
+def find_swept_hits(
+    query_starts,
+    query_positions,
+    query_radii,
+    target_starts,
+    target_positions,
+    target_radii,
+    grid=None,
+):
+    """Return `(query_idx, target_idx, toi)` for pairs that touch at any point in the tick.
+
+    Both circles move in a straight line from their start to their current
+    position. Relative to the target, the query sits at `d(t) = d0 + t * v`,
+    and the time of impact is the smallest `t` in `[0, 1]` with
+    `|d(t)| <= r_query + r_target`; pairs already touching at the start get 0.
+    Fast shots therefore cannot tunnel through small asteroids at low tick
+    rates. Hits are sorted by time of impact, then query, then target.
+
+    The broad-phase buckets the midpoint of each sweep. A pair can be at
+    most its reach plus the per-axis travel of both sides apart there, so
+    the grid is only used while that fits in one cell; otherwise every pair
+    is tested.
+    """
+    if len(query_positions) == 0 or len(target_positions) == 0:
+        return _EMPTY_INDEX, _EMPTY_INDEX, np.empty(0)
+
+    query_mid = (query_starts + query_positions) * 0.5
+    target_mid = (target_starts + target_positions) * 0.5
+    if grid is not None:
+        travel = np.abs(query_positions - query_starts).max() + np.abs(
+            target_positions - target_starts
+        ).max()
+        if query_radii.max() + target_radii.max() + travel / 2 > grid.cell_size:
+            grid = None
+    query_idx, target_idx = candidate_pairs(query_mid, target_mid, grid)
+    if len(query_idx) == 0:
+        return query_idx, target_idx, np.empty(0)
+
+    start_delta = query_starts[query_idx] - target_starts[target_idx]
+    motion = (query_positions[query_idx] - query_starts[query_idx]) - (
+        target_positions[target_idx] - target_starts[target_idx]
+    )
+    reach = query_radii[query_idx] + target_radii[target_idx]
+    a = np.einsum("ij,ij->i", motion, motion)
+    b = np.einsum("ij,ij->i", start_delta, motion)
+    c = np.einsum("ij,ij->i", start_delta, start_delta) - reach * reach
+
+    # Earliest root of a*t^2 + 2b*t + c = 0; only approaching pairs (b < 0) can meet.
+    discriminant = b * b - a * c
+    moving = (c > 0) & (a > 0) & (b < 0) & (discriminant >= 0)
+    toi = np.full(len(query_idx), np.inf)
+    toi[c <= 0] = 0.0
+    toi[moving] = (-b[moving] - np.sqrt(discriminant[moving])) / a[moving]
+    hit = toi <= 1.0
+
+    query_idx = query_idx[hit]
+    target_idx = target_idx[hit]
+    toi = toi[hit]
+    order = np.lexsort((target_idx, query_idx, toi))
+    return query_idx[order], target_idx[order], toi[order]
@@ -0,0 +1,107 @@
+from game.config.constants import (
+    ASTEROID_GOVERNOR_FRAME_BUDGET_MS,
+    ASTEROID_GOVERNOR_MAX_ENTITIES,
+    ASTEROID_GOVERNOR_SMOOTHING,
+    ASTEROID_GOVERNOR_THROTTLE_RATIO,
+    ASTEROID_GOVERNOR_THROTTLED_INTERVAL_SCALE,
+)
+
+NORMAL = 0
+THROTTLED = 1
+PAUSED = 2
+LEVEL_NAMES = ("normal", "throttled", "paused")
+
+
+class SpawnGovernor:
+    """Holds back asteroid spawns when frames run long or the screen is crowded.
+
+    Two signals feed the decision. `load_level` comes from measured
+    update+render time (`observe_frame`, called once per rendered frame) and
+    only changes between simulation ticks. The entity ceiling is checked
+    against `count_entities()` whenever a spawn is due. Within a tick the
+    decision is a pure function of those two, so a seeded run that also
+    records `load_level` changes (see `ReplayRecorder`) replays exactly.
+    """
+
+    def __init__(
+        self,
+        count_entities,
+        frame_budget_ms=ASTEROID_GOVERNOR_FRAME_BUDGET_MS,
+        max_entities=ASTEROID_GOVERNOR_MAX_ENTITIES,
+        throttle_ratio=ASTEROID_GOVERNOR_THROTTLE_RATIO,
+        throttled_interval_scale=ASTEROID_GOVERNOR_THROTTLED_INTERVAL_SCALE,
+        smoothing=ASTEROID_GOVERNOR_SMOOTHING,
+    ):
+        self.count_entities = count_entities
+        self.frame_budget_ms = frame_budget_ms
+        self.max_entities = max_entities
+        self.throttle_ratio = throttle_ratio
+        self.throttled_interval_scale = throttled_interval_scale
+        self.smoothing = smoothing
+        self.frame_ms = None
+        self.load_level = NORMAL
+        self.level = NORMAL
+        self.spawned = 0
+        self.throttled_ticks = 0
+        self.paused_ticks = 0
+
+    def observe_frame(self, seconds):
+        """Fold one frame's update+render time into the load estimate."""
+        ms = seconds * 1000
+        if self.frame_ms is None:
+            self.frame_ms = ms
+        else:
+            self.frame_ms += (ms - self.frame_ms) * self.smoothing
+        self.load_level = self._level_for(self.frame_ms, self.frame_budget_ms)
+
+    def _level_for(self, value, limit):
+        if value >= limit:
+            return PAUSED
+        if value >= limit * self.throttle_ratio:
+            return THROTTLED
+        return NORMAL
+
+    def spawn_due(self, spawn_timer, interval):
+        """Return True if a spawn waiting `spawn_timer` seconds may happen now.
+
+        Only called once the base `interval` has elapsed; a held-back spawn
+        keeps its timer and is reconsidered on the next tick.
+        """
+        population_level = self._level_for(self.count_entities(), self.max_entities)
+        self.level = max(self.load_level, population_level)
+        if self.level == PAUSED:
+            self.paused_ticks += 1
+            return False
+        if self.level == THROTTLED and spawn_timer <= interval * self.throttled_interval_scale:
+            self.throttled_ticks += 1
+            return False
+        self.spawned += 1
+        return True
+
+    def metrics(self):
+        return {
+            "level": LEVEL_NAMES[self.level],
+            "load_level": LEVEL_NAMES[self.load_level],
+            "frame_ms": self.frame_ms,
+            "frame_budget_ms": self.frame_budget_ms,
+            "max_entities": self.max_entities,
+            "spawned": self.spawned,
+            "throttled_ticks": self.throttled_ticks,
+            "paused_ticks": self.paused_ticks,
+        }
+
+    def snapshot(self):
+        return {
+            "load_level": self.load_level,
+            "level": self.level,
+            "spawned": self.spawned,
+            "throttled_ticks": self.throttled_ticks,
+            "paused_ticks": self.paused_ticks,
+        }
+
+    def restore(self, state):
+        self.load_level = state["load_level"]
+        self.level = state["level"]
+        self.spawned = state["spawned"]
+        self.throttled_ticks = state["throttled_ticks"]
+        self.paused_ticks = state["paused_ticks"]
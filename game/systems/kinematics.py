@@ -0,0 +1,26 @@
+import numpy as np
+from game.config.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+def advance_lifetimes(store, dt):
+    """Age every live entity and kill those past their lifetime."""
+    store.age[store.alive] += dt
+    expired = np.flatnonzero(store.alive & (store.age >= store.lifetime))
+    if len(expired):
+        store.kill_many(expired)
+
+
+def integrate(store, dt):
+    # Dead slots have zero velocity, so the whole column can be stepped at once.
+    store.position += store.velocity * dt
+
+
+def wrap_around_screen(store):
+    """Vectorised `CircleShape.wrap_around_screen` for every slot."""
+    radius = store.radius
+    for axis, extent in ((0, SCREEN_WIDTH), (1, SCREEN_HEIGHT)):
+        coord = store.position[:, axis]
+        past_low = coord < -radius
+        past_high = coord > extent + radius
+        coord[past_low] = extent + radius[past_low]
+        coord[past_high] = -radius[past_high]
@@ -0,0 +1,238 @@
+import pickle
+import zlib
+import numpy as np
+from game.config.constants import REPLAY_KEYFRAME_INTERVAL_TICKS
+from game.core import rng
+from game.core.input import InputRecorder, ScriptedInput
+from game.entities.asteroid import Asteroid
+from game.entities.explosion import Explosion
+from game.entities.player import Player
+from game.entities.shot import Shot
+from game.systems.asteroidfield import AsteroidField
+
+REPLAY_MAGIC = b"ASTREPLAY"
+REPLAY_FORMAT_VERSION = 4
+
+_SPRITE_KINDS = {
+    Player: "player",
+    AsteroidField: "field",
+    Asteroid: "asteroid",
+    Shot: "shot",
+    Explosion: "explosion",
+}
+_SESSION_GROUP_KEYS = ("updatable", "drawable", "asteroids", "shots", "explosions")
+
+
+def snapshot_session(session):
+    """Capture everything the simulation reads, including RNG stream state.
+
+    Sprites are recorded in `updatable` order so a restore rebuilds every
+    Group in the same order and collision resolution stays identical.
+    """
+    snapshot = {
+        "health": session["health"],
+        "max_health": session["max_health"],
+        "invuln_remaining": session["invuln_remaining"],
+        "sprites": [
+            (_SPRITE_KINDS[type(sprite)], sprite.snapshot()) for sprite in session["updatable"]
+        ],
+        "rng": rng.get_state(),
+    }
+    world = session.get("world")
+    if world is not None:
+        snapshot["world"] = world.snapshot()
+    governor = session.get("governor")
+    if governor is not None:
+        snapshot["governor"] = governor.snapshot()
+    return snapshot
+
+
+def restore_session(session, snapshot):
+    """Rebuild `snapshot` into `session`, a freshly created session whose containers are live."""
+    input_source = session["player"].input_source
+    for sprite in session["updatable"].sprites():
+        sprite.kill()
+    for group_key in _SESSION_GROUP_KEYS:
+        if group_key in session:
+            session[group_key].empty()
+
+    for kind, state in snapshot["sprites"]:
+        x, y = state.get("position", (0, 0))
+        if kind == "player":
+            sprite = Player(x, y, input_source=input_source)
+            session["player"] = sprite
+        elif kind == "field":
+            sprite = AsteroidField()
+        elif kind == "asteroid":
+            sprite = Asteroid.spawn(x, y, state["radius"])
+        elif kind == "shot":
+            sprite = Shot.spawn(x, y)
+        else:
+            sprite = Explosion.spawn(x, y, state["radius"])
+        sprite.restore(state)
+
+    if "world" in snapshot:
+        session["world"].restore(snapshot["world"])
+    if "governor" in snapshot:
+        session["governor"].restore(snapshot["governor"])
+    session["health"] = snapshot["health"]
+    session["max_health"] = snapshot["max_health"]
+    session["invuln_remaining"] = snapshot["invuln_remaining"]
+    # Last: rebuilding sprites above draws from the streams.
+    rng.set_state(snapshot["rng"])
+
+
+def snapshots_match(a, b):
+    """Exact structural equality; pickled bytes differ with object sharing, so compare values."""
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.array_equal(a, b)
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(snapshots_match(a[key], b[key]) for key in a)
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(snapshots_match(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+class Replay:
+    """Seed, tick length, one input mask byte per tick and periodic keyframes.
+
+    `governor_levels[t]` is the spawn governor's frame-time load level from
+    tick `t` on, stored only where it changes: it is measured, not simulated,
+    so it is recorded like input.
+
+    `keyframes[t]` is the session state before tick `t` runs, taken every
+    `keyframe_interval` ticks, so seeking to any tick costs one dictionary
+    lookup plus fewer than `keyframe_interval` simulated ticks.
+    """
+
+    def __init__(self, seed, dt, entity_store=False, keyframe_interval=REPLAY_KEYFRAME_INTERVAL_TICKS):
+        self.seed = seed
+        self.dt = dt
+        self.entity_store = entity_store
+        self.keyframe_interval = max(1, int(keyframe_interval))
+        self.inputs = bytearray()
+        self.keyframes = {}
+        self.governor_levels = {}
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def keyframe_at_or_before(self, tick):
+        keyframe_tick = (tick // self.keyframe_interval) * self.keyframe_interval
+        while keyframe_tick not in self.keyframes and keyframe_tick > 0:
+            keyframe_tick -= self.keyframe_interval
+        return keyframe_tick
+
+    def save(self, path):
+        payload = {
+            "version": REPLAY_FORMAT_VERSION,
+            "seed": self.seed,
+            "dt": self.dt,
+            "entity_store": self.entity_store,
+            "keyframe_interval": self.keyframe_interval,
+            "inputs": bytes(self.inputs),
+            "keyframes": self.keyframes,
+            "governor_levels": self.governor_levels,
+        }
+        with open(path, "wb") as f:
+            f.write(REPLAY_MAGIC)
+            f.write(zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)))
+
+    @classmethod
+    def load(cls, path):
+        # Replays are pickles: only load files you recorded yourself.
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data.startswith(REPLAY_MAGIC):
+            raise ValueError(f"'{path}' is not a replay file")
+        payload = pickle.loads(zlib.decompress(data[len(REPLAY_MAGIC):]))
+        if payload["version"] != REPLAY_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported replay version {payload['version']} in '{path}'"
+            )
+        replay = cls(
+            payload["seed"],
+            payload["dt"],
+            payload["entity_store"],
+            payload["keyframe_interval"],
+        )
+        replay.inputs = bytearray(payload["inputs"])
+        replay.keyframes = payload["keyframes"]
+        replay.governor_levels = payload["governor_levels"]
+        return replay
+
+
+class ReplayRecorder:
+    """Records a session: wire `input` into the player and call `before_tick` each tick."""
+
+    def __init__(self, seed, dt, entity_store=False, keyframe_interval=REPLAY_KEYFRAME_INTERVAL_TICKS, source=None):
+        self.replay = Replay(seed, dt, entity_store, keyframe_interval)
+        self.input = InputRecorder(source)
+        # Share the buffer so the replay grows as the player reads input.
+        self.replay.inputs = self.input.masks
+        self._governor_level = None
+
+    def before_tick(self, session):
+        tick = len(self.replay.inputs)
+        governor = session.get("governor")
+        if governor is not None and governor.load_level != self._governor_level:
+            self.replay.governor_levels[tick] = governor.load_level
+            self._governor_level = governor.load_level
+        if tick % self.replay.keyframe_interval == 0 and tick not in self.replay.keyframes:
+            self.replay.keyframes[tick] = snapshot_session(session)
+
+    def save(self, path):
+        self.replay.save(path)
+
+
+class ReplayDriver:
+    """Re-runs a `Replay` through the same session factory and step function as live play."""
+
+    def __init__(self, replay, create_session, step):
+        self.replay = replay
+        self.create_session = create_session
+        self.step = step
+        self.session = None
+        self.tick = 0
+        self.finished = False
+        self.input = None
+
+    def seek(self, tick):
+        tick = max(0, min(tick, len(self.replay)))
+        keyframe_tick = self.replay.keyframe_at_or_before(tick)
+        self.input = ScriptedInput(self.replay.inputs, keyframe_tick)
+        self.session = self.create_session(
+            use_entity_store=self.replay.entity_store,
+            input_source=self.input,
+        )
+        restore_session(self.session, self.replay.keyframes[keyframe_tick])
+        self.tick = keyframe_tick
+        self.finished = False
+        self.advance(tick - keyframe_tick)
+        return self.session
+
+    def advance(self, ticks):
+        for _ in range(ticks):
+            if self.finished or self.tick >= len(self.replay):
+                self.finished = True
+                break
+            load_level = self.replay.governor_levels.get(self.tick)
+            if load_level is not None:
+                self.session["governor"].load_level = load_level
+            if self.step(self.session, self.replay.dt):
+                self.finished = True
+            self.tick += 1
+        return self.session
+
+    def verify(self):
+        """Play from the start; return the keyframe ticks whose state diverged."""
+        self.seek(0)
+        mismatches = []
+        while not self.finished and self.tick < len(self.replay):
+            keyframe = self.replay.keyframes.get(self.tick)
+            if keyframe is not None and not snapshots_match(keyframe, snapshot_session(self.session)):
+                mismatches.append(self.tick)
+            self.advance(1)
+        return mismatches
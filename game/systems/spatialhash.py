@@ -0,0 +1,92 @@
+import math
+from game.config.constants import (
+    ASTEROID_MAX_RADIUS,
+    COLLISION_GRID_CELL_SIZE,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
+
+
+class SpatialHash:
+    """Uniform grid geometry for the circle collision broad-phase.
+
+    The game only uses its geometry (`cell_size`, `margin`, `cols`, `rows`):
+    `game.systems.collision` bins shapes into these cells with numpy.
+    `ReferenceSpatialHash` adds pure-Python buckets on the same grid.
+
+    `CircleShape.wrap_around_screen` lets a shape drift up to its radius past
+    an edge before it teleports to the opposite side, so the grid spans the
+    screen plus an `ASTEROID_MAX_RADIUS` margin on every side. Cell coordinates
+    wrap modulo the grid size: shapes parked just past an edge always land in
+    a valid cell, and neighbour lookups never run off the grid.
+
+    The cell size must be at least the largest possible sum of two radii so
+    that any colliding pair sits in the same or an adjacent cell.
+    """
+
+    def __init__(
+        self,
+        cell_size=COLLISION_GRID_CELL_SIZE,
+        width=SCREEN_WIDTH,
+        height=SCREEN_HEIGHT,
+        margin=ASTEROID_MAX_RADIUS,
+    ):
+        self.cell_size = cell_size
+        self.margin = margin
+        self.cols = max(1, math.ceil((width + margin * 2) / cell_size))
+        self.rows = max(1, math.ceil((height + margin * 2) / cell_size))
+
+    def cell_for(self, position):
+        col = int((position[0] + self.margin) // self.cell_size) % self.cols
+        row = int((position[1] + self.margin) // self.cell_size) % self.rows
+        return col, row
+
+    def neighbour_cells(self, position):
+        col, row = self.cell_for(position)
+        cells = []
+        for d_row in (-1, 0, 1):
+            for d_col in (-1, 0, 1):
+                cell = ((col + d_col) % self.cols, (row + d_row) % self.rows)
+                # Grids narrower than three cells would otherwise repeat cells.
+                if cell not in cells:
+                    cells.append(cell)
+        return cells
+
+
+class ReferenceSpatialHash(SpatialHash):
+    """Reference implementation only: a `SpatialHash` with pure-Python buckets.
+
+    The game never uses it. `scripts/benchmark.py` and the tests check and
+    time the numpy broad-phase against it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cells = {}
+
+    def __len__(self):
+        return sum(len(items) for items in self._cells.values())
+
+    def clear(self):
+        self._cells.clear()
+
+    def insert(self, item):
+        cell = self.cell_for(item.position)
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            self._cells[cell] = [item]
+        else:
+            bucket.append(item)
+
+    def rebuild(self, items):
+        self._cells.clear()
+        for item in items:
+            self.insert(item)
+
+    def query(self, position):
+        """Yield every registered item in the 3x3 block around `position`."""
+        cells = self._cells
+        for cell in self.neighbour_cells(position):
+            bucket = cells.get(cell)
+            if bucket:
+                yield from bucket
@@ -0,0 +1,158 @@
+import pygame
+from game.config.constants import (
+    ASTEROID_MIN_RADIUS,
+    SHOT_LIFETIME_SECONDS,
+    SHOT_RADIUS,
+)
+from game.core import rng
+from game.core.entitystore import EntityStore
+from game.entities.explosion import Explosion
+from game.entities.shot import Shot
+from game.render.asteroid_texture import (
+    asteroid_texture,
+    asteroid_texture_handles,
+    asteroid_texture_variant,
+    pick_asteroid_texture,
+)
+from game.render.queue import LAYER_ASTEROIDS, LAYER_EXPLOSIONS, LAYER_SHOTS, RenderQueue
+from game.systems.kinematics import advance_lifetimes, integrate, wrap_around_screen
+from game.utils.logger import log_event
+
+
+class EntityWorld:
+    """Array-backed replacement for the asteroid, shot and explosion Groups.
+
+    Mirrors the behaviour of `Asteroid`, `Shot` and `Explosion` but keeps their
+    state in one `EntityStore` per kind and runs movement, wrap-around, shot
+    expiry and explosion aging as whole-array systems. Drawing reuses the
+    entity classes' shared draw helpers, so both paths look identical.
+    """
+
+    def __init__(self):
+        self.asteroids = EntityStore()
+        self.shots = EntityStore()
+        self.explosions = EntityStore()
+        self._simulated_positions = []
+
+    def __len__(self):
+        return len(self.asteroids) + len(self.shots) + len(self.explosions)
+
+    def spawn_asteroid(self, x, y, radius, velocity):
+        handle = pick_asteroid_texture(radius, rng.stream(rng.ASTEROID_TEXTURE))
+        return self.asteroids.spawn(x, y, radius, velocity, payload=handle)
+
+    def spawn_shot(self, x, y, velocity):
+        return self.shots.spawn(
+            x, y, SHOT_RADIUS, velocity, lifetime=SHOT_LIFETIME_SECONDS
+        )
+
+    def spawn_explosion(self, x, y, radius):
+        spark_pattern = Explosion.pick_spark_pattern()
+        frames, duration = Explosion.frames_for_radius(radius, spark_pattern)
+        return self.explosions.spawn(
+            x, y, radius, lifetime=duration, payload=(frames, spark_pattern)
+        )
+
+    def split_asteroid(self, slot):
+        """Kill the asteroid in `slot`, spawning two smaller ones like `Asteroid.split`."""
+        store = self.asteroids
+        radius = float(store.radius[slot])
+        x, y = store.position[slot]
+        velocity = pygame.Vector2(*store.velocity[slot])
+        store.kill(slot)
+        if radius <= ASTEROID_MIN_RADIUS:
+            return
+        log_event("asteroid_split")
+        angle = rng.stream(rng.ASTEROID_SPLIT).uniform(20, 50)
+        child_radius = radius - ASTEROID_MIN_RADIUS
+        for child_velocity in (velocity.rotate(angle), velocity.rotate(-angle)):
+            self.spawn_asteroid(x, y, child_radius, child_velocity * 1.2)
+
+    def snapshot(self):
+        asteroids = self.asteroids
+        explosions = self.explosions
+        return {
+            "asteroids": asteroids.snapshot(),
+            "shots": self.shots.snapshot(),
+            "explosions": explosions.snapshot(),
+            "asteroid_textures": {
+                slot: asteroid_texture_variant(float(asteroids.radius[slot]), asteroids.payload[slot])
+                for slot in asteroids.live_slots().tolist()
+            },
+            "explosion_sparks": {
+                slot: explosions.payload[slot][1] for slot in explosions.live_slots().tolist()
+            },
+        }
+
+    def restore(self, state):
+        self.asteroids.restore(state["asteroids"])
+        self.shots.restore(state["shots"])
+        self.explosions.restore(state["explosions"])
+        for slot, variant in state["asteroid_textures"].items():
+            radius = float(self.asteroids.radius[slot])
+            self.asteroids.payload[slot] = asteroid_texture_handles(radius)[variant]
+        for slot, spark_pattern in state["explosion_sparks"].items():
+            radius = float(self.explosions.radius[slot])
+            frames, _ = Explosion.frames_for_radius(radius, spark_pattern)
+            self.explosions.payload[slot] = (frames, spark_pattern)
+
+    def store_previous_state(self):
+        for store in (self.asteroids, self.shots):
+            store.store_previous_state()
+
+    def begin_interpolation(self, alpha):
+        self._simulated_positions = []
+        for store in (self.asteroids, self.shots):
+            self._simulated_positions.append(store.position)
+            store.position = store.interpolated_positions(alpha)
+
+    def end_interpolation(self):
+        for store, position in zip((self.asteroids, self.shots), self._simulated_positions):
+            store.position = position
+        self._simulated_positions = []
+
+    def update(self, dt):
+        # Shots expire before moving, matching `Shot.update`.
+        advance_lifetimes(self.shots, dt)
+        advance_lifetimes(self.explosions, dt)
+        for store in (self.asteroids, self.shots):
+            integrate(store, dt)
+            wrap_around_screen(store)
+
+    def enqueue(self, queue):
+        asteroids = self.asteroids
+        for slot in asteroids.live_slots().tolist():
+            texture, offset = asteroid_texture(asteroids.payload[slot])
+            x, y = asteroids.position[slot]
+            queue.submit(LAYER_ASTEROIDS, texture, (int(x + offset.x), int(y + offset.y)))
+
+        shots = self.shots
+        for slot in shots.live_slots().tolist():
+            queue.submit(
+                LAYER_SHOTS,
+                *Shot.render_command(
+                    pygame.Vector2(*shots.position[slot]),
+                    pygame.Vector2(*shots.velocity[slot]),
+                ),
+            )
+
+        explosions = self.explosions
+        for slot in explosions.live_slots().tolist():
+            frames, _ = explosions.payload[slot]
+            queue.submit(
+                LAYER_EXPLOSIONS,
+                *Explosion.render_command(
+                    pygame.Vector2(*explosions.position[slot]),
+                    float(explosions.age[slot]),
+                    frames,
+                ),
+            )
+
+    def draw(self, screen):
+        queue = RenderQueue()
+        self.enqueue(queue)
+        queue.flush(screen)
+
+    def clear(self):
+        for store in (self.asteroids, self.shots, self.explosions):
+            store.clear()
@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path
 
@@ -19,3 +20,18 @@ def asset_path(*parts: str) -> str:
 
 def asset_glob(pattern: str) -> str:
     return str(runtime_base_path() / pattern)
+
+
+def user_cache_path(*parts: str) -> str:
+    """Return a path in the per-user cache directory, for files written at runtime.
+
+    Bundled assets may live in a read-only app bundle, so nothing the game
+    rebuilds is written next to them.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return str(Path(base).joinpath("asteroids", *parts))
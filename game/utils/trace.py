@@ -0,0 +1,76 @@
+"""Startup timeline: when each launch phase ran and how long it took.
+
+Times are milliseconds from the trace origin, `TRACE_STARTED` until
+`reset_trace`: the moment this module loaded. `main.py` imports it before
+anything else, so its imports are the first phase. Asset
+loader tasks record their worker time here too, tagged with the thread.
+`startup_timeline()` is logged as one "startup_timeline" event once the
+first interactive frame is on screen.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+__all__ = [
+    "TRACE_STARTED",
+    "reset_trace",
+    "record_phase",
+    "trace_phase",
+    "trace_mark",
+    "startup_timeline",
+]
+
+TRACE_STARTED = time.perf_counter()
+
+_lock = threading.Lock()
+_origin = TRACE_STARTED
+_phases = []
+_marks = {}
+
+
+def reset_trace(origin=None):
+    """Drop recorded phases and time from `origin` (a `time.perf_counter()` value) or now."""
+    global _origin
+    with _lock:
+        _origin = time.perf_counter() if origin is None else origin
+        _phases.clear()
+        _marks.clear()
+
+
+def record_phase(name, started, finished):
+    """Record phase `name` from `started` to `finished` (`time.perf_counter()` values)."""
+    phase = {
+        "phase": name,
+        "start_ms": (started - _origin) * 1000.0,
+        "duration_ms": (finished - started) * 1000.0,
+    }
+    thread = threading.current_thread()
+    if thread is not threading.main_thread():
+        phase["thread"] = thread.name
+    with _lock:
+        _phases.append(phase)
+
+
+@contextmanager
+def trace_phase(name):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(name, started, time.perf_counter())
+
+
+def trace_mark(name):
+    """Record that `name` happened now; returns the milliseconds since the origin."""
+    elapsed_ms = (time.perf_counter() - _origin) * 1000.0
+    with _lock:
+        _marks[name] = elapsed_ms
+    return elapsed_ms
+
+
+def startup_timeline():
+    """Return `{"phases": [...], "marks": {...}}`, phases ordered by start time."""
+    with _lock:
+        phases = sorted(_phases, key=lambda phase: phase["start_ms"])
+        return {"phases": phases, "marks": dict(_marks)}
@@ -1,19 +1,66 @@
+# Imported first: the trace clock starts when it loads, so the imports below are timed.
+from game.utils.trace import (
+    TRACE_STARTED,
+    record_phase,
+    startup_timeline,
+    trace_mark,
+    trace_phase,
+)
+
+import argparse
+import os
+import sys
+import time
+from fractions import Fraction
+
+import numpy as np
 import pygame
 from game.config.constants import (
+    ASSET_CACHE_ENABLED,
+    ASSET_LOADER_PUMP_BUDGET_MS,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
-    ASTEROID_MIN_RADIUS,
-    ASTEROID_KINDS,
     PLAYER_MAX_HEALTH,
     PLAYER_INVULNERABLE_DURATION_SECONDS,
+    ENTITY_STORE_ENABLED,
+    FRAME_PACING_MODE,
+    FRAME_PACING_TARGET_FPS,
+    RENDER_BACKEND,
+    RENDER_THREAD_ENABLED,
+    RENDER_DIRTY_RECTS_ENABLED,
 )
+from game.core import rng
+from game.core.pacing import PACING_MODES, VSYNC, FramePacer
+from game.core.pool import pool_stats
 from game.utils.logger import log_state, log_event
 from game.entities.player import Player
 from game.entities.asteroid import Asteroid
 from game.systems.asteroidfield import AsteroidField
 from game.entities.shot import Shot
 from game.entities.explosion import Explosion
-from game.render import GameRenderer, StartupScreen, prewarm_asteroid_textures
+from game.systems.collision import find_swept_hits, pack_swept_circles, sweep_starts
+from game.systems.governor import SpawnGovernor
+from game.systems.spatialhash import SpatialHash
+from game.systems.world import EntityWorld
+from game.core.timestep import FixedTimestep, interpolated
+from game.systems.replay import Replay, ReplayDriver, ReplayRecorder
+from game.render.asset_cache import (
+    asset_cache_stats,
+    load_asset_cache,
+    save_asset_cache,
+    submit_cached_assets,
+)
+from game.render.backend import BACKENDS, SOFTWARE, create_backend, open_backend
+from game.render.loader import AssetLoader
+from game.render.pipeline import RenderPipeline
+from game.render import (
+    GameRenderer,
+    StartupScreen,
+    rotation_atlas_stats,
+    submit_rotation_atlases,
+)
+
+record_phase("import", TRACE_STARTED, time.perf_counter())
 
 MENU_OPTIONS = ("New Game", "Quit")
 STATE_MENU = "menu"
@@ -21,150 +68,731 @@ STATE_PLAYING = "playing"
 STATE_GAME_OVER = "game_over"
 
 
-def create_game_session():
+SESSION_GROUP_KEYS = ("updatable", "drawable", "asteroids", "shots", "explosions")
+
+
+def create_game_session(use_entity_store=ENTITY_STORE_ENABLED, input_source=None):
+    """Build a fresh session.
+
+    With `use_entity_store`, asteroids, shots and explosions live in an
+    array-backed `EntityWorld` under `session["world"]`; only the player and the
+    asteroid field remain sprites in `updatable`/`drawable`. `input_source`
+    replaces the live keyboard for the player (recording or replaying).
+    """
     updatable = pygame.sprite.Group()
     drawable = pygame.sprite.Group()
-    asteroids = pygame.sprite.Group()
-    shots = pygame.sprite.Group()
-    explosions = pygame.sprite.Group()
+    world = EntityWorld() if use_entity_store else None
 
     Player.containers = (updatable, drawable)
-    Asteroid.containers = (asteroids, updatable, drawable)
     AsteroidField.containers = (updatable)
-    Shot.containers = (shots, drawable, updatable)
-    Explosion.containers = (explosions, drawable, updatable)
-
-    player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
-    AsteroidField()
+    Player.world = world
+    AsteroidField.world = world
 
-    return {
+    session = {
         "updatable": updatable,
         "drawable": drawable,
-        "asteroids": asteroids,
-        "shots": shots,
-        "explosions": explosions,
-        "player": player,
         "health": PLAYER_MAX_HEALTH,
         "max_health": PLAYER_MAX_HEALTH,
         "invuln_remaining": 0.0,
+        "collision_grid": SpatialHash(),
     }
+    if world is None:
+        asteroids = pygame.sprite.Group()
+        shots = pygame.sprite.Group()
+        explosions = pygame.sprite.Group()
+        Asteroid.containers = (asteroids, updatable, drawable)
+        Shot.containers = (shots, drawable, updatable)
+        Explosion.containers = (explosions, drawable, updatable)
+        session.update(asteroids=asteroids, shots=shots, explosions=explosions)
+    else:
+        session["world"] = world
 
+    governor = SpawnGovernor(lambda: sum(session_entity_counts(session).values()))
+    AsteroidField.governor = governor
+    session["governor"] = governor
 
-def main():
-    print(f"Starting Asteroids with pygame version: {pygame.version.ver}")
-    print(f"Screen width: {SCREEN_WIDTH}\nScreen height: {SCREEN_HEIGHT}")
-    pygame.init()
-    clock = pygame.time.Clock()
-    startup = StartupScreen()
+    session["player"] = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, input_source=input_source)
+    AsteroidField()
+    return session
 
-    startup_display = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-    pygame.display.set_caption("Asteroids")
-    startup.start()
-    if not startup.render_step(startup_display):
+
+def update_session(session, dt):
+    session["updatable"].update(dt)
+    world = session.get("world")
+    if world is not None:
+        world.update(dt)
+
+
+def store_previous_state(session):
+    for sprite in session["updatable"]:
+        if hasattr(sprite, "store_previous_state"):
+            sprite.store_previous_state()
+    world = session.get("world")
+    if world is not None:
+        world.store_previous_state()
+
+
+def step_session(session, dt, phase_seconds=None):
+    """Advance the simulation by one fixed tick; return True if the player died.
+
+    When `phase_seconds` is given, time spent in the update and collision
+    phases is accumulated into its "update" and "collisions" entries.
+    """
+    session["invuln_remaining"] = max(0.0, session["invuln_remaining"] - dt)
+    session["player"].set_invulnerable(session["invuln_remaining"] > 0.0)
+    if phase_seconds is None:
+        store_previous_state(session)
+        update_session(session, dt)
+        return run_collision_pass(session)
+
+    started = time.perf_counter()
+    store_previous_state(session)
+    update_session(session, dt)
+    updated = time.perf_counter()
+    player_dead = run_collision_pass(session)
+    phase_seconds["update"] = phase_seconds.get("update", 0.0) + (updated - started)
+    phase_seconds["collisions"] = (
+        phase_seconds.get("collisions", 0.0) + (time.perf_counter() - updated)
+    )
+    return player_dead
+
+
+def session_entity_counts(session):
+    world = session.get("world")
+    if world is None:
+        return {
+            "asteroids": len(session["asteroids"]),
+            "shots": len(session["shots"]),
+            "explosions": len(session["explosions"]),
+        }
+    return {
+        "asteroids": len(world.asteroids),
+        "shots": len(world.shots),
+        "explosions": len(world.explosions),
+    }
+
+
+def session_drawables(session):
+    world = session.get("world")
+    if world is None:
+        return session["drawable"]
+    return (*session["drawable"], world)
+
+
+def clear_session(session):
+    # kill() hands pooled sprites back to their pools for the next session.
+    for sprite in session["updatable"].sprites():
+        sprite.kill()
+    for group_key in SESSION_GROUP_KEYS:
+        if group_key in session:
+            session[group_key].empty()
+    world = session.get("world")
+    if world is not None:
+        world.clear()
+
+
+def _collision_batches(session):
+    """Pack shot sweeps (plus the player as the last row) and asteroid sweeps for `find_swept_hits`.
+
+    Returns the packed start positions, positions and radii along with the
+    shot and asteroid handles each row refers to: sprites for the Group path,
+    slots for the entity store.
+    """
+    player = session["player"]
+    world = session.get("world")
+    if world is None:
+        shot_handles = list(session["shots"])
+        asteroid_handles = list(session["asteroids"])
+        query_starts, query_positions, query_radii = pack_swept_circles(shot_handles + [player])
+        asteroid_starts, asteroid_positions, asteroid_radii = pack_swept_circles(asteroid_handles)
+    else:
+        shot_slots = world.shots.live_slots()
+        asteroid_slots = world.asteroids.live_slots()
+        player_start, player_position, player_radius = pack_swept_circles([player])
+        shot_positions = world.shots.position[shot_slots]
+        shot_starts = sweep_starts(world.shots.previous_position[shot_slots], shot_positions)
+        query_starts = np.concatenate((shot_starts, player_start))
+        query_positions = np.concatenate((shot_positions, player_position))
+        query_radii = np.concatenate((world.shots.radius[shot_slots], player_radius))
+        asteroid_positions = world.asteroids.position[asteroid_slots]
+        asteroid_starts = sweep_starts(
+            world.asteroids.previous_position[asteroid_slots], asteroid_positions
+        )
+        asteroid_radii = world.asteroids.radius[asteroid_slots]
+        shot_handles = shot_slots.tolist()
+        asteroid_handles = asteroid_slots.tolist()
+    return (
+        query_starts,
+        query_positions,
+        query_radii,
+        asteroid_starts,
+        asteroid_positions,
+        asteroid_radii,
+        shot_handles,
+        asteroid_handles,
+    )
+
+
+def _resolve_shot_hit(session, shot, asteroid):
+    log_event("asteroid_shot")
+    world = session.get("world")
+    if world is None:
+        Explosion.spawn(asteroid.position.x, asteroid.position.y, asteroid.radius)
+        asteroid.split()
+        shot.kill()
         return
-    renderer = GameRenderer(menu_options=MENU_OPTIONS)
-    if not startup.render_step(renderer.display_surface):
+    x, y = world.asteroids.position[asteroid]
+    world.spawn_explosion(x, y, float(world.asteroids.radius[asteroid]))
+    world.split_asteroid(asteroid)
+    world.shots.kill(shot)
+
+
+def run_collision_pass(session):
+    """Resolve player and shot hits for one tick; return True if the player died.
+
+    Hits are swept over the whole tick and resolved in time-of-impact order,
+    so each shot takes out the first asteroid it reaches, whatever the tick rate.
+    """
+    (
+        query_starts,
+        query_positions,
+        query_radii,
+        asteroid_starts,
+        asteroid_positions,
+        asteroid_radii,
+        shot_handles,
+        asteroid_handles,
+    ) = _collision_batches(session)
+    if not asteroid_handles:
+        return False
+
+    player_row = len(shot_handles)
+    query_idx, asteroid_idx, _ = find_swept_hits(
+        query_starts,
+        query_positions,
+        query_radii,
+        asteroid_starts,
+        asteroid_positions,
+        asteroid_radii,
+        session["collision_grid"],
+    )
+    query_idx = query_idx.tolist()
+    asteroid_idx = asteroid_idx.tolist()
+
+    player_dead = False
+    if session["invuln_remaining"] <= 0.0 and player_row in query_idx:
+        session["health"] -= 1
+        log_event("player_hit", remaining_health=session["health"])
+        if session["health"] <= 0:
+            player_dead = True
+        else:
+            session["invuln_remaining"] = PLAYER_INVULNERABLE_DURATION_SECONDS
+            session["player"].set_invulnerable(True)
+
+    spent_shots = set()
+    destroyed = set()
+    for row, target in zip(query_idx, asteroid_idx):
+        if row == player_row or row in spent_shots or target in destroyed:
+            continue
+        _resolve_shot_hit(session, shot_handles[row], asteroid_handles[target])
+        spent_shots.add(row)
+        destroyed.add(target)
+
+    return player_dead
+
+
+def run_headless(
+    frames,
+    seed=None,
+    dt=1 / 60,
+    use_entity_store=ENTITY_STORE_ENABLED,
+    record_path=None,
+    input_source=None,
+):
+    """Step the simulation `frames` times without rendering and return a report.
+
+    Expects pygame to be initialised with a display mode set (the dummy video
+    driver is enough). A player death starts a fresh session so soak runs
+    keep going; deaths are counted in the report. With `record_path` the run
+    is saved as a replay instead, and stops at the first death.
+    """
+    if record_path is not None and seed is None:
+        # Streams first drawn after keyframe 0 must be re-derivable on replay.
+        seed = rng.draw_seed()
+    rng.seed_streams(seed)
+    recorder = None
+    if record_path is not None:
+        recorder = ReplayRecorder(seed, dt, use_entity_store, source=input_source)
+        input_source = recorder.input
+    session = create_game_session(use_entity_store=use_entity_store, input_source=input_source)
+    phase_seconds = {"update": 0.0, "collisions": 0.0}
+    peak_entities = 0
+    deaths = 0
+    ticks = 0
+
+    started = time.perf_counter()
+    for _ in range(frames):
+        if recorder is not None:
+            recorder.before_tick(session)
+        player_dead = step_session(session, dt, phase_seconds)
+        ticks += 1
+        peak_entities = max(peak_entities, sum(session_entity_counts(session).values()))
+        if player_dead:
+            deaths += 1
+            if recorder is not None:
+                break
+            clear_session(session)
+            session = create_game_session(use_entity_store=use_entity_store, input_source=input_source)
+    elapsed = time.perf_counter() - started
+    if recorder is not None:
+        recorder.save(record_path)
+
+    report = {
+        "frames": ticks,
+        "seed": seed,
+        "dt": dt,
+        "entity_store": use_entity_store,
+        "elapsed_s": elapsed,
+        "ticks_per_s": ticks / elapsed if elapsed > 0 else float("inf"),
+        "sim_seconds": ticks * dt,
+        "player_deaths": deaths,
+        "entities": session_entity_counts(session),
+        "peak_entities": peak_entities,
+        "phase_ms": {phase: seconds * 1000 for phase, seconds in phase_seconds.items()},
+    }
+    clear_session(session)
+    report["pools"] = pool_stats()
+    report["governor"] = session["governor"].metrics()
+    return report
+
+
+def run_replay(path, start_tick=0, verify=False):
+    """Replay a recording headlessly from `start_tick` to its end and return a report."""
+    replay = Replay.load(path)
+    driver = ReplayDriver(replay, create_game_session, step_session)
+
+    started = time.perf_counter()
+    mismatches = driver.verify() if verify else None
+    if not verify:
+        driver.seek(start_tick)
+        seeked = time.perf_counter()
+        driver.advance(len(replay) - driver.tick)
+    elapsed = time.perf_counter() - started
+
+    report = {
+        "path": path,
+        "seed": replay.seed,
+        "dt": replay.dt,
+        "ticks": len(replay),
+        "keyframes": len(replay.keyframes),
+        "start_tick": 0 if verify else start_tick,
+        "end_tick": driver.tick,
+        "elapsed_s": elapsed,
+        "entities": session_entity_counts(driver.session),
+        "health": driver.session["health"],
+    }
+    if verify:
+        report["mismatched_keyframes"] = mismatches
+    else:
+        report["seek_ms"] = (seeked - started) * 1000
+    clear_session(driver.session)
+    return report
+
+
+def print_replay_report(report):
+    print(
+        f"Replay {report['path']}: {report['ticks']} ticks, {report['keyframes']} keyframes "
+        f"(dt={report['dt']:.5f}s, seed={report['seed']})"
+    )
+    print(f"  ticks:         {report['start_tick']} -> {report['end_tick']}")
+    if "seek_ms" in report:
+        print(f"  seek:          {report['seek_ms']:.2f}ms")
+    print(f"  wall time:     {report['elapsed_s']:.3f}s")
+    counts = ", ".join(f"{kind}={count}" for kind, count in report["entities"].items())
+    print(f"  final state:   health={report['health']}, {counts}")
+    if "mismatched_keyframes" in report:
+        mismatches = report["mismatched_keyframes"]
+        print(f"  verify:        {'OK' if not mismatches else f'diverged at ticks {mismatches}'}")
+
+
+def print_headless_report(report):
+    print(
+        f"Headless run: {report['frames']} ticks (dt={report['dt']:.5f}s, "
+        f"seed={report['seed']}, entity_store={report['entity_store']})"
+    )
+    print(f"  wall time:     {report['elapsed_s']:.3f}s")
+    print(f"  ticks/sec:     {report['ticks_per_s']:.1f}")
+    print(f"  sim time:      {report['sim_seconds']:.1f}s")
+    print(f"  player deaths: {report['player_deaths']}")
+    counts = ", ".join(f"{kind}={count}" for kind, count in report["entities"].items())
+    print(f"  entities:      {counts} (peak total {report['peak_entities']})")
+    for phase, total_ms in report["phase_ms"].items():
+        per_tick = total_ms / max(1, report["frames"])
+        print(f"  {phase + ':':<14} {total_ms:.1f}ms total, {per_tick:.4f}ms/tick")
+    governor = report["governor"]
+    print(
+        f"  governor:      {governor['level']}, {governor['spawned']} spawned, "
+        f"{governor['throttled_ticks']} throttled / {governor['paused_ticks']} paused ticks "
+        f"(ceiling {governor['max_entities']})"
+    )
+    for name, stats in report["pools"].items():
+        print(
+            f"  pool {name + ':':<11}{stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_rate']:.0%}), high-water {stats['high_water']}/{stats['capacity']}"
+        )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Asteroids")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run the simulation without a window and print timing stats",
+    )
+    parser.add_argument("--frames", type=int, default=3600, help="Ticks to simulate (headless)")
+    parser.add_argument("--seed", type=int, default=None, help="Root seed for all RNG streams")
+    parser.add_argument(
+        "--dt",
+        type=lambda value: float(Fraction(value)),
+        default=1 / 60,
+        help="Seconds per tick, e.g. 1/60 (headless)",
+    )
+    parser.add_argument(
+        "--entity-store",
+        action=argparse.BooleanOptionalAction,
+        default=ENTITY_STORE_ENABLED,
+        help="Use the array-backed entity store instead of sprite Groups",
+    )
+    parser.add_argument(
+        "--dirty-rects",
+        action=argparse.BooleanOptionalAction,
+        default=RENDER_DIRTY_RECTS_ENABLED,
+        help="Redraw and push only the screen regions sprites touched",
+    )
+    parser.add_argument(
+        "--asset-cache",
+        action=argparse.BooleanOptionalAction,
+        default=ASSET_CACHE_ENABLED,
+        help="Map pre-scaled sprites and explosion frames from the baked asset cache",
+    )
+    parser.add_argument(
+        "--render-backend",
+        choices=BACKENDS,
+        default=RENDER_BACKEND,
+        help="Present with software blits or, experimentally, through a pygame._sdl2 renderer",
+    )
+    parser.add_argument(
+        "--render-thread",
+        action=argparse.BooleanOptionalAction,
+        default=RENDER_THREAD_ENABLED,
+        help="Draw and present on a render thread, one frame behind the simulation (not on macOS)",
+    )
+    parser.add_argument(
+        "--pacing",
+        choices=PACING_MODES,
+        default=FRAME_PACING_MODE,
+        help="Frame pacing: coarse sleep, precise limiter, vsync, or uncapped for benchmarks",
+    )
+    parser.add_argument(
+        "--target-fps",
+        type=int,
+        default=FRAME_PACING_TARGET_FPS,
+        help="Frame rate the sleep and precise limiters aim for",
+    )
+    parser.add_argument("--record", metavar="PATH", help="Record inputs and keyframes to a replay file")
+    parser.add_argument("--replay", metavar="PATH", help="Re-run a replay file headlessly")
+    parser.add_argument("--seek", type=int, default=0, help="Tick to start the replay from")
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Replay from the start and check every keyframe matches",
+    )
+    return parser.parse_args(argv)
+
+
+def show_frame(renderer, frame, pipeline=None):
+    """Draw and present `frame`, or hand it to `pipeline`; returns the seconds spent rendering.
+
+    With a pipeline that is the render thread's time for the last frame it
+    presented, one frame behind.
+    """
+    if pipeline is not None:
+        pipeline.submit(frame)
+        return pipeline.last_render_seconds
+    started = time.perf_counter()
+    renderer.draw_frame(frame)
+    renderer.present()
+    return time.perf_counter() - started
+
+
+def observe_frame_cost(governor, simulated_seconds, render_seconds, pipelined=False):
+    """Charge `governor` for one gameplay frame's simulation and rendering.
+
+    Pipelined, the render thread draws while the next frame simulates, so the
+    slower of the two sets the frame time.
+    """
+    if pipelined:
+        governor.observe_frame(max(simulated_seconds, render_seconds))
+    else:
+        governor.observe_frame(simulated_seconds + render_seconds)
+
+
+def open_game_window(args, startup=None):
+    """Show the loading screen, then build the renderer on the same display mode.
+
+    Returns `(renderer, clock, loader)` once the menu's assets are in, while
+    the deferred gameplay assets are still loading on `loader`; None when
+    the window is closed first.
+    """
+    if startup is None:
+        startup = StartupScreen()
+    vsync = args.pacing == VSYNC
+    with trace_phase("display"):
+        backend, display_surface = open_backend(
+            create_backend(args.render_backend, vsync),
+            GameRenderer.get_frame_size(),
+            fullscreen=True,
+        )
+        backend.set_caption("Asteroids")
+    startup.backend = backend
+    startup.start()
+    with trace_phase("loading_frame"):
+        if not startup.render_step(display_surface):
+            return None
+    trace_mark("first_frame")
+
+    loader = AssetLoader()
+    with trace_phase("renderer"):
+        renderer = GameRenderer(
+            menu_options=MENU_OPTIONS,
+            dirty_rects=args.dirty_rects,
+            backend=backend,
+            vsync=vsync,
+            loader=loader,
+        )
+    target_fps = args.target_fps
+    if args.pacing == VSYNC:
+        # Only newer pygame builds can report the refresh rate; 0 means unknown.
+        refresh_rate = getattr(pygame.display, "get_current_refresh_rate", lambda: 0)()
+        target_fps = refresh_rate or target_fps
+    clock = FramePacer(args.pacing, target_fps)
+    if args.asset_cache:
+        with trace_phase("asset_cache"):
+            load_asset_cache()
+    # Only the menu is needed first; gameplay assets load behind it (see `AssetLoader`).
+    with loader.deferred():
+        submit_rotation_atlases(loader)
+        submit_cached_assets(loader)
+    # The minimum loading time overlaps the work instead of following it.
+    with trace_phase("loading_screen"):
+        loaded = startup.hold_until_min_duration(renderer.display_surface, clock, loader)
+    if not loaded:
+        loader.cancel()
+        return None
+    return renderer, clock, loader
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.headless or args.replay:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        try:
+            if args.replay:
+                print_replay_report(run_replay(args.replay, args.seek, args.verify))
+            else:
+                print_headless_report(
+                    run_headless(
+                        args.frames,
+                        args.seed,
+                        args.dt,
+                        args.entity_store,
+                        record_path=args.record,
+                    )
+                )
+        finally:
+            pygame.quit()
         return
-    prewarm_asteroid_textures()
-    Explosion.prewarm(
-        [
-            ASTEROID_MIN_RADIUS * kind
-            for kind in range(1, ASTEROID_KINDS + 1)
-        ]
-    )
-    if not startup.hold_until_min_duration(renderer.display_surface, clock):
+
+    print(f"Starting Asteroids with pygame version: {pygame.version.ver}")
+    print(f"Screen width: {SCREEN_WIDTH}\nScreen height: {SCREEN_HEIGHT}")
+    with trace_phase("pygame_init"):
+        pygame.init()
+    started = open_game_window(args)
+    if started is None:
         return
+    renderer, clock, loader = started
+    # Only gameplay and menu frames count towards the pacing statistics.
+    clock.reset_stats()
+
+    pipeline = None
+    if args.render_thread:
+        if sys.platform == "darwin":
+            # Cocoa only accepts window updates from the main thread.
+            print("Warning: the render thread is not supported on macOS; rendering inline")
+        elif renderer.backend.name == SOFTWARE:
+            pipeline = RenderPipeline(renderer)
+        else:
+            print("Warning: the render thread needs the software backend; rendering inline")
+
+    def log_render_stats():
+        log_event("render_stats", **renderer.render_stats())
+        log_event("frame_pacing", **clock.stats())
+        if pipeline is not None:
+            log_event("render_pipeline", **pipeline.stats())
+
+    def log_governor_metrics():
+        log_event("spawn_governor", **session["governor"].metrics())
+
+    def finish_loading(cancel=False):
+        """Wait for the deferred assets, or drop them with `cancel` when quitting; logs once."""
+        nonlocal loader
+        if loader is None:
+            return
+        if cancel:
+            loader.cancel()
+            log_event("asset_loader", cancelled=True, **loader.stats())
+        else:
+            loader.close()
+            trace_mark("assets_loaded")
+            log_event("asset_loader", **loader.stats())
+            if args.asset_cache:
+                # First run or changed sources: bake what was just built for next launch.
+                save_asset_cache()
+                log_event("asset_cache", **asset_cache_stats())
+        log_event("rotation_atlas", **rotation_atlas_stats())
+        log_event("startup_timeline", **startup_timeline())
+        loader = None
 
     state = STATE_MENU
     selected_option = 0
+    menu_shown = False
     session = None
-    dt = 0
-
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
-                renderer.toggle_fullscreen()
-                continue
-
-            if state == STATE_MENU and event.type == pygame.KEYDOWN:
-                if event.key in (pygame.K_w, pygame.K_UP):
-                    selected_option = (selected_option - 1) % len(MENU_OPTIONS)
-                elif event.key in (pygame.K_s, pygame.K_DOWN):
-                    selected_option = (selected_option + 1) % len(MENU_OPTIONS)
-                elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                    selected_label = MENU_OPTIONS[selected_option]
-                    if selected_label == "New Game":
-                        session = create_game_session()
-                        state = STATE_PLAYING
-                    else:
-                        return
-
-            if state == STATE_GAME_OVER and event.type == pygame.KEYDOWN:
-                if event.key in (pygame.K_RETURN,):
-                    for group_key in (
-                        "updatable",
-                        "drawable",
-                        "asteroids",
-                        "shots",
-                        "explosions",
-                    ):
-                        session[group_key].empty()
-                    session = None
-                    selected_option = 0
-                    state = STATE_MENU
-
-        if state == STATE_MENU:
-            renderer.render_menu(selected_option)
-        elif state == STATE_PLAYING:
-            updatable = session["updatable"]
-            drawable = session["drawable"]
-            asteroids = session["asteroids"]
-            shots = session["shots"]
-            player = session["player"]
-            session["invuln_remaining"] = max(0.0, session["invuln_remaining"] - dt)
-            player.set_invulnerable(session["invuln_remaining"] > 0.0)
-
-            log_state()
-            updatable.update(dt)
-
-            player_dead = False
-            if session["invuln_remaining"] <= 0.0:
-                for asteroid in asteroids:
-                    if asteroid.collides_with(player):
-                        session["health"] -= 1
-                        log_event("player_hit", remaining_health=session["health"])
-                        if session["health"] <= 0:
-                            player_dead = True
+    recorder = None
+    timestep = FixedTimestep()
+    frame_dt = 0
+
+    try:
+        while True:
+            for event in pygame.event.get():
+                # The texture-present backend's hidden display window keeps SDL from
+                # sending QUIT when the visible window closes.
+                if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
+                    finish_loading(cancel=True)
+                    if recorder is not None:
+                        recorder.save(args.record)
+                    if state == STATE_PLAYING:
+                        log_governor_metrics()
+                    log_render_stats()
+                    return
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F11:
+                    if pipeline is not None:
+                        pipeline.drain()
+                    renderer.toggle_fullscreen()
+                    continue
+                if event.type == pygame.WINDOWEXPOSED:
+                    if pipeline is not None:
+                        pipeline.drain()
+                    renderer.invalidate()
+                    continue
+
+                if state == STATE_MENU and event.type == pygame.KEYDOWN:
+                    if event.key in (pygame.K_w, pygame.K_UP):
+                        selected_option = (selected_option - 1) % len(MENU_OPTIONS)
+                    elif event.key in (pygame.K_s, pygame.K_DOWN):
+                        selected_option = (selected_option + 1) % len(MENU_OPTIONS)
+                    elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                        selected_label = MENU_OPTIONS[selected_option]
+                        if selected_label == "New Game":
+                            finish_loading()
+                            seed = args.seed
+                            if args.record and seed is None:
+                                seed = rng.draw_seed()
+                            rng.seed_streams(seed)
+                            input_source = None
+                            if args.record:
+                                recorder = ReplayRecorder(seed, timestep.step_dt, args.entity_store)
+                                input_source = recorder.input
+                            session = create_game_session(args.entity_store, input_source)
+                            timestep.reset()
+                            state = STATE_PLAYING
                         else:
-                            session["invuln_remaining"] = PLAYER_INVULNERABLE_DURATION_SECONDS
-                            player.set_invulnerable(True)
-                        break
+                            finish_loading(cancel=True)
+                            log_render_stats()
+                            return
+
+                if state == STATE_GAME_OVER and event.type == pygame.KEYDOWN:
+                    if event.key in (pygame.K_RETURN,):
+                        clear_session(session)
+                        session = None
+                        selected_option = 0
+                        state = STATE_MENU
+
+            simulated_seconds = None
+            if state == STATE_MENU:
+                frame = renderer.menu_frame(selected_option)
+            elif state == STATE_PLAYING:
+                # Unused here, but `log_state` snapshots these groups from our locals.
+                updatable = session["updatable"]
+                asteroids = session.get("asteroids")
+                shots = session.get("shots")
+                drawable = session_drawables(session)
+                player = session["player"]
 
-            for asteroid in asteroids:
-                for shot in shots:
-                    if shot.collides_with(asteroid):
-                        log_event("asteroid_shot")
-                        Explosion(asteroid.position.x, asteroid.position.y, asteroid.radius)
-                        asteroid.split()
-                        shot.kill()
+                log_state()
+                work_started = time.perf_counter()
+                player_dead = False
+                for _ in range(timestep.advance(frame_dt)):
+                    if recorder is not None:
+                        recorder.before_tick(session)
+                    player_dead = step_session(session, timestep.step_dt)
+                    if player_dead:
                         break
 
-            if player_dead:
-                state = STATE_GAME_OVER
-                renderer.render_game_over(drawable)
+                if player_dead:
+                    if recorder is not None:
+                        recorder.save(args.record)
+                        recorder = None
+                    log_governor_metrics()
+                    state = STATE_GAME_OVER
+                    frame = renderer.game_over_frame(drawable)
+                else:
+                    with interpolated(drawable, timestep.alpha):
+                        frame = renderer.game_frame(
+                            drawable,
+                            session["health"],
+                            session["max_health"],
+                        )
+                    simulated_seconds = time.perf_counter() - work_started
             else:
-                renderer.render_game(
-                    drawable,
-                    session["health"],
-                    session["max_health"],
-                )
-        else:
-            renderer.render_game_over(session["drawable"])
+                frame = renderer.game_over_frame(session_drawables(session))
 
-        renderer.present()
-        dt = clock.tick(60) / 1000  # ms
+            render_seconds = show_frame(renderer, frame, pipeline)
+            if simulated_seconds is not None:
+                observe_frame_cost(
+                    session["governor"], simulated_seconds, render_seconds, pipeline is not None
+                )
+            if not menu_shown:
+                menu_shown = True
+                if pipeline is not None:
+                    pipeline.drain()
+                trace_mark("first_menu_frame")
+                if loader is not None:
+                    loader.start_deferred()
+            if loader is not None:
+                # Deferred gameplay assets finish while the menu is up.
+                loader.pump(ASSET_LOADER_PUMP_BUDGET_MS / 1000.0)
+                if loader.done:
+                    finish_loading()
+            frame_dt = clock.tick() / 1000  # ms
+    finally:
+        if pipeline is not None:
+            # A render error must not replace the exception that ended the loop.
+            pipeline.close(raise_error=sys.exc_info()[1] is None)
+        if loader is not None:
+            loader.cancel()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Bake scaled asteroid variants and explosion frames into the asset cache.
+
+The game maps this file at startup instead of decoding and scaling the
+source images; rerun after changing sprites or the scale constants:
+
+    python scripts/bake_assets.py [--output PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pygame  # noqa: E402
+
+from game.config.constants import ASSET_CACHE_PATH  # noqa: E402
+from game.render.asset_cache import (  # noqa: E402
+    prewarm_cached_assets,
+    warm_asset_groups,
+    write_asset_cache,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Bake the game's asset cache.")
+    parser.add_argument("--output", default=ASSET_CACHE_PATH, help="Cache file to write")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    pygame.init()
+    # `convert_alpha()` needs a display mode to pick the pixel format.
+    pygame.display.set_mode((1, 1))
+    try:
+        started = time.perf_counter()
+        prewarm_cached_assets()
+        groups = warm_asset_groups()
+        size = write_asset_cache(groups, args.output)
+        elapsed = time.perf_counter() - started
+    finally:
+        pygame.quit()
+
+    frames = sum(len(group) for group in groups.values())
+    print(
+        f"Baked {len(groups)} groups, {frames} frames, {size / 1024:.1f} KiB "
+        f"into {args.output} in {elapsed * 1000:.0f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the game's hot paths.
+
+Each scenario runs headless (SDL dummy drivers) and prints one line per
+workload size so results can be compared across commits:
+
+    python scripts/benchmark.py collisions --sizes 50 200 800
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pygame  # noqa: E402
+
+from game.config.constants import (  # noqa: E402
+    ASTEROID_KINDS,
+    ASTEROID_MIN_RADIUS,
+    BACKGROUND_IMAGE_PATH,
+    BACKGROUND_OPACITY,
+    PLAYER_MAX_SPEED,
+    PLAYER_RADIUS,
+    PLAYER_SHOT_SPEED,
+    PLAYER_SPRITE_PATH,
+    PLAYER_SPRITE_SIZE_MULTIPLIER,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    SHOT_RADIUS,
+)
+from game.core.circleshape import CircleShape  # noqa: E402
+from game.entities.asteroid import Asteroid  # noqa: E402
+from game.entities.shot import Shot  # noqa: E402
+from game.render.backend import SoftwareBackend, TexturePresentBackend  # noqa: E402
+from game.render.frame import (  # noqa: E402
+    bake_opacity,
+    frame_layout,
+    frame_size,
+    static_frame_layer,
+)
+from game.render.pipeline import RenderPipeline  # noqa: E402
+from game.render.queue import RenderQueue  # noqa: E402
+from game.render.renderer import GameRenderer  # noqa: E402
+from game.render.rotation_atlas import RotationAtlas, load_scaled_sprite  # noqa: E402
+from game.systems.collision import find_swept_hits, pack_swept_circles  # noqa: E402
+from game.systems.spatialhash import ReferenceSpatialHash, SpatialHash  # noqa: E402
+from game.systems.world import EntityWorld  # noqa: E402
+
+
+def time_best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def random_circles(rng: random.Random, count: int, radius_fn) -> list[CircleShape]:
+    return [
+        CircleShape(
+            rng.uniform(0, SCREEN_WIDTH),
+            rng.uniform(0, SCREEN_HEIGHT),
+            radius_fn(),
+        )
+        for _ in range(count)
+    ]
+
+
+def _move_last_tick(rng: random.Random, circles: list[CircleShape], speed: float) -> None:
+    """Give each circle a `previous_position` one 60 Hz tick behind it at `speed` px/s."""
+    for circle in circles:
+        step = pygame.Vector2(speed / 60, 0).rotate(rng.uniform(0, 360))
+        circle.previous_position.update(circle.position - step)
+
+
+def bench_collisions(sizes: list[int], repeat: int, seed: int) -> None:
+    """Shot and player sweeps against asteroid sweeps, as `main.run_collision_pass` packs them.
+
+    The brute-force and `ReferenceSpatialHash` columns test end positions only, so they
+    can find fewer hits than the swept kernel, never more.
+    """
+    rng = random.Random(seed)
+    print(
+        f"{'asteroids':>9} {'shots':>6} {'brute ms':>9} {'grid ms':>8} "
+        f"{'swept ms':>9} {'speedup':>8}"
+    )
+    for size in sizes:
+        asteroids = random_circles(
+            rng, size, lambda: ASTEROID_MIN_RADIUS * rng.randint(1, ASTEROID_KINDS)
+        )
+        shots = random_circles(rng, size, lambda: SHOT_RADIUS)
+        _move_last_tick(rng, asteroids, 100)
+        _move_last_tick(rng, shots, PLAYER_SHOT_SPEED)
+        player = CircleShape(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, PLAYER_RADIUS)
+        _move_last_tick(rng, [player], PLAYER_MAX_SPEED)
+        queries = shots + [player]
+        buckets = ReferenceSpatialHash()
+        grid = SpatialHash()
+
+        def brute() -> int:
+            hits = 0
+            for asteroid in asteroids:
+                for query in queries:
+                    if query.collides_with(asteroid):
+                        hits += 1
+            return hits
+
+        def broad_phase() -> int:
+            hits = 0
+            buckets.rebuild(asteroids)
+            for query in queries:
+                for asteroid in buckets.query(query.position):
+                    if query.collides_with(asteroid):
+                        hits += 1
+            return hits
+
+        def kernel() -> int:
+            query_starts, query_positions, query_radii = pack_swept_circles(queries)
+            asteroid_starts, asteroid_positions, asteroid_radii = pack_swept_circles(asteroids)
+            hits, _, _ = find_swept_hits(
+                query_starts,
+                query_positions,
+                query_radii,
+                asteroid_starts,
+                asteroid_positions,
+                asteroid_radii,
+                grid,
+            )
+            return len(hits)
+
+        # The brute-force scan is quadratic; skip it where it would dominate the run.
+        brute_s = None
+        if size <= 1000:
+            assert brute() == broad_phase() <= kernel()
+            brute_s = time_best_of(brute, repeat)
+        grid_s = time_best_of(broad_phase, repeat)
+        kernel_s = time_best_of(kernel, repeat)
+        if brute_s is None:
+            brute_ms, speedup = f"{'-':>9}", f"{'-':>8}"
+        else:
+            brute_ms = f"{brute_s * 1000:>9.2f}"
+            speedup = f"{brute_s / max(kernel_s, 1e-9):>7.1f}x"
+        print(
+            f"{size:>9} {size:>6} {brute_ms} {grid_s * 1000:>8.2f} "
+            f"{kernel_s * 1000:>9.2f} {speedup}"
+        )
+
+
+def bench_update(sizes: list[int], repeat: int, seed: int) -> None:
+    rng = random.Random(seed)
+    dt = 1 / 60
+    print(f"{'entities':>8} {'groups ms':>10} {'store ms':>9} {'speedup':>8}")
+    for size in sizes:
+        updatable = pygame.sprite.Group()
+        Asteroid.containers = (updatable,)
+        Shot.containers = (updatable,)
+        world = EntityWorld()
+        for _ in range(size // 2):
+            x, y = rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT)
+            velocity = pygame.Vector2(rng.uniform(-100, 100), rng.uniform(-100, 100))
+            Asteroid(x, y, ASTEROID_MIN_RADIUS).velocity = velocity
+            world.spawn_asteroid(x, y, ASTEROID_MIN_RADIUS, velocity)
+            # Shots would expire mid-benchmark; keep them alive for a stable count.
+            Shot(x, y).life_remaining = float("inf")
+            world.shots.spawn(x, y, SHOT_RADIUS, velocity)
+
+        groups_s = time_best_of(lambda: updatable.update(dt), repeat)
+        store_s = time_best_of(lambda: world.update(dt), repeat)
+        print(
+            f"{size:>8} {groups_s * 1000:>10.3f} {store_s * 1000:>9.3f} "
+            f"{groups_s / max(store_s, 1e-9):>7.1f}x"
+        )
+        updatable.empty()
+        world.clear()
+    Asteroid.containers = ()
+    Shot.containers = ()
+
+
+def bench_background(sizes: list[int], repeat: int, seed: int) -> None:
+    """Per-frame background cost: clear + per-surface alpha blend vs. a baked opaque copy."""
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    try:
+        image = pygame.image.load(BACKGROUND_IMAGE_PATH).convert()
+        image = pygame.transform.smoothscale(image, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    except Exception:
+        image = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        image.fill((40, 90, 160))
+    blended = image.copy()
+    blended.set_alpha(BACKGROUND_OPACITY)
+    baked = bake_opacity(image, BACKGROUND_OPACITY)
+
+    def alpha_frames(frames: int) -> None:
+        for _ in range(frames):
+            screen.fill("black")
+            screen.blit(blended, (0, 0))
+
+    def baked_frames(frames: int) -> None:
+        for _ in range(frames):
+            screen.blit(baked, (0, 0))
+
+    print(f"{'frames':>6} {'alpha ms/frame':>15} {'baked ms/frame':>15} {'speedup':>8}")
+    for size in sizes:
+        alpha_s = time_best_of(lambda: alpha_frames(size), repeat) / size
+        baked_s = time_best_of(lambda: baked_frames(size), repeat) / size
+        print(
+            f"{size:>6} {alpha_s * 1000:>15.3f} {baked_s * 1000:>15.3f} "
+            f"{alpha_s / max(baked_s, 1e-9):>7.1f}x"
+        )
+
+
+def bench_render(sizes: list[int], repeat: int, seed: int) -> None:
+    """Per-sprite `draw` calls vs. the layered `RenderQueue` submitted with `blits`."""
+    rng = random.Random(seed)
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    Asteroid.containers = ()
+    Shot.containers = ()
+    queue = RenderQueue()
+    print(f"{'sprites':>7} {'draw ms':>8} {'queue ms':>9} {'speedup':>8}")
+    for size in sizes:
+        sprites = []
+        for index in range(size):
+            x, y = rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT)
+            if index % 2:
+                sprites.append(Asteroid(x, y, ASTEROID_MIN_RADIUS * rng.randint(1, ASTEROID_KINDS)))
+            else:
+                shot = Shot(x, y)
+                shot.velocity = pygame.Vector2(rng.uniform(-1, 1), rng.uniform(-1, 1))
+                sprites.append(shot)
+
+        def per_sprite() -> None:
+            for sprite in sprites:
+                sprite.draw(screen)
+
+        def queued() -> None:
+            queue.enqueue_all(sprites)
+            queue.flush(screen)
+
+        draw_s = time_best_of(per_sprite, repeat)
+        queue_s = time_best_of(queued, repeat)
+        print(
+            f"{size:>7} {draw_s * 1000:>8.3f} {queue_s * 1000:>9.3f} "
+            f"{draw_s / max(queue_s, 1e-9):>7.2f}x"
+        )
+
+
+def bench_present(sizes: list[int], repeat: int, seed: int) -> None:
+    """Per-frame presentation cost of the software and texture-present backends (windowed)."""
+    results = {}
+    for backend in (SoftwareBackend(), TexturePresentBackend()):
+        display = backend.open(frame_size(), False)
+        layer = static_frame_layer(display, rebuild=True)
+        view = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        view.fill((30, 60, 90))
+        origin = frame_layout(display.get_size())[0].topleft
+
+        def frames(count: int) -> None:
+            for _ in range(count):
+                backend.present(layer, view, origin, static_stale=False)
+
+        results[backend.name] = [time_best_of(lambda: frames(size), repeat) / size for size in sizes]
+        backend.close()
+
+    print(f"{'frames':>6} {'software ms/frame':>18} {'texture-present ms/frame':>25}")
+    for index, size in enumerate(sizes):
+        print(
+            f"{size:>6} {results['software'][index] * 1000:>18.3f} "
+            f"{results['texture-present'][index] * 1000:>25.3f}"
+        )
+
+
+def bench_pipeline(sizes: list[int], repeat: int, seed: int) -> None:
+    """Simulate-and-render frame time: inline drawing vs. the `RenderPipeline` render thread."""
+    rng = random.Random(seed)
+    renderer = GameRenderer(menu_options=("New Game",))
+    frames = 60
+    dt = 1 / 60
+    print(f"{'entities':>8} {'inline ms/frame':>16} {'threaded ms/frame':>18} {'speedup':>8}")
+    for size in sizes:
+        world = EntityWorld()
+        for _ in range(size // 2):
+            x, y = rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT)
+            velocity = pygame.Vector2(rng.uniform(-100, 100), rng.uniform(-100, 100))
+            world.spawn_asteroid(x, y, ASTEROID_MIN_RADIUS * rng.randint(1, ASTEROID_KINDS), velocity)
+            world.shots.spawn(x, y, SHOT_RADIUS, velocity)
+        world.shots.lifetime[:] = float("inf")  # keep shots alive for a stable count
+
+        def inline() -> None:
+            for _ in range(frames):
+                world.update(dt)
+                renderer.draw_frame(renderer.game_frame((world,), 3, 3))
+                renderer.present()
+
+        def threaded() -> None:
+            pipeline = RenderPipeline(renderer)
+            for _ in range(frames):
+                world.update(dt)
+                pipeline.submit(renderer.game_frame((world,), 3, 3))
+            pipeline.close()
+
+        inline_s = time_best_of(inline, repeat) / frames
+        threaded_s = time_best_of(threaded, repeat) / frames
+        print(
+            f"{size:>8} {inline_s * 1000:>16.3f} {threaded_s * 1000:>18.3f} "
+            f"{inline_s / max(threaded_s, 1e-9):>7.2f}x"
+        )
+        world.clear()
+
+
+def bench_atlas(sizes: list[int], repeat: int, seed: int) -> None:
+    """Build time and pixel memory of the ship rotation atlas per angular step (degrees)."""
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    target_size = PLAYER_RADIUS * PLAYER_SPRITE_SIZE_MULTIPLIER
+    ship = load_scaled_sprite(PLAYER_SPRITE_PATH, target_size)
+    if ship is None:
+        ship = pygame.Surface((int(target_size), int(target_size)), pygame.SRCALPHA)
+        ship.fill((220, 220, 220, 255))
+
+    print(f"{'step':>4} {'frames':>6} {'build ms':>9} {'memory KiB':>11}")
+    for step in sizes:
+        build_s = time_best_of(lambda: RotationAtlas(ship, step), repeat)
+        atlas = RotationAtlas(ship, step)
+        print(
+            f"{atlas.step_degrees:>4} {len(atlas.frames):>6} {build_s * 1000:>9.2f} "
+            f"{atlas.memory_bytes() / 1024:>11.1f}"
+        )
+
+
+# Runs in a fresh interpreter so the imports are cold; prints the startup trace.
+_STARTUP_PROBE = """
+import json
+import main
+import pygame
+from game.render.startup import StartupScreen
+from game.utils.trace import startup_timeline, trace_mark
+
+pygame.init()
+args = main.parse_args(["--no-asset-cache", "--pacing", "uncapped"])
+renderer, _, loader = main.open_game_window(args, StartupScreen(min_duration_seconds=0.0))
+renderer.draw_frame(renderer.menu_frame(0))
+renderer.present()
+trace_mark("first_menu_frame")
+loader.cancel()
+timeline = startup_timeline()
+imports = [p["duration_ms"] for p in timeline["phases"] if p["phase"] == "import"]
+print(json.dumps(dict(timeline["marks"], import_ms=imports[0])))
+"""
+
+
+def bench_startup(sizes: list[int], repeat: int, seed: int) -> float:
+    """Launch to first menu frame in fresh interpreters, without the loading screen's minimum.
+
+    Returns the slowest median time to the menu, which `--max-ms` checks.
+    """
+    print(f"{'launches':>8} {'import ms':>10} {'first frame ms':>15} {'menu ms':>8}")
+    slowest_menu_ms = 0.0
+    for size in sizes:
+        runs = []
+        for _ in range(max(1, size)):
+            result = subprocess.run(
+                [sys.executable, "-c", _STARTUP_PROBE],
+                cwd=ROOT,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            runs.append(json.loads(result.stdout.strip().splitlines()[-1]))
+        menu_ms = statistics.median(run["first_menu_frame"] for run in runs)
+        slowest_menu_ms = max(slowest_menu_ms, menu_ms)
+        print(
+            f"{size:>8} {statistics.median(run['import_ms'] for run in runs):>10.0f} "
+            f"{statistics.median(run['first_frame'] for run in runs):>15.0f} "
+            f"{menu_ms:>8.0f}"
+        )
+    return slowest_menu_ms
+
+
+SCENARIOS = {
+    "atlas": bench_atlas,
+    "background": bench_background,
+    "collisions": bench_collisions,
+    "pipeline": bench_pipeline,
+    "present": bench_present,
+    "render": bench_render,
+    "startup": bench_startup,
+    "update": bench_update,
+}
+
+DEFAULT_SIZES = [50, 200, 800]
+# The render queue only pulls ahead of per-sprite draws from about 1000 sprites;
+# at gameplay counts the two are within noise of each other.
+SCENARIO_SIZES = {"render": [1000, 2000, 4000], "startup": [9]}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run game performance benchmarks.")
+    parser.add_argument("scenario", choices=sorted(SCENARIOS))
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=None,
+        help="Workload sizes (entities per group); defaults depend on the scenario",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Best-of repetitions")
+    parser.add_argument("--seed", type=int, default=1979)
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=None,
+        help="startup only: exit non-zero when the median time to the menu exceeds this",
+    )
+    args = parser.parse_args()
+    if args.max_ms is not None and args.scenario != "startup":
+        parser.error("--max-ms only applies to the startup scenario")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    try:
+        sizes = args.sizes or SCENARIO_SIZES.get(args.scenario, DEFAULT_SIZES)
+        measured_ms = SCENARIOS[args.scenario](sizes, args.repeat, args.seed)
+    finally:
+        pygame.quit()
+    if args.max_ms is not None and measured_ms > args.max_ms:
+        print(f"FAIL: {measured_ms:.0f} ms to the menu exceeds --max-ms {args.max_ms:.0f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,132 @@
+import os
+
+import pygame
+import pytest
+
+from game.config.constants import ASTEROID_MIN_RADIUS
+from game.entities.explosion import Explosion
+from game.render import asset_cache
+from game.render.asset_cache import (
+    asset_cache_status,
+    baked_frames,
+    load_asset_cache,
+    save_asset_cache,
+    unload_asset_cache,
+    warm_asset_groups,
+    write_asset_cache,
+)
+from game.render.asteroid_texture import asteroid_texture, asteroid_texture_handles
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    path = tmp_path / "asteroid-sm-1.png"
+    path.write_bytes(b"original pixels")
+    monkeypatch.setattr(asset_cache, "cache_sources", lambda: [str(path)])
+    yield path
+    unload_asset_cache()
+
+
+def _pixels(surface):
+    return pygame.image.tobytes(surface, "RGBA")
+
+
+def test_baked_frames_round_trip_through_the_mapping(tmp_path, source):
+    handles = asteroid_texture_handles(ASTEROID_MIN_RADIUS * 2)
+    descriptors = [asteroid_texture(handle) for handle in handles]
+    cache_path = str(tmp_path / "baked.bin")
+    write_asset_cache({"asteroid@test": descriptors}, cache_path)
+
+    assert load_asset_cache(cache_path) is not None
+    assert asset_cache_status() == "hit"
+    baked = baked_frames("asteroid@test")
+    assert baked_frames("asteroid@test") is baked
+    assert baked_frames("missing") is None
+    for (surface, offset), (baked_surface, baked_offset) in zip(descriptors, baked):
+        assert _pixels(baked_surface) == _pixels(surface)
+        assert baked_offset == offset
+
+
+def test_explosions_use_baked_frames_without_drawing(tmp_path, source, monkeypatch):
+    Explosion.prewarm([ASTEROID_MIN_RADIUS])
+    cache_path = str(tmp_path / "baked.bin")
+    write_asset_cache(warm_asset_groups(), cache_path)
+    expected = Explosion.frames_for_radius(ASTEROID_MIN_RADIUS, 1)[0]
+    load_asset_cache(cache_path)
+
+    def no_drawing(*args, **kwargs):
+        raise AssertionError("baked explosions should not be redrawn")
+
+    monkeypatch.setattr(Explosion, "_fallback_frame_cache", {})
+    monkeypatch.setattr(Explosion, "_scaled_frame_cache", {})
+    monkeypatch.setattr(Explosion, "_render_fallback_frame", no_drawing)
+    frames, _ = Explosion.frames_for_radius(ASTEROID_MIN_RADIUS, 1)
+
+    assert [_pixels(frame) for frame in frames] == [_pixels(frame) for frame in expected]
+
+
+def test_changed_sources_make_the_cache_stale(tmp_path, source):
+    cache_path = str(tmp_path / "baked.bin")
+    write_asset_cache({}, cache_path)
+
+    # Same bytes with a new mtime (a fresh checkout) still match by hash.
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert load_asset_cache(cache_path) is not None
+
+    source.write_bytes(b"edited pixels!!")
+    assert load_asset_cache(cache_path) is None
+    assert asset_cache_status() == "stale"
+    assert baked_frames("asteroid@test") is None
+
+
+def test_missing_and_corrupt_files_fall_back(tmp_path, source):
+    assert load_asset_cache(str(tmp_path / "absent.bin")) is None
+    assert asset_cache_status() == "missing"
+
+    corrupt = tmp_path / "corrupt.bin"
+    corrupt.write_bytes(b"not a cache")
+    assert load_asset_cache(str(corrupt)) is None
+    assert asset_cache_status() == "corrupt"
+
+
+def test_truncated_blobs_make_the_cache_corrupt(tmp_path, source):
+    handles = asteroid_texture_handles(ASTEROID_MIN_RADIUS * 2)
+    cache_path = tmp_path / "baked.bin"
+    write_asset_cache({"asteroid@test": [asteroid_texture(h) for h in handles]}, str(cache_path))
+    cache_path.write_bytes(cache_path.read_bytes()[:-4])
+
+    assert load_asset_cache(str(cache_path)) is None
+    assert asset_cache_status() == "corrupt"
+
+
+@pytest.mark.parametrize(
+    "header",
+    [b"[]", b'{"version": 1}', b'{"sources": [], "groups": {}}', b'{"sources": {"a": 1}}'],
+)
+def test_unexpected_headers_make_the_cache_corrupt(tmp_path, source, header):
+    cache_path = tmp_path / "foreign.bin"
+    cache_path.write_bytes(
+        asset_cache.MAGIC + asset_cache._HEADER_LENGTH.pack(len(header)) + header
+    )
+
+    assert load_asset_cache(str(cache_path)) is None
+    assert asset_cache_status() == "corrupt"
+
+
+def test_rebuilt_caches_go_to_the_user_path_and_the_bundle_is_read_first(
+    tmp_path, source, monkeypatch
+):
+    bundled = tmp_path / "bundle" / "baked.bin"
+    user = tmp_path / "user" / "baked.bin"
+    monkeypatch.setattr(asset_cache, "ASSET_CACHE_PATH", str(bundled))
+    monkeypatch.setattr(asset_cache, "ASSET_CACHE_USER_PATH", str(user))
+    monkeypatch.setattr(asset_cache, "warm_asset_groups", lambda: {})
+
+    assert load_asset_cache() is None
+    assert save_asset_cache()
+    assert user.exists() and not bundled.exists()
+    assert load_asset_cache().path == str(user)
+
+    write_asset_cache({}, str(bundled))
+    assert load_asset_cache().path == str(bundled)
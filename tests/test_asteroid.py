@@ -8,11 +8,7 @@ from game.entities.asteroid import Asteroid
 
 @pytest.fixture(autouse=True)
 def asteroid_test_setup(monkeypatch):
-    monkeypatch.setattr(
-        asteroid_module,
-        "build_asteroid_texture",
-        lambda radius, seed=None: (pygame.Surface((2, 2), pygame.SRCALPHA), pygame.Vector2(0, 0)),
-    )
+    monkeypatch.setattr(asteroid_module, "pick_asteroid_texture", lambda radius, rng: 0)
     monkeypatch.setattr(asteroid_module, "log_event", lambda *args, **kwargs: None)
     Asteroid.containers = tuple()
 
@@ -0,0 +1,31 @@
+import random
+
+from game.config.constants import ASTEROID_MIN_RADIUS
+from game.render.asteroid_texture import (
+    asteroid_texture,
+    asteroid_texture_handles,
+    asteroid_texture_variant,
+    pick_asteroid_texture,
+)
+
+
+def test_handles_are_built_once_per_size_class():
+    handles = asteroid_texture_handles(ASTEROID_MIN_RADIUS * 2)
+
+    assert handles
+    assert asteroid_texture_handles(ASTEROID_MIN_RADIUS * 2) is handles
+    for handle in handles:
+        surface, offset = asteroid_texture(handle)
+        assert surface.get_width() > 0 and surface.get_height() > 0
+
+
+def test_picked_handles_share_descriptors():
+    rng = random.Random(5)
+    radius = ASTEROID_MIN_RADIUS * 3
+    picks = [pick_asteroid_texture(radius, rng) for _ in range(50)]
+
+    assert set(picks) <= set(asteroid_texture_handles(radius))
+    first = picks[0]
+    assert asteroid_texture(first) is asteroid_texture(first)
+    variant = asteroid_texture_variant(radius, first)
+    assert asteroid_texture_handles(radius)[variant] == first
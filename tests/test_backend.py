@@ -0,0 +1,61 @@
+import pygame
+import pytest
+
+from game.config.constants import ASTEROID_MIN_RADIUS
+from game.entities.asteroid import Asteroid
+from game.render.backend import SOFTWARE, SoftwareBackend, TexturePresentBackend, create_backend
+from game.render.renderer import GameRenderer
+
+
+@pytest.fixture
+def texture_backend():
+    backend = TexturePresentBackend(driver="software")
+    yield backend
+    backend.close()
+
+
+def _presented_view(renderer):
+    left, top = renderer._game_origin()
+    frame = renderer.backend.read_pixels()
+    visible = renderer.game_surface.get_rect().move(left, top).clip(frame.get_rect())
+    presented = frame.subsurface(visible)
+    drawn = renderer.game_surface.subsurface(visible.move(-left, -top))
+    return pygame.image.tobytes(presented, "RGB"), pygame.image.tobytes(drawn, "RGB")
+
+
+@pytest.mark.parametrize("dirty_rects", [False, True])
+def test_texture_backend_composes_the_game_view(texture_backend, dirty_rects):
+    renderer = GameRenderer(("New Game", "Quit"), dirty_rects=dirty_rects, backend=texture_backend)
+    asteroid = Asteroid(300, 200, ASTEROID_MIN_RADIUS * 2)
+
+    renderer.render_game([asteroid], 3, 3)
+    renderer.present()
+    asteroid.position += (30, 10)
+    renderer.render_game([asteroid], 2, 3)
+    renderer.present()
+
+    presented, drawn = _presented_view(renderer)
+    assert presented == drawn
+    assert renderer.partial_presents == (1 if dirty_rects else 0)
+
+
+def test_texture_backend_uploads_the_static_layer_once(texture_backend):
+    renderer = GameRenderer(("New Game", "Quit"), backend=texture_backend)
+    for selected in (0, 1, 0):
+        renderer.render_menu(selected)
+        renderer.present()
+
+    # One static layer upload plus one view upload per frame.
+    assert texture_backend.uploads == 1 + 3
+
+
+def test_unknown_or_failed_backends_fall_back_to_software(monkeypatch):
+    assert create_backend("software").name == SOFTWARE
+
+    def broken_open(self, size, fullscreen):
+        raise pygame.error("no renderer")
+
+    monkeypatch.setattr(TexturePresentBackend, "open", broken_open)
+    renderer = GameRenderer(("New Game", "Quit"), backend="texture-present")
+    assert isinstance(renderer.backend, SoftwareBackend)
+    assert renderer.display_surface is pygame.display.get_surface()
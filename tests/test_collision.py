@@ -0,0 +1,88 @@
+import random
+
+import numpy as np
+
+from game.config.constants import SCREEN_HEIGHT, SCREEN_WIDTH
+from game.core.circleshape import CircleShape
+from game.systems.collision import find_hits, find_swept_hits, pack_circles, sweep_starts
+from game.systems.spatialhash import SpatialHash
+
+
+def _random_circles(rng, count, radii):
+    return [
+        CircleShape(
+            rng.uniform(-60, SCREEN_WIDTH + 60),
+            rng.uniform(-60, SCREEN_HEIGHT + 60),
+            rng.choice(radii),
+        )
+        for _ in range(count)
+    ]
+
+
+def test_pack_circles_preserves_order():
+    shapes = [CircleShape(1, 2, 3), CircleShape(4, 5, 6)]
+
+    positions, radii = pack_circles(shapes)
+
+    assert positions.tolist() == [[1.0, 2.0], [4.0, 5.0]]
+    assert radii.tolist() == [3.0, 6.0]
+
+
+def test_find_hits_matches_collides_with_for_grid_and_dense():
+    rng = random.Random(11)
+    shots = _random_circles(rng, 150, (5,))
+    asteroids = _random_circles(rng, 150, (20, 40, 60))
+    expected = [
+        (i, j)
+        for i, shot in enumerate(shots)
+        for j, asteroid in enumerate(asteroids)
+        if shot.collides_with(asteroid)
+    ]
+    shot_positions, shot_radii = pack_circles(shots)
+    asteroid_positions, asteroid_radii = pack_circles(asteroids)
+
+    for grid in (SpatialHash(), None):
+        query_idx, target_idx = find_hits(
+            shot_positions, shot_radii, asteroid_positions, asteroid_radii, grid
+        )
+        assert list(zip(query_idx.tolist(), target_idx.tolist())) == expected
+    assert expected
+
+
+def test_find_hits_handles_empty_batches():
+    positions, radii = pack_circles([CircleShape(0, 0, 1)])
+    empty = np.empty((0, 2)), np.empty(0)
+
+    query_idx, target_idx = find_hits(*empty, positions, radii, SpatialHash())
+
+    assert len(query_idx) == 0
+    assert len(target_idx) == 0
+
+
+def test_swept_hits_catch_tunnelling_and_order_by_time_of_impact():
+    # One shot crosses two asteroids in a single step; a discrete test at the end sees neither.
+    shot_start = np.array([[0.0, 0.0]])
+    shot_end = np.array([[200.0, 0.0]])
+    shot_radius = np.array([5.0])
+    asteroids = np.array([[120.0, 0.0], [60.0, 10.0]])
+    asteroid_radii = np.array([20.0, 20.0])
+
+    assert len(find_hits(shot_end, shot_radius, asteroids, asteroid_radii)[0]) == 0
+    query_idx, target_idx, toi = find_swept_hits(
+        shot_start, shot_end, shot_radius, asteroids, asteroids, asteroid_radii, SpatialHash()
+    )
+
+    assert query_idx.tolist() == [0, 0]
+    assert target_idx.tolist() == [1, 0]
+    assert 0.0 < toi[0] < toi[1] < 1.0
+
+
+def test_swept_hits_skip_screen_wraps():
+    previous = np.array([[SCREEN_WIDTH + 5.0, 100.0]])
+    current = np.array([[-5.0, 100.0]])
+    starts = sweep_starts(previous, current)
+    asteroid = np.array([[SCREEN_WIDTH / 2, 100.0]])
+
+    assert starts.tolist() == current.tolist()
+    hits = find_swept_hits(starts, current, np.array([5.0]), asteroid, asteroid, np.array([20.0]))
+    assert len(hits[0]) == 0
@@ -0,0 +1,98 @@
+import numpy as np
+import pygame
+import pytest
+
+import game.systems.world as world_module
+import main as game_main
+from game.config.constants import (
+    ASTEROID_MIN_RADIUS,
+    SCREEN_WIDTH,
+    SHOT_LIFETIME_SECONDS,
+    SHOT_RADIUS,
+)
+from game.core.circleshape import CircleShape
+from game.core.entitystore import EntityStore
+from game.systems.kinematics import advance_lifetimes, wrap_around_screen
+from game.systems.world import EntityWorld
+
+
+@pytest.fixture(autouse=True)
+def quiet_logs(monkeypatch):
+    monkeypatch.setattr(world_module, "log_event", lambda *args, **kwargs: None)
+    monkeypatch.setattr(game_main, "log_event", lambda *args, **kwargs: None)
+
+
+def test_killed_slots_are_reused_before_growing():
+    store = EntityStore(capacity=2)
+    first = store.spawn(0, 0, 5)
+    store.spawn(1, 1, 5)
+    store.kill(first)
+
+    reused = store.spawn(2, 2, 5)
+
+    assert reused == first
+    assert store.capacity == 2
+    assert len(store) == 2
+
+    store.spawn(3, 3, 5)
+    assert store.capacity == 4
+    assert len(store) == 3
+
+
+def test_wrap_matches_circleshape_on_every_edge():
+    positions = [(-11, 50), (SCREEN_WIDTH + 11, 50), (50, -11), (50, 900), (50, 50)]
+    store = EntityStore(capacity=len(positions))
+    shapes = []
+    for x, y in positions:
+        store.spawn(x, y, 10)
+        shapes.append(CircleShape(x, y, 10))
+
+    wrap_around_screen(store)
+    for shape in shapes:
+        shape.wrap_around_screen()
+
+    expected = [[shape.position.x, shape.position.y] for shape in shapes]
+    assert store.position[: len(positions)].tolist() == expected
+
+
+def test_shots_expire_after_lifetime():
+    store = EntityStore()
+    slot = store.spawn(0, 0, SHOT_RADIUS, lifetime=SHOT_LIFETIME_SECONDS)
+
+    advance_lifetimes(store, SHOT_LIFETIME_SECONDS + 0.01)
+
+    assert not store.alive[slot]
+    assert len(store) == 0
+
+
+def test_split_asteroid_spawns_two_children():
+    world = EntityWorld()
+    slot = world.spawn_asteroid(200, 180, ASTEROID_MIN_RADIUS * 3, (50, 0))
+
+    world.split_asteroid(slot)
+
+    live = world.asteroids.live_slots()
+    assert len(live) == 2
+    assert world.asteroids.radius[live].tolist() == [ASTEROID_MIN_RADIUS * 2] * 2
+    speeds = np.linalg.norm(world.asteroids.velocity[live], axis=1)
+    assert speeds == pytest.approx([60.0, 60.0])
+
+
+def test_entity_store_session_runs_update_collisions_and_draw():
+    session = game_main.create_game_session(use_entity_store=True)
+    world = session["world"]
+    world.spawn_asteroid(100, 100, ASTEROID_MIN_RADIUS * 2, (0, 0))
+    world.spawn_shot(105, 100, (0, 0))
+
+    game_main.update_session(session, 0.016)
+    player_dead = game_main.run_collision_pass(session)
+    for item in game_main.session_drawables(session):
+        item.draw(pygame.Surface((SCREEN_WIDTH, 720)))
+
+    assert not player_dead
+    assert len(world.shots) == 0
+    assert len(world.asteroids) == 2
+    assert len(world.explosions) == 1
+
+    game_main.clear_session(session)
+    assert len(world) == 0
@@ -0,0 +1,52 @@
+import pygame
+import pytest
+
+import game.entities.explosion as explosion_module
+from game.config.constants import EXPLOSION_SPARK_PATTERNS
+from game.core import rng
+from game.entities.explosion import Explosion
+
+
+@pytest.fixture(autouse=True)
+def fallback_burst(monkeypatch):
+    monkeypatch.setattr(Explosion, "_load_gif_frames", classmethod(lambda cls: []))
+    monkeypatch.setattr(Explosion, "_fallback_frame_cache", {})
+    Explosion.containers = tuple()
+    rng.seed_streams(7)
+
+
+def test_fallback_frames_are_shared_per_radius_bucket_and_pattern():
+    first, duration = Explosion.frames_for_radius(40, 1)
+    nearby, _ = Explosion.frames_for_radius(41, 1)
+    other_pattern, _ = Explosion.frames_for_radius(40, 2)
+
+    assert first is nearby
+    assert first is not other_pattern
+    assert len(first) > 1 and duration > 0
+
+
+def test_fallback_draw_is_a_single_blit_without_allocation(monkeypatch):
+    explosion = Explosion(100, 100, 40)
+    explosion.elapsed = 0.1
+    screen = pygame.Surface((300, 300), pygame.SRCALPHA)
+    monkeypatch.setattr(
+        explosion_module.pygame,
+        "Surface",
+        lambda *args, **kwargs: pytest.fail("draw allocated a surface"),
+    )
+
+    explosion.draw(screen)
+
+    assert screen.get_bounding_rect().width > 0
+
+
+def test_spark_pattern_survives_snapshot_and_restore():
+    explosion = Explosion(10, 20, 40)
+    state = explosion.snapshot()
+
+    restored = Explosion(0, 0, 20)
+    restored.restore(state)
+
+    assert 0 <= restored.spark_pattern < EXPLOSION_SPARK_PATTERNS
+    assert restored.spark_pattern == explosion.spark_pattern
+    assert restored.frames is explosion.frames
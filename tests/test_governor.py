@@ -0,0 +1,101 @@
+import functools
+import time
+
+import pytest
+
+import game.entities.asteroid as asteroid_module
+import game.systems.world as world_module
+import main as game_main
+from game.config.constants import ASTEROID_SPAWN_RATE_SECONDS
+from game.core import rng
+from game.render.pipeline import RenderPipeline
+from game.render.renderer import GameRenderer
+from game.systems.governor import PAUSED, THROTTLED, SpawnGovernor
+from game.systems.replay import ReplayDriver, ReplayRecorder
+
+
+@pytest.fixture(autouse=True)
+def quiet_logs(monkeypatch):
+    for module in (game_main, asteroid_module, world_module):
+        monkeypatch.setattr(module, "log_event", lambda *args, **kwargs: None)
+
+
+def test_entity_ceiling_throttles_then_pauses():
+    population = [0]
+    governor = SpawnGovernor(lambda: population[0], max_entities=10, throttle_ratio=0.5)
+    due = ASTEROID_SPAWN_RATE_SECONDS + 0.01
+
+    assert governor.spawn_due(due, ASTEROID_SPAWN_RATE_SECONDS)
+    population[0] = 5
+    assert not governor.spawn_due(due, ASTEROID_SPAWN_RATE_SECONDS)
+    assert governor.level == THROTTLED
+    assert governor.spawn_due(due * 2, ASTEROID_SPAWN_RATE_SECONDS)
+    population[0] = 10
+    assert not governor.spawn_due(due * 10, ASTEROID_SPAWN_RATE_SECONDS)
+    assert governor.metrics()["level"] == "paused"
+    assert (governor.spawned, governor.throttled_ticks, governor.paused_ticks) == (2, 1, 1)
+
+
+def test_slow_frames_raise_load_level():
+    governor = SpawnGovernor(lambda: 0, frame_budget_ms=10.0, smoothing=1.0)
+
+    governor.observe_frame(0.009)
+    assert governor.load_level == THROTTLED
+    governor.observe_frame(0.020)
+    assert governor.load_level == PAUSED
+    assert not governor.spawn_due(10.0, ASTEROID_SPAWN_RATE_SECONDS)
+
+
+def test_ceiling_bounds_population_deterministically(monkeypatch):
+    monkeypatch.setattr(game_main, "SpawnGovernor", functools.partial(SpawnGovernor, max_entities=6))
+    first = game_main.run_headless(3000, seed=11)
+    second = game_main.run_headless(3000, seed=11)
+
+    assert first["governor"]["paused_ticks"] > 0
+    assert first["peak_entities"] <= 6 + 4  # splits can overshoot the ceiling
+    assert first["governor"] == second["governor"]
+    assert first["entities"] == second["entities"]
+
+
+def test_recorded_load_levels_replay_exactly():
+    rng.seed_streams(5)
+    recorder = ReplayRecorder(5, 1 / 60, keyframe_interval=100)
+    session = game_main.create_game_session(input_source=recorder.input)
+    session["governor"].smoothing = 1.0
+    for tick in range(400):
+        if tick in (150, 260):
+            session["governor"].observe_frame(0.5 if tick == 150 else 0.0)
+        recorder.before_tick(session)
+        if game_main.step_session(session, 1 / 60):
+            break
+    game_main.clear_session(session)
+
+    assert set(recorder.replay.governor_levels) == {0, 150, 260}
+    # The replayed session keeps default smoothing: recorded levels, not frame times, drive it.
+    driver = ReplayDriver(recorder.replay, game_main.create_game_session, game_main.step_session)
+    assert driver.verify() == []
+
+
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_slow_rendering_raises_the_load_level(monkeypatch, pipelined):
+    renderer = GameRenderer(("New Game", "Quit"))
+    draw_frame = renderer.draw_frame
+
+    def slow_draw_frame(frame):
+        time.sleep(0.03)
+        draw_frame(frame)
+
+    monkeypatch.setattr(renderer, "draw_frame", slow_draw_frame)
+    governor = SpawnGovernor(lambda: 0, frame_budget_ms=20.0, smoothing=1.0)
+    pipeline = RenderPipeline(renderer) if pipelined else None
+    try:
+        for _ in range(2):
+            render_seconds = game_main.show_frame(renderer, renderer.game_frame([], 3, 3), pipeline)
+            if pipeline is not None:
+                pipeline.drain()
+            game_main.observe_frame_cost(governor, 0.001, render_seconds, pipelined)
+    finally:
+        if pipeline is not None:
+            pipeline.close()
+
+    assert governor.load_level == PAUSED
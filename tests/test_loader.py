@@ -0,0 +1,135 @@
+import threading
+
+import pygame
+
+from game.config.constants import ASTEROID_MIN_RADIUS
+from game.render import asteroid_texture
+from game.render.loader import AssetLoader
+from game.render.renderer import GameRenderer
+from game.render.startup import StartupScreen
+
+
+def _pixels(surface):
+    return pygame.image.tobytes(surface, "RGBA")
+
+
+def test_work_runs_on_workers_and_finish_on_the_pumping_thread():
+    loader = AssetLoader(workers=2)
+    threads = {}
+
+    def work(name):
+        threads[name] = threading.current_thread()
+        return name
+
+    def finish(result):
+        threads[f"{result} finish"] = threading.current_thread()
+        if result == "first":
+            loader.submit("follow-up", lambda: work("follow-up"), finish)
+
+    def broken():
+        raise OSError("unreadable")
+
+    loader.submit("first", lambda: work("first"), finish)
+    loader.submit("broken", broken)
+    assert loader.progress() == 0.0
+    loader.close()
+
+    assert loader.done
+    assert (loader.completed, loader.total, loader.progress()) == (3, 3, 1.0)
+    assert threads["first"] is not threading.main_thread()
+    assert threads["first finish"] is threading.main_thread()
+    assert threads["follow-up finish"] is threading.main_thread()
+    assert set(loader.stats()["worker_ms"]) == {"first", "broken", "follow-up"}
+
+
+def test_renderer_images_match_a_synchronous_load():
+    expected = GameRenderer(("New Game", "Quit"))
+    loader = AssetLoader()
+    renderer = GameRenderer(("New Game", "Quit"), loader=loader)
+    assert renderer.background is None
+    loader.close()
+
+    for attribute in ("background", "menu_background", "game_over_background"):
+        assert _pixels(getattr(renderer, attribute)) == _pixels(getattr(expected, attribute))
+    for option, images in expected.menu_option_images.items():
+        for state, image in images.items():
+            assert _pixels(renderer.menu_option_images[option][state]) == _pixels(image)
+
+
+def test_asteroid_textures_match_a_synchronous_load(monkeypatch):
+    radius = ASTEROID_MIN_RADIUS * 2
+    expected = [
+        asteroid_texture.asteroid_texture(handle)
+        for handle in asteroid_texture.asteroid_texture_handles(radius)
+    ]
+    monkeypatch.setattr(asteroid_texture, "_SPRITES_BY_SIZE", {"lg": [], "md": [], "sm": []})
+    monkeypatch.setattr(asteroid_texture, "_SCALED_CACHE", {})
+    monkeypatch.setattr(asteroid_texture, "_SPRITES_LOADED", False)
+    monkeypatch.setattr(asteroid_texture, "_DESCRIPTORS", [])
+    monkeypatch.setattr(asteroid_texture, "_HANDLES_BY_TARGET", {})
+
+    loader = AssetLoader()
+    asteroid_texture.submit_asteroid_textures(loader)
+    loader.close()
+
+    loaded = [
+        asteroid_texture.asteroid_texture(handle)
+        for handle in asteroid_texture.asteroid_texture_handles(radius)
+    ]
+    assert [_pixels(surface) for surface, _ in loaded] == [_pixels(s) for s, _ in expected]
+    assert [offset for _, offset in loaded] == [offset for _, offset in expected]
+
+
+def test_startup_screen_waits_for_the_loader_and_draws_progress(monkeypatch):
+    surface = pygame.display.set_mode((800, 600))
+    startup = StartupScreen(min_duration_seconds=0.0)
+    release = threading.Event()
+    loader = AssetLoader()
+    loader.submit("slow", release.wait)
+    seen = []
+
+    def render_step(_surface, progress=None):
+        seen.append(progress)
+        if len(seen) == 3:
+            release.set()
+        return True
+
+    class FakeClock:
+        def tick(self, _fps=None):
+            return 16
+
+    monkeypatch.setattr(startup, "render_step", render_step)
+    startup.start()
+    assert startup.hold_until_min_duration(surface, FakeClock(), loader)
+    loader.close()
+
+    assert len(seen) >= 3
+    assert seen[0] == 0.0
+    assert loader.done
+
+
+def test_progress_bar_is_drawn_over_the_loading_image():
+    pygame.display.set_mode((800, 600))
+    startup = StartupScreen(image_path="/tmp/does-not-exist-loading.png")
+    empty = startup._with_progress_bar(None, (400, 300), 0.0).copy()
+    full = startup._with_progress_bar(None, (400, 300), 1.0)
+
+    assert _pixels(empty) != _pixels(full)
+    assert full.get_at((200, 300 - 48 - 4))[:3] == (95, 220, 140)
+
+
+def test_cancel_drops_unfinished_work_without_waiting():
+    loader = AssetLoader(workers=1)
+    release = threading.Event()
+    finished = []
+    loader.submit("running", release.wait, finished.append)
+    loader.submit("queued", lambda: "queued", finished.append)
+    with loader.deferred():
+        loader.submit("held", lambda: "held", finished.append)
+
+    loader.cancel()
+    release.set()
+    loader.pump()
+
+    assert loader.done
+    assert finished == []
@@ -1,4 +1,23 @@
+import functools
+
+import pygame
+import pytest
+
+import game.entities.asteroid as asteroid_module
+import game.systems.world as world_module
 import main as game_main
+from game.config.constants import ASTEROID_MIN_RADIUS, PLAYER_SHOT_SPEED
+from game.core.input import ScriptedInput
+from game.entities.asteroid import Asteroid
+from game.entities.shot import Shot
+from game.render.startup import StartupScreen
+from game.systems.asteroidfield import AsteroidField
+
+
+@pytest.fixture(autouse=True)
+def quiet_logs(monkeypatch):
+    for module in (game_main, asteroid_module, world_module):
+        monkeypatch.setattr(module, "log_event", lambda *args, **kwargs: None)
 
 
 def test_create_game_session_initializes_expected_groups_and_player():
@@ -15,3 +34,161 @@ def test_create_game_session_initializes_expected_groups_and_player():
     for group_key in ("updatable", "drawable", "asteroids", "shots", "explosions"):
         session[group_key].empty()
 
+
+def test_collision_pass_splits_hit_asteroid_and_consumes_shot():
+    session = game_main.create_game_session()
+    asteroid = Asteroid(100, 100, ASTEROID_MIN_RADIUS * 2)
+    shot = Shot(105, 100)
+
+    player_dead = game_main.run_collision_pass(session)
+
+    assert not player_dead
+    assert not asteroid.alive()
+    assert not shot.alive()
+    assert len(session["asteroids"]) == 2
+    assert len(session["explosions"]) == 1
+
+    for group_key in ("updatable", "drawable", "asteroids", "shots", "explosions"):
+        session[group_key].empty()
+
+
+def test_run_headless_reports_throughput_and_phase_timings():
+    for use_entity_store in (False, True):
+        report = game_main.run_headless(120, seed=5, dt=1 / 30, use_entity_store=use_entity_store)
+
+        assert report["frames"] == 120
+        assert report["sim_seconds"] == pytest.approx(4.0)
+        assert report["ticks_per_s"] > 0
+        assert report["peak_entities"] > 0
+        assert set(report["phase_ms"]) == {"update", "collisions"}
+        assert set(report["entities"]) == {"asteroids", "shots", "explosions"}
+
+
+def _hits_at_tick_rate(monkeypatch, tick_rate, use_entity_store):
+    """Fire fixed shots at fixed asteroids for one simulated second; return the hit labels."""
+    session = game_main.create_game_session(
+        use_entity_store=use_entity_store, input_source=ScriptedInput(b"")
+    )
+    for sprite in session["updatable"].sprites():
+        if isinstance(sprite, AsteroidField):
+            sprite.kill()
+    world = session.get("world")
+
+    labels = {}
+
+    def spawn_shot(label, x, y):
+        if world is None:
+            shot = Shot(x, y)
+            shot.velocity.update(PLAYER_SHOT_SPEED, 0)
+            labels[id(shot)] = label
+        else:
+            labels[("shot", world.spawn_shot(x, y, (PLAYER_SHOT_SPEED, 0)))] = label
+
+    def spawn_asteroid(label, x, y, vx=0.0):
+        if world is None:
+            asteroid = Asteroid(x, y, ASTEROID_MIN_RADIUS)
+            asteroid.velocity.update(vx, 0)
+            labels[id(asteroid)] = label
+        else:
+            labels[("asteroid", world.spawn_asteroid(x, y, ASTEROID_MIN_RADIUS, (vx, 0)))] = label
+
+    # Grazes a small asteroid: a discrete 20 Hz check steps straight past it.
+    spawn_shot("graze", 110, 100)
+    spawn_asteroid("grazed", 300, 124)
+    # Two asteroids in a row: only the nearer one may be hit.
+    spawn_shot("row", 100, 250)
+    spawn_asteroid("near", 260, 250)
+    spawn_asteroid("far", 290, 250)
+    # Head-on with a moving asteroid, and a clean miss.
+    spawn_shot("head_on", 100, 500)
+    spawn_asteroid("oncoming", 500, 500, vx=-100)
+    spawn_shot("miss", 100, 650)
+    spawn_asteroid("missed", 400, 700)
+
+    hits = []
+    resolve = game_main._resolve_shot_hit
+
+    def record(session, shot, asteroid):
+        if world is None:
+            hits.append((labels[id(shot)], labels[id(asteroid)]))
+        else:
+            hits.append((labels[("shot", shot)], labels[("asteroid", asteroid)]))
+        resolve(session, shot, asteroid)
+
+    monkeypatch.setattr(game_main, "_resolve_shot_hit", record)
+    for _ in range(tick_rate):
+        game_main.step_session(session, 1 / tick_rate)
+    monkeypatch.setattr(game_main, "_resolve_shot_hit", resolve)
+    game_main.clear_session(session)
+    return sorted(hits)
+
+
+@pytest.mark.parametrize("use_entity_store", [False, True])
+def test_swept_collisions_give_same_hits_at_20_and_120_hz(monkeypatch, use_entity_store):
+    low = _hits_at_tick_rate(monkeypatch, 20, use_entity_store)
+    high = _hits_at_tick_rate(monkeypatch, 120, use_entity_store)
+
+    assert low == high == [("graze", "grazed"), ("head_on", "oncoming"), ("row", "near")]
+
+
+def test_closing_the_window_quits_the_game_loop(monkeypatch):
+    monkeypatch.setattr(
+        game_main, "StartupScreen", functools.partial(StartupScreen, min_duration_seconds=0.0)
+    )
+    shown = []
+    show_frame = game_main.show_frame
+
+    def counting_show_frame(*args):
+        shown.append(args[1].scene)
+        return show_frame(*args)
+
+    get_events = pygame.event.get
+
+    def close_after_the_menu():
+        events = get_events()
+        if shown:
+            events.append(pygame.event.Event(pygame.WINDOWCLOSE))
+        return events
+
+    monkeypatch.setattr(game_main, "show_frame", counting_show_frame)
+    monkeypatch.setattr(pygame.event, "get", close_after_the_menu)
+
+    game_main.main(["--no-asset-cache", "--pacing", "uncapped"])
+
+    assert shown == ["menu"]
+
+
+@pytest.mark.parametrize("player_dies", [False, True])
+def test_interactive_sessions_log_governor_metrics_once(monkeypatch, player_dies):
+    logged = []
+    monkeypatch.setattr(game_main, "log_event", lambda name, **fields: logged.append(name))
+    monkeypatch.setattr(
+        game_main, "StartupScreen", functools.partial(StartupScreen, min_duration_seconds=0.0)
+    )
+    if player_dies:
+        monkeypatch.setattr(game_main, "step_session", lambda session, dt: True)
+    last_scene = "game_over" if player_dies else "game"
+    shown = []
+    show_frame = game_main.show_frame
+
+    def counting_show_frame(*args):
+        shown.append(args[1].scene)
+        return show_frame(*args)
+
+    get_events = pygame.event.get
+
+    def start_then_close():
+        events = get_events()
+        if shown == ["menu"]:
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN))
+        elif shown and shown[-1] == last_scene:
+            events.append(pygame.event.Event(pygame.WINDOWCLOSE))
+        return events
+
+    monkeypatch.setattr(game_main, "show_frame", counting_show_frame)
+    monkeypatch.setattr(pygame.event, "get", start_then_close)
+
+    game_main.main(["--no-asset-cache", "--pacing", "uncapped"])
+
+    assert shown[-1] == last_scene
+    assert logged.count("spawn_governor") == 1
@@ -0,0 +1,64 @@
+import pytest
+
+from game.core.pacing import PRECISE, UNCAPPED, VSYNC, FramePacer
+
+
+class FakeTime:
+    """Deterministic stand-in for `perf_counter` and `sleep`; every clock read costs 0.1 ms."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def clock(self):
+        self.now += 0.0001
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _pacer(mode, fake, **kwargs):
+    return FramePacer(mode, target_fps=50, clock=fake.clock, sleep=fake.sleep, **kwargs)
+
+
+def test_precise_limiter_sleeps_then_spins_to_each_deadline():
+    fake = FakeTime()
+    pacer = _pacer(PRECISE, fake, spin_ms=2.0)
+
+    intervals = [pacer.tick() for _ in range(6)][1:]
+
+    assert intervals == pytest.approx([20.0] * 5, abs=0.25)
+    assert all(seconds <= 0.018 + 1e-9 for seconds in fake.slept)
+    stats = pacer.stats()
+    assert stats["mode"] == PRECISE and stats["frames"] == 5
+    assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+
+
+def test_precise_limiter_keeps_its_schedule_after_a_slow_frame():
+    fake = FakeTime()
+    pacer = _pacer(PRECISE, fake)
+    pacer.tick()
+    pacer.tick()
+    fake.now += 0.015  # A frame that used most of its budget.
+
+    assert pacer.tick() == pytest.approx(20.0, abs=0.25)
+
+
+def test_uncapped_never_waits_and_vsync_caps_above_the_refresh_rate():
+    fake = FakeTime()
+    uncapped = _pacer(UNCAPPED, fake)
+    for _ in range(5):
+        uncapped.tick()
+    assert fake.slept == []
+    assert uncapped.stats()["p99_ms"] < 1.0
+
+    vsync = _pacer(VSYNC, fake)
+    intervals = [vsync.tick() for _ in range(4)][1:]
+    assert intervals == pytest.approx([1000 / (50 * 1.1)] * 3, abs=0.25)
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        FramePacer("turbo")
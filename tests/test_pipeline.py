@@ -0,0 +1,125 @@
+import pygame
+import pytest
+
+from game.config.constants import ASTEROID_MIN_RADIUS
+from game.core import rng
+from game.entities.asteroid import Asteroid
+from game.entities.player import Player
+from game.entities.shot import Shot
+from game.render.pipeline import RenderPipeline
+from game.render.renderer import GameRenderer
+
+
+def _scene():
+    rng.seed_streams(7)
+    asteroid = Asteroid(300, 200, ASTEROID_MIN_RADIUS * 2)
+    shot = Shot(600, 400)
+    shot.velocity.update(500, 0)
+    return [asteroid, shot, Player(640, 360)]
+
+
+def _play(renderer, drawable, submit):
+    submit(renderer.menu_frame(0))
+    for health in (3, 2):
+        for item in drawable:
+            item.position += (12, 7)
+        submit(renderer.game_frame(drawable, health, 3))
+    submit(renderer.game_over_frame(drawable))
+    submit(renderer.menu_frame(1))
+    submit(renderer.game_frame(drawable, 2, 3))
+
+
+@pytest.mark.parametrize("dirty_rects", [False, True])
+def test_pipelined_frames_match_inline_rendering(dirty_rects):
+    inline = GameRenderer(("New Game", "Quit"), dirty_rects=dirty_rects)
+
+    def draw_now(frame):
+        inline.draw_frame(frame)
+        inline.present()
+
+    _play(inline, _scene(), draw_now)
+
+    threaded = GameRenderer(("New Game", "Quit"), dirty_rects=dirty_rects)
+    pipeline = RenderPipeline(threaded)
+    drawable = _scene()
+    _play(threaded, drawable, pipeline.submit)
+    pipeline.close()
+
+    assert pipeline.frames_presented == 6
+    assert (threaded.full_presents, threaded.partial_presents) == (
+        inline.full_presents,
+        inline.partial_presents,
+    )
+    assert pygame.image.tobytes(threaded.game_surface, "RGB") == pygame.image.tobytes(
+        inline.game_surface, "RGB"
+    )
+    # The game frame after the menu shows the game, whichever way it was drawn.
+    reference = GameRenderer(("New Game", "Quit"))
+    reference.render_game(drawable, 2, 3)
+    assert pygame.image.tobytes(threaded.game_surface, "RGB") == pygame.image.tobytes(
+        reference.game_surface, "RGB"
+    )
+
+
+def test_frames_do_not_follow_entities_after_submission():
+    renderer = GameRenderer(("New Game", "Quit"))
+    rng.seed_streams(7)
+    asteroid = Asteroid(300, 200, ASTEROID_MIN_RADIUS * 2)
+    frame = renderer.game_frame([asteroid], 3, 3)
+    asteroid.position += (200, 100)
+
+    renderer.draw_frame(frame)
+    expected = GameRenderer(("New Game", "Quit"))
+    rng.seed_streams(7)
+    expected.render_game([Asteroid(300, 200, ASTEROID_MIN_RADIUS * 2)], 3, 3)
+    assert pygame.image.tobytes(renderer.game_surface, "RGB") == pygame.image.tobytes(
+        expected.game_surface, "RGB"
+    )
+
+
+def test_drain_waits_for_queued_frames_and_close_stops_the_thread():
+    renderer = GameRenderer(("New Game", "Quit"))
+    pipeline = RenderPipeline(renderer)
+    for selected in (0, 1, 0):
+        pipeline.submit(renderer.menu_frame(selected))
+    pipeline.drain()
+    assert pipeline.frames_presented == 3
+
+    renderer.toggle_fullscreen()
+    pipeline.submit(renderer.menu_frame(1))
+    pipeline.close()
+    assert pipeline.frames_presented == 4
+    assert not pipeline._thread.is_alive()
+
+
+def test_render_thread_errors_reach_the_main_thread(monkeypatch):
+    renderer = GameRenderer(("New Game", "Quit"))
+
+    def broken_present():
+        raise pygame.error("display lost")
+
+    monkeypatch.setattr(renderer, "present", broken_present)
+    pipeline = RenderPipeline(renderer)
+    pipeline.submit(renderer.menu_frame(0))
+    with pytest.raises(pygame.error, match="display lost"):
+        pipeline.drain()
+    with pytest.raises(pygame.error):
+        pipeline.submit(renderer.menu_frame(1))
+    pipeline.close()
+
+
+def test_close_can_leave_a_render_error_to_the_one_in_flight(monkeypatch):
+    renderer = GameRenderer(("New Game", "Quit"))
+
+    def broken_present():
+        raise pygame.error("display lost")
+
+    monkeypatch.setattr(renderer, "present", broken_present)
+    pipeline = RenderPipeline(renderer)
+    pipeline.submit(renderer.menu_frame(0))
+    with pytest.raises(KeyError):
+        try:
+            raise KeyError("simulation failed")
+        finally:
+            pipeline.close(raise_error=False)
+    assert not pipeline._thread.is_alive()
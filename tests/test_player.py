@@ -0,0 +1,47 @@
+import pygame
+import pytest
+
+import game.render.rotation_atlas as atlas_module
+from game.config.constants import ROTATION_ATLAS_STEP_DEGREES
+from game.entities.player import Player
+from game.render.rotation_atlas import SHIP, SHIP_INVULNERABLE, RotationAtlas
+
+
+@pytest.fixture
+def ship_atlas(monkeypatch):
+    sprite = pygame.Surface((30, 30), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (200, 120, 60, 220), (15, 15), 12)
+    atlas = RotationAtlas(sprite, ROTATION_ATLAS_STEP_DEGREES)
+    monkeypatch.setattr(
+        atlas_module,
+        "_ATLASES",
+        {
+            (SHIP, ROTATION_ATLAS_STEP_DEGREES): atlas,
+            (SHIP_INVULNERABLE, ROTATION_ATLAS_STEP_DEGREES): None,
+        },
+    )
+    return atlas
+
+
+def test_players_share_the_rotation_atlas(ship_atlas):
+    first = Player(50, 50)
+    second = Player(80, 80)
+    first.rotation = second.rotation = 33
+
+    assert first._Player__get_rotated_sprite() is second._Player__get_rotated_sprite()
+
+
+def test_invulnerable_pulse_matches_a_faded_copy_and_leaves_the_sprite_opaque(ship_atlas):
+    player = Player(50, 50)
+    player.set_invulnerable(True)
+    screen = pygame.Surface((100, 100))
+
+    player.draw(screen)
+
+    rotated = player._Player__get_rotated_sprite()
+    assert rotated.get_alpha() == 255
+    faded = rotated.copy()
+    faded.set_alpha(155 + 50)
+    expected = pygame.Surface((100, 100))
+    expected.blit(faded, faded.get_rect(center=(50, 50)).topleft)
+    assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(expected, "RGB")
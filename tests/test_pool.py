@@ -0,0 +1,89 @@
+import pytest
+import pygame
+from game.core.pool import ObjectPool, pool_stats
+from game.entities import asteroid as asteroid_module
+from game.entities.asteroid import Asteroid
+from game.entities.explosion import Explosion
+from game.entities.shot import Shot
+from game.config.constants import ASTEROID_MIN_RADIUS, SHOT_LIFETIME_SECONDS
+
+
+class Item:
+    def __init__(self, value):
+        self.value = value
+
+    def reset(self, value):
+        self.value = value
+
+
+@pytest.fixture
+def fresh_pools(monkeypatch):
+    monkeypatch.setattr(asteroid_module, "log_event", lambda *args, **kwargs: None)
+    for cls, name in ((Shot, "shots"), (Asteroid, "asteroids"), (Explosion, "explosions")):
+        monkeypatch.setattr(cls, "pool", ObjectPool(name, cls, 8))
+    yield
+    for cls in (Shot, Asteroid, Explosion):
+        if hasattr(cls, "containers"):
+            del cls.containers
+
+
+def test_pool_counts_hits_misses_and_high_water():
+    pool = ObjectPool("test_items", Item, capacity=1)
+    first = pool.acquire(1)
+    second = pool.acquire(2)
+    pool.release(first)
+    pool.release(second)
+    pool.release(second)  # double release is ignored
+    reused = pool.acquire(3)
+
+    assert reused is first and reused.value == 3
+    stats = pool.stats()
+    assert (stats["hits"], stats["misses"], stats["high_water"]) == (1, 2, 2)
+    assert stats["discarded"] == 1 and stats["live"] == 1
+    assert pool_stats()["test_items"] == stats
+
+
+def test_killed_shot_is_reset_on_reuse(fresh_pools):
+    shots = pygame.sprite.Group()
+    Shot.containers = (shots,)
+    shot = Shot.spawn(10, 20)
+    shot.velocity.update(300, 0)
+    shot.life_remaining = 0.1
+    shot.kill()
+    assert len(shots) == 0
+
+    again = Shot.spawn(50, 60)
+    assert again is shot
+    assert shots.sprites() == [again]
+    assert again.position == pygame.Vector2(50, 60)
+    assert again.velocity == pygame.Vector2(0, 0)
+    assert again.life_remaining == SHOT_LIFETIME_SECONDS
+
+
+def test_split_can_reuse_the_parent_asteroid(fresh_pools):
+    asteroids = pygame.sprite.Group()
+    Asteroid.containers = (asteroids,)
+    parent = Asteroid.spawn(100, 100, ASTEROID_MIN_RADIUS * 2)
+    parent.velocity.update(50, 0)
+    parent.split()
+
+    children = asteroids.sprites()
+    assert len(children) == 2 and parent in children
+    for child in children:
+        assert child.position == pygame.Vector2(100, 100)
+        assert child.radius == ASTEROID_MIN_RADIUS
+        assert child.velocity.length() == pytest.approx(60)
+
+
+def test_sessions_reuse_pooled_sprites(fresh_pools):
+    import main
+
+    session = main.create_game_session(use_entity_store=False)
+    Explosion.spawn(0, 0, 20)
+    main.clear_session(session)
+    session = main.create_game_session(use_entity_store=False)
+    Explosion.spawn(0, 0, 20)
+    main.clear_session(session)
+
+    stats = Explosion.pool.stats()
+    assert stats["misses"] == 1 and stats["hits"] == 1
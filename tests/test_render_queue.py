@@ -0,0 +1,51 @@
+import pygame
+
+from game.render.queue import LAYER_ASTEROIDS, LAYER_HUD, LAYER_SHIP, LAYER_SHOTS, RenderQueue
+
+
+def _square(color, size=10):
+    surface = pygame.Surface((size, size))
+    surface.fill(color)
+    return surface
+
+
+def test_layers_draw_in_order_and_commands_keep_submission_order():
+    red, green, blue = _square("red"), _square("green"), _square("blue")
+    queue = RenderQueue()
+    queue.submit(LAYER_HUD, blue, (4, 4))
+    queue.submit(LAYER_SHOTS, green, (2, 2))
+    queue.submit(LAYER_ASTEROIDS, red, (0, 0))
+    queue.submit(LAYER_SHOTS, red, (3, 3))
+    screen = pygame.Surface((20, 20))
+
+    queue.flush(screen)
+
+    expected = pygame.Surface((20, 20))
+    for surface, dest in ((red, (0, 0)), (green, (2, 2)), (red, (3, 3)), (blue, (4, 4))):
+        expected.blit(surface, dest)
+    assert pygame.image.tobytes(screen, "RGB") == pygame.image.tobytes(expected, "RGB")
+    assert queue.commands == 4 and queue.batches == 3
+    assert not any(queue.layers)
+
+
+def test_callbacks_run_between_batches_at_their_submission_point():
+    drawn = []
+
+    class Recorder(pygame.Surface):
+        def blits(self, blit_sequence, doreturn=1):
+            drawn.extend(dest for _, dest in blit_sequence)
+
+    class Outline:
+        def draw(self, screen):
+            drawn.append("outline")
+
+    square = _square("white")
+    queue = RenderQueue()
+    queue.submit(LAYER_SHIP, square, (0, 0))
+    queue.enqueue_all([Outline()], default_layer=LAYER_SHIP)
+    queue.submit(LAYER_SHIP, square, (1, 1))
+    queue.submit_callback(LAYER_HUD, Outline().draw)
+
+    queue.flush(Recorder((5, 5)))
+
+    assert drawn == [(0, 0), "outline", (1, 1), "outline"]
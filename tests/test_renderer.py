@@ -0,0 +1,143 @@
+import pygame
+
+from game.config.constants import ASTEROID_MIN_RADIUS
+from game.entities.asteroid import Asteroid
+from game.entities.shot import Shot
+from game.render.frame import bake_opacity, static_frame_layer
+from game.render.renderer import GameRenderer
+from game.render.startup import StartupScreen
+
+
+def _presented_and_drawn(renderer):
+    """Return the visible part of the game view on the display and the same area of the game surface."""
+    left, top = renderer._game_origin()
+    display = renderer.display_surface
+    visible = renderer.game_surface.get_rect().move(left, top).clip(display.get_rect())
+    presented = display.subsurface(visible)
+    drawn = renderer.game_surface.subsurface(visible.move(-left, -top))
+    return pygame.image.tobytes(presented, "RGB"), pygame.image.tobytes(drawn, "RGB")
+
+
+def test_dirty_rect_frames_match_a_full_redraw():
+    renderer = GameRenderer(("New Game", "Quit"), dirty_rects=True)
+    asteroid = Asteroid(300, 200, ASTEROID_MIN_RADIUS * 2)
+    shot = Shot(600, 400)
+    shot.velocity.update(500, 0)
+    drawable = [asteroid, shot]
+
+    renderer.render_game(drawable, 3, 3)
+    renderer.present()
+    asteroid.position += (40, 25)
+    shot.position += (8, 0)
+    renderer.render_game(drawable, 2, 3)
+    renderer.present()
+
+    assert (renderer.full_presents, renderer.partial_presents) == (1, 1)
+    presented, drawn = _presented_and_drawn(renderer)
+    assert presented == drawn
+
+    reference = GameRenderer(("New Game", "Quit"))
+    reference.render_game(drawable, 2, 3)
+    assert pygame.image.tobytes(renderer.game_surface, "RGB") == pygame.image.tobytes(
+        reference.game_surface, "RGB"
+    )
+
+
+def test_dirty_rect_game_frame_after_the_menu_redraws_everything():
+    renderer = GameRenderer(("New Game", "Quit"), dirty_rects=True)
+    drawable = [Asteroid(300, 200, ASTEROID_MIN_RADIUS * 2)]
+    reference = GameRenderer(("New Game", "Quit"))
+    reference.render_game(drawable, 3, 3)
+    expected = pygame.image.tobytes(reference.game_surface, "RGB")
+
+    for _ in range(2):
+        renderer.render_menu(0)
+        renderer.present()
+        renderer.render_game(drawable, 3, 3)
+        renderer.present()
+
+        assert pygame.image.tobytes(renderer.game_surface, "RGB") == expected
+        presented, drawn = _presented_and_drawn(renderer)
+        assert presented == drawn
+    assert (renderer.full_presents, renderer.partial_presents) == (4, 0)
+
+
+def test_dirty_rect_mode_falls_back_to_full_flip():
+    renderer = GameRenderer(("New Game", "Quit"), dirty_rects=True)
+    drawable = [Asteroid(200, 200, ASTEROID_MIN_RADIUS)]
+    renderer.render_game(drawable, 3, 3)
+    renderer.present()
+
+    renderer.toggle_fullscreen()
+    renderer.render_game(drawable, 3, 3)
+    renderer.present()
+    crowd = [
+        Asteroid(x, y, ASTEROID_MIN_RADIUS * 3) for x in range(0, 1280, 100) for y in range(0, 720, 100)
+    ]
+    renderer.render_game(crowd, 3, 3)
+    renderer.present()
+
+    assert (renderer.full_presents, renderer.partial_presents) == (3, 0)
+
+
+def test_static_frame_layer_is_shared_and_rebuilt_on_toggle():
+    renderer = GameRenderer(("New Game", "Quit"))
+    layer = renderer.static_layer
+
+    assert static_frame_layer(renderer.display_surface) is layer
+    renderer.render_menu(0)
+    renderer.present()
+    assert not renderer._static_stale
+
+    renderer.toggle_fullscreen()
+    assert renderer._static_stale
+    assert renderer.static_layer.get_size() == renderer.display_surface.get_size()
+    startup = StartupScreen(image_path="/tmp/does-not-exist-loading.png")
+    assert startup.render_step(renderer.display_surface)
+    assert static_frame_layer(renderer.display_surface) is renderer.static_layer
+
+
+def test_baked_background_matches_alpha_blend_over_black():
+    image = pygame.Surface((8, 8)).convert()
+    image.fill((200, 100, 40))
+    blended = image.copy()
+    blended.set_alpha(120)
+    expected = pygame.Surface((8, 8)).convert()
+    expected.fill("black")
+    expected.blit(blended, (0, 0))
+
+    baked = bake_opacity(image, 120)
+
+    assert baked.get_alpha() is None
+    assert pygame.image.tobytes(baked, "RGB") == pygame.image.tobytes(expected, "RGB")
+
+
+def test_menu_frames_are_cached_per_selection(monkeypatch):
+    renderer = GameRenderer(("New Game", "Quit"))
+    renderer.render_menu(0)
+    first = renderer._menu_frames[0]
+
+    def no_scaling(*args, **kwargs):
+        raise AssertionError("menu rendering should not rescale images")
+
+    monkeypatch.setattr(pygame.transform, "smoothscale", no_scaling)
+    renderer.render_menu(1)
+    renderer.render_menu(0)
+    assert renderer._menu_frames[0] is first
+    assert pygame.image.tobytes(renderer.game_surface, "RGB") == pygame.image.tobytes(first, "RGB")
+    monkeypatch.undo()
+
+    renderer.set_menu_options(("Resume", "New Game", "Quit"))
+    assert renderer._menu_frames == {}
+    renderer.render_menu(2)
+    assert set(renderer._menu_frames) == {2}
+
+
+def test_hud_is_rebuilt_only_when_health_changes():
+    renderer = GameRenderer(("New Game", "Quit"))
+    for health in (3, 3, 3, 2, 2):
+        renderer.render_game([], health, 3)
+
+    stats = renderer.render_stats()
+    assert stats["hud_rebuilds"] == 2
+    assert stats["text_cache"]["misses"] >= 2
@@ -0,0 +1,48 @@
+import pygame
+import pytest
+
+import game.render.rotation_atlas as atlas_module
+from game.render.rotation_atlas import (
+    MISSILE,
+    SHIP,
+    RotationAtlas,
+    prewarm_rotation_atlases,
+    rotation_atlas,
+    rotation_atlas_stats,
+)
+
+
+@pytest.fixture
+def base_sprites(monkeypatch):
+    ship = pygame.Surface((24, 12), pygame.SRCALPHA)
+    ship.fill((255, 255, 255, 255))
+    sprites = {SHIP: ship, MISSILE: ship.copy()}
+    monkeypatch.setattr(atlas_module, "_ATLASES", {})
+    monkeypatch.setattr(
+        atlas_module, "_base_sprite", lambda name: sprites.get(name)
+    )
+    return sprites
+
+
+def test_atlas_returns_the_nearest_precomputed_rotation():
+    base = pygame.Surface((24, 12), pygame.SRCALPHA)
+    atlas = RotationAtlas(base, 15)
+
+    assert len(atlas.frames) == 24
+    assert atlas.sprite_for(31) is atlas.frames[2]
+    assert atlas.sprite_for(-15) is atlas.frames[23]
+    assert atlas.sprite_for(360) is atlas.frames[0]
+    assert atlas.frames[6].get_size() == pygame.transform.rotozoom(base, 90, 1.0).get_size()
+
+
+def test_prewarm_builds_shared_atlases_and_reports_memory(base_sprites):
+    prewarm_rotation_atlases(step_degrees=10)
+
+    atlas = rotation_atlas(SHIP, 10)
+    assert atlas is not None and len(atlas.frames) == 36
+    assert rotation_atlas(SHIP, 10) is atlas
+
+    stats = rotation_atlas_stats()
+    assert set(stats["atlases"]) == {"missile@10", "ship@10"}
+    assert stats["atlases"]["ship@10"]["bytes"] == atlas.memory_bytes() > 0
+    assert stats["total_bytes"] == sum(entry["bytes"] for entry in stats["atlases"].values())
@@ -0,0 +1,53 @@
+import random
+
+from game.config.constants import ASTEROID_MAX_RADIUS, SCREEN_HEIGHT, SCREEN_WIDTH
+from game.core.circleshape import CircleShape
+from game.systems.spatialhash import ReferenceSpatialHash
+
+
+def test_query_finds_same_pairs_as_brute_force():
+    rng = random.Random(7)
+    asteroids = [
+        CircleShape(
+            rng.uniform(-ASTEROID_MAX_RADIUS, SCREEN_WIDTH + ASTEROID_MAX_RADIUS),
+            rng.uniform(-ASTEROID_MAX_RADIUS, SCREEN_HEIGHT + ASTEROID_MAX_RADIUS),
+            rng.choice((20, 40, 60)),
+        )
+        for _ in range(120)
+    ]
+    shots = [
+        CircleShape(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT), 5)
+        for _ in range(120)
+    ]
+    grid = ReferenceSpatialHash()
+    grid.rebuild(asteroids)
+
+    expected = {
+        (id(shot), id(asteroid))
+        for shot in shots
+        for asteroid in asteroids
+        if shot.collides_with(asteroid)
+    }
+    found = {
+        (id(shot), id(asteroid))
+        for shot in shots
+        for asteroid in grid.query(shot.position)
+        if shot.collides_with(asteroid)
+    }
+
+    assert expected
+    assert found == expected
+
+
+def test_shapes_past_screen_edge_map_to_valid_wrapped_cells():
+    grid = ReferenceSpatialHash()
+    past_left = CircleShape(-ASTEROID_MAX_RADIUS, 100, ASTEROID_MAX_RADIUS)
+    past_right = CircleShape(SCREEN_WIDTH + ASTEROID_MAX_RADIUS, 100, ASTEROID_MAX_RADIUS)
+    grid.rebuild([past_left, past_right])
+
+    for shape in (past_left, past_right):
+        col, row = grid.cell_for(shape.position)
+        assert 0 <= col < grid.cols
+        assert 0 <= row < grid.rows
+        assert shape in grid.query(shape.position)
+    assert len(grid) == 2
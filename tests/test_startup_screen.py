@@ -29,12 +29,12 @@ def test_hold_until_min_duration_waits_and_repaints(monkeypatch):
 
     calls = {"render": 0, "ticks": 0}
 
-    def fake_render_step(_surface):
+    def fake_render_step(_surface, _progress=None):
         calls["render"] += 1
         return True
 
     class FakeClock:
-        def tick(self, _fps):
+        def tick(self, _fps=None):
             calls["ticks"] += 1
             return 20  # ms
 
@@ -46,3 +46,11 @@ def test_hold_until_min_duration_waits_and_repaints(monkeypatch):
     assert calls["render"] > 0
     assert calls["ticks"] > 0
 
+
+
+def test_render_step_stops_when_the_window_is_closed():
+    surface = pygame.display.set_mode((800, 600))
+    startup = StartupScreen(image_path="/tmp/does-not-exist-loading.png")
+    pygame.event.post(pygame.event.Event(pygame.WINDOWCLOSE))
+
+    assert not startup.render_step(surface)
@@ -0,0 +1,97 @@
+import threading
+
+import pygame
+
+import main
+from game.render.backend import SoftwareBackend
+from game.render.loader import AssetLoader
+from game.render.startup import StartupScreen
+from game.utils.trace import record_phase, reset_trace, startup_timeline, trace_mark, trace_phase
+
+
+def _count_set_mode(monkeypatch):
+    calls = []
+    set_mode = pygame.display.set_mode
+
+    def counting_set_mode(*args, **kwargs):
+        calls.append(args)
+        return set_mode(*args, **kwargs)
+
+    monkeypatch.setattr(pygame.display, "set_mode", counting_set_mode)
+    return calls
+
+
+def test_timeline_records_phases_marks_and_worker_threads():
+    reset_trace()
+    with trace_phase("display"):
+        pass
+    worker = threading.Thread(
+        target=record_phase, args=("load sprites", 0.0, 0.0), name="assets_0"
+    )
+    worker.start()
+    worker.join()
+    assert trace_mark("first_frame") >= 0.0
+
+    timeline = startup_timeline()
+    phases = {phase["phase"]: phase for phase in timeline["phases"]}
+    assert set(phases) == {"display", "load sprites"}
+    assert phases["display"]["duration_ms"] >= 0.0
+    assert "thread" not in phases["display"]
+    assert phases["load sprites"]["thread"] == "assets_0"
+    assert set(timeline["marks"]) == {"first_frame"}
+
+
+def test_deferred_tasks_do_not_hold_the_loader_back():
+    loader = AssetLoader(workers=2)
+    release = threading.Event()
+    with loader.deferred():
+        # Its follow-up is deferred too.
+        loader.submit("gameplay", release.wait, lambda _: loader.submit("follow-up", lambda: None))
+    loader.submit("menu", lambda: None)
+    loader.submit("menu options", lambda: None)
+
+    while not loader.pump():
+        pass
+    assert loader.progress() == 1.0
+    assert not loader.done
+    release.set()
+    loader.close()
+
+    assert loader.done and loader.ready
+    assert (loader.completed, loader.upfront_completed) == (4, 2)
+
+
+def test_software_backend_keeps_a_display_mode_it_already_set(monkeypatch):
+    calls = _count_set_mode(monkeypatch)
+    backend = SoftwareBackend()
+    surface = backend.open((640, 480), fullscreen=True)
+
+    assert backend.open((640, 480), fullscreen=True) is surface
+    backend.open((640, 480), fullscreen=False)
+    assert len(calls) == 2
+
+
+def test_startup_traces_its_phases_on_one_display_mode(monkeypatch):
+    # Wall-clock time to menu is tracked by `scripts/benchmark.py startup`, not asserted here.
+    calls = _count_set_mode(monkeypatch)
+    args = main.parse_args(["--no-asset-cache", "--pacing", "uncapped"])
+    reset_trace()
+
+    started = main.open_game_window(args, StartupScreen(min_duration_seconds=0.0))
+    assert started is not None
+    renderer, _clock, loader = started
+    renderer.draw_frame(renderer.menu_frame(0))
+    renderer.present()
+    trace_mark("first_menu_frame")
+
+    # The loading screen and the renderer share one display mode.
+    assert len(calls) == 1
+    assert renderer.menu_background is not None
+    timeline = startup_timeline()
+    phases = {phase["phase"] for phase in timeline["phases"]}
+    assert {"display", "loading_frame", "renderer", "fonts", "loading_screen"} <= phases
+    assert timeline["marks"]["first_frame"] <= timeline["marks"]["first_menu_frame"]
+
+    loader.close()
+    assert renderer.background is not None
+    assert renderer.game_over_background is not None
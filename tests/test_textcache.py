@@ -0,0 +1,19 @@
+import pygame
+
+from game.render.textcache import TextCache
+
+
+def test_text_cache_reuses_surfaces_and_evicts_least_recent():
+    font = pygame.font.Font(None, 20)
+    cache = TextCache(capacity=2)
+
+    hull = cache.render(font, "Hull 3/3", (235, 235, 235))
+    assert cache.render(font, "Hull 3/3", pygame.Color(235, 235, 235)) is hull
+    cache.render(font, "Hull 2/3", "white")
+    cache.render(font, "Hull 3/3", (235, 235, 235))  # refresh: "Hull 2/3" is now oldest
+    cache.render(font, "Quit", "white")
+
+    assert cache.render(font, "Hull 3/3", (235, 235, 235)) is hull
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (3, 3, 1, 2)
+    assert stats["hit_rate"] == 0.5
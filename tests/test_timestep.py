@@ -0,0 +1,45 @@
+import pytest
+
+from game.config.constants import SCREEN_WIDTH
+from game.core.circleshape import CircleShape
+from game.core.timestep import FixedTimestep, interpolated
+
+
+def test_advance_runs_whole_ticks_and_keeps_remainder():
+    timestep = FixedTimestep(tick_rate=30, max_steps=5)
+
+    assert timestep.advance(0.05) == 1
+    assert timestep.alpha == pytest.approx(0.5)
+    assert timestep.advance(0.05) == 2
+    assert timestep.alpha == pytest.approx(0.0, abs=1e-9)
+
+
+def test_advance_caps_steps_and_drops_backlog():
+    timestep = FixedTimestep(tick_rate=60, max_steps=4)
+
+    assert timestep.advance(2.0) == 4
+    assert timestep.accumulator < timestep.step_dt
+    assert timestep.dropped_seconds > 1.9
+    assert timestep.advance(0.0) == 0
+
+
+def test_interpolated_blends_then_restores_positions():
+    shape = CircleShape(100, 100, 10)
+    shape.store_previous_state()
+    shape.position.x = 110
+    simulated = shape.position
+
+    with interpolated([shape], 0.25):
+        assert shape.position.x == pytest.approx(102.5)
+
+    assert shape.position is simulated
+    assert shape.position.x == 110
+
+
+def test_interpolation_snaps_across_screen_wrap():
+    shape = CircleShape(SCREEN_WIDTH + 11, 100, 10)
+    shape.store_previous_state()
+    shape.wrap_around_screen()
+
+    with interpolated([shape], 0.5):
+        assert shape.position.x == -10